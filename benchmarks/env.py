@@ -0,0 +1,60 @@
+# Benchmark of the overhead of ensure_env decorated functions
+
+import timeit
+
+n = 10000
+
+setup = """
+import os
+import rasterio
+from rasterio.env import ensure_env, ensure_env_with_credentials
+from rasterio.session import AWSSession
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "id")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "key")
+
+@ensure_env
+def f():
+    pass
+
+@ensure_env_with_credentials
+def g(path):
+    pass
+"""
+
+t = timeit.timeit("f()", setup=setup, number=n)
+print("ensure_env, no Env:")
+print("%f usec\n" % (1000000*t/n))
+
+t = timeit.timeit("with rasterio.Env():\n    f()", setup=setup, number=n)
+print("Env entered and exited once per call:")
+print("%f usec\n" % (1000000*t/n))
+
+t = timeit.timeit("g('tests/data/RGB.byte.tif')", setup=setup, number=n)
+print("ensure_env_with_credentials, local path, no Env:")
+print("%f usec\n" % (1000000*t/n))
+
+t = timeit.timeit("g('s3://bucket/key.tif')", setup=setup, number=n)
+print("ensure_env_with_credentials, S3 path, no Env:")
+print("%f usec\n" % (1000000*t/n))
+
+t = timeit.timeit(
+    "g('s3://bucket/key.tif')",
+    setup=setup + "\nrasterio.Env().__enter__()", number=n)
+print("ensure_env_with_credentials, S3 path, Env with credentials:")
+print("%f usec\n" % (1000000*t/n))
+
+# Making a boto3 session is slow, so fewer are made.
+t = timeit.timeit("AWSSession()", setup=setup, number=n // 100)
+print("AWSSession made from the environment:")
+print("%f usec\n" % (1000000*t/(n // 100)))
+
+t = timeit.timeit("AWSSession.cached()", setup=setup, number=n)
+print("AWSSession.cached:")
+print("%f usec\n" % (1000000*t/n))
+
+t = timeit.timeit(
+    "with rasterio.Env(GDAL_HTTP_MAX_RETRY=3):\n    pass",
+    setup=setup + "\nrasterio.Env(CPL_DEBUG=False).__enter__()", number=n)
+print("Nested Env:")
+print("%f usec\n" % (1000000*t/n))
@@ -0,0 +1,48 @@
+# Benchmark of repeated opens of the same file
+
+import timeit
+
+n = 10000
+
+# Open and close only
+s = """
+with rasterio.open('tests/data/RGB.byte.tif') as src:
+    pass
+"""
+
+t = timeit.timeit(s, setup='import rasterio', number=n)
+print("Rasterio open:")
+print("%f usec\n" % (1000000*t/n))
+
+# Open and read a small window of one band
+s = """
+with rasterio.open('tests/data/RGB.byte.tif') as src:
+    arr = src.read(1, window=Window(0, 0, 256, 256))
+"""
+
+t = timeit.timeit(s, setup='import rasterio; from rasterio.windows import Window', number=n)
+print("Rasterio open + read(1):")
+print("%f usec\n" % (1000000*t/n))
+
+# Open and access the profile
+s = """
+with rasterio.open('tests/data/RGB.byte.tif') as src:
+    profile = src.profile
+"""
+
+t = timeit.timeit(s, setup='import rasterio', number=n)
+print("Rasterio open + profile:")
+print("%f usec\n" % (1000000*t/n))
+
+# Open and access the profile with the metadata cache
+s = """
+with rasterio.open('tests/data/RGB.byte.tif') as src:
+    profile = src.profile
+"""
+
+t = timeit.timeit(
+    s,
+    setup='import rasterio; import rasterio.cache; rasterio.cache.enable_metadata_cache()',
+    number=n)
+print("Rasterio open + profile, metadata cache:")
+print("%f usec\n" % (1000000*t/n))
@@ -35,7 +35,9 @@ with rasterio._loading.add_gdal_dll_directories():
     from rasterio.errors import RasterioIOError, DriverCapabilityError
     from rasterio.io import (
         DatasetReader, get_writer_for_path, get_writer_for_driver, MemoryFile)
+    from rasterio.lazy import LazyArray
     from rasterio.profiles import default_gtiff_profile
+    from rasterio.profiling import profiled, _argument
     from rasterio.transform import Affine, guard_transform
     from rasterio._path import _parse_path
 
@@ -54,7 +56,7 @@ with rasterio._loading.add_gdal_dll_directories():
             pass
         have_vsi_plugin = False
 
-__all__ = ['band', 'open', 'pad', 'Env', 'CRS']
+__all__ = ['band', 'open', 'pad', 'Env', 'CRS', 'LazyArray']
 __version__ = "1.3.0"
 __gdal_version__ = gdal_version()
 __proj_version__ = ".".join([str(version) for version in get_proj_version()])
@@ -78,6 +80,17 @@ def parse_path(path):
     return _parse_path(path)
 
 
+def _open_span_attributes(args, kwds, dataset):
+    """Profiling span attributes of an open call."""
+    fp = _argument(args, kwds, 0, "fp")
+    return {
+        "path": dataset.name if dataset is not None else str(fp),
+        "mode": _argument(args, kwds, 1, "mode", "r"),
+        "driver": getattr(dataset, "driver", None),
+    }
+
+
+@profiled("open", _open_span_attributes)
 @ensure_env_with_credentials
 def open(fp, mode='r', driver=None, width=None, height=None, count=None,
          crs=None, transform=None, dtype=None, nodata=None, sharing=False,
@@ -206,13 +219,16 @@ def open(fp, mode='r', driver=None, width=None, height=None, count=None,
 
     # If the fp argument is a file-like object and can be adapted by
     # rasterio's FilePath we do so. Otherwise, we use a MemoryFile to
-    # hold fp's contents and store that in an ExitStack attached to the
-    # dataset object that we will return. When a dataset's close method
-    # is called, this ExitStack will be unwound and the MemoryFile's
-    # storage will be cleaned up.
+    # hold fp's contents. Either is stored in an ExitStack attached to
+    # the dataset object that we will return. When a dataset's close
+    # method is called, this ExitStack will be unwound and the FilePath
+    # or MemoryFile will be cleaned up.
     if mode == 'r' and hasattr(fp, 'read'):
         if have_vsi_plugin:
-            return FilePath(fp).open(driver=driver, sharing=sharing, **kwargs)
+            filepath = FilePath(fp)
+            dataset = filepath.open(driver=driver, sharing=sharing, **kwargs)
+            dataset._env.enter_context(filepath)
+            return dataset
         else:
             memfile = MemoryFile(fp.read())
             dataset = memfile.open(driver=driver, sharing=sharing, **kwargs)
@@ -220,6 +236,28 @@ def open(fp, mode='r', driver=None, width=None, height=None, count=None,
             return dataset
 
     elif mode in ('w', 'w+') and hasattr(fp, 'write'):
+        # An empty, readable, and seekable file-like object is written
+        # to directly. Format drivers may read back what they have
+        # written and so other objects get a MemoryFile.
+        if have_vsi_plugin and _is_seekable_readable(fp):
+            filepath = FilePath(fp)
+            if len(filepath) == 0:
+                dataset = filepath.open(
+                    driver=driver,
+                    width=width,
+                    height=height,
+                    count=count,
+                    crs=crs,
+                    transform=transform,
+                    dtype=dtype,
+                    nodata=nodata,
+                    sharing=sharing,
+                    **kwargs
+                )
+                dataset._env.enter_context(filepath)
+                return dataset
+            filepath.close()
+
         memfile = MemoryFile()
         dataset = memfile.open(
             driver=driver,
@@ -250,8 +288,6 @@ def open(fp, mode='r', driver=None, width=None, height=None, count=None,
         if mode.startswith("r"):
             dataset = fp.open(driver=driver, sharing=sharing, **kwargs)
 
-        # Note: FilePath does not support writing and an exception will
-        # result from this.
         elif mode.startswith("w"):
             dataset = fp.open(
                 driver=driver,
@@ -309,6 +345,14 @@ def open(fp, mode='r', driver=None, width=None, height=None, count=None,
         return dataset
 
 
+def _is_seekable_readable(fp):
+    """True if a file-like object can be read from and seeked."""
+    try:
+        return fp.readable() and fp.seekable()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
 Band = namedtuple('Band', ['ds', 'bidx', 'dtype', 'shape'])
 
 
@@ -27,10 +27,40 @@ cdef class DatasetBase:
     cdef public object _gcps
     cdef public object _rpcs
     cdef public object _env
+    cdef public object _io_stats
+    cdef public object _io_stats_total
+    cdef public object _metadata
     cdef GDALDatasetH handle(self) except NULL
     cdef GDALRasterBandH band(self, int bidx) except NULL
 
 
+ctypedef struct ProgressState:
+    int *cancelled
+    bint stopped
+    bint has_callback
+    double step
+    double reported
+    void *reporter
+
+
+cdef class CancellationToken:
+
+    cdef int _cancelled
+
+
+cdef class ProgressReporter:
+
+    cdef ProgressState state
+    cdef object callback
+    cdef object token
+    cdef object error
+    cdef double pixels
+    cdef double start
+    cdef void *arg(self)
+
+
+cdef int progress_func(double dfComplete, const char *pszMessage, void *pProgressArg) nogil
+
 cdef const char *get_driver_name(GDALDriverH driver)
 
 cdef void osr_set_traditional_axis_mapping_strategy(OGRSpatialReferenceH hSrs)
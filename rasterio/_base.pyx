@@ -3,15 +3,18 @@
 """Numpy-free base classes."""
 
 from collections import defaultdict
-from contextlib import ExitStack
+from contextlib import contextmanager, ExitStack
 import logging
 import math
 import os
+from time import perf_counter
 import warnings
 
 from libc.string cimport strncmp
 from rasterio.crs cimport CRS
 
+import attr
+
 from rasterio._err import (
     GDALError, CPLE_BaseError, CPLE_IllegalArgError, CPLE_OpenFailedError,
     CPLE_NotSupportedError)
@@ -19,6 +22,8 @@ from rasterio._err cimport exc_wrap_pointer, exc_wrap_int, exc_wrap
 
 from rasterio.control import GroundControlPoint
 from rasterio.rpc import RPC
+from rasterio import cache
+from rasterio.cache import DatasetMetadata
 from rasterio import dtypes
 from rasterio.coords import BoundingBox
 from rasterio.crs import CRS
@@ -27,7 +32,7 @@ from rasterio.enums import (
 from rasterio.errors import (
     DatasetAttributeError,
     RasterioIOError, CRSError, DriverRegistrationError, NotGeoreferencedWarning,
-    RasterBlockError, BandOverviewError)
+    RasterBlockError, BandOverviewError, OperationCancelledError)
 from rasterio.profiles import Profile
 from rasterio.transform import Affine, guard_transform, tastes_like_gdal
 from rasterio._path import _parse_path
@@ -39,6 +44,120 @@ include "gdal.pxi"
 
 log = logging.getLogger(__name__)
 
+# Datasets with these prefixes have no stable size and modification
+# time and are not eligible for the metadata cache.
+_UNCACHEABLE_PREFIXES = ("/vsimem/", "/vsipythonfilelike/", "/vsistdin")
+
+
+cdef class CancellationToken:
+    """Requests the cancellation of long running operations.
+
+    A token may be passed to operations such as reproject, copy,
+    build_overviews, and fillnodata, and cancelled from any thread.
+    The operations stop at their next progress report and raise
+    OperationCancelledError.
+    """
+
+    def __cinit__(self):
+        self._cancelled = 0
+
+    def cancel(self):
+        """Request cancellation."""
+        self._cancelled = 1
+
+    @property
+    def cancelled(self):
+        """Whether cancellation has been requested."""
+        return bool(self._cancelled)
+
+    def __repr__(self):
+        return "<CancellationToken cancelled={}>".format(self.cancelled)
+
+
+cdef class ProgressReporter:
+    """Reports the progress of a GDAL operation to a Python callback.
+
+    GDAL calls progress_func() with the reporter's arg() often and
+    without the GIL. The GIL is only taken when the operation has
+    advanced by at least step since the last report, or is complete.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Called with the completed fraction of the operation and its
+        throughput in pixels per second.
+    cancel : CancellationToken, optional
+        Stops the operation when cancelled.
+    pixels : int, optional
+        The number of pixels processed by the whole operation.
+    step : float, optional
+        The smallest advance that is reported.
+    """
+
+    def __cinit__(self):
+        self.state.cancelled = NULL
+        self.state.stopped = False
+        self.state.has_callback = False
+        self.state.step = 0.0
+        self.state.reported = 0.0
+        self.state.reporter = NULL
+
+    def __init__(self, callback=None, cancel=None, pixels=0, step=0.01):
+        self.callback = callback
+        self.token = cancel
+        self.error = None
+        self.pixels = pixels
+        self.start = perf_counter()
+        self.state.has_callback = callback is not None
+        self.state.step = step
+        self.state.reporter = <void *>self
+        if cancel is not None:
+            self.state.cancelled = &(<CancellationToken?>cancel)._cancelled
+
+    cdef void *arg(self):
+        return <void *>&self.state
+
+    def _report(self, fraction):
+        elapsed = perf_counter() - self.start
+        rate = self.pixels * fraction / elapsed if elapsed > 0 else 0.0
+        self.callback(fraction, rate)
+
+    def raise_if_stopped(self):
+        """Raise the callback's exception or OperationCancelledError
+        if the operation was stopped."""
+        if self.error is not None:
+            raise self.error
+        if self.state.stopped:
+            raise OperationCancelledError("Operation cancelled")
+
+
+cdef int _report_progress(ProgressState *state, double dfComplete) with gil:
+    cdef ProgressReporter reporter = <ProgressReporter>state.reporter
+    try:
+        reporter._report(dfComplete)
+        return 1
+    except Exception as exc:
+        reporter.error = exc
+        return 0
+
+
+cdef int progress_func(double dfComplete, const char *pszMessage, void *pProgressArg) nogil:
+    """A GDALProgressFunc for ProgressReporter arguments."""
+    cdef ProgressState *state = <ProgressState *>pProgressArg
+
+    if state.stopped:
+        return 0
+    if state.cancelled != NULL and state.cancelled[0]:
+        state.stopped = True
+        return 0
+    if state.has_callback and (
+            dfComplete >= 1.0 or dfComplete - state.reported >= state.step):
+        state.reported = dfComplete
+        if not _report_progress(state, dfComplete):
+            state.stopped = True
+            return 0
+    return 1
+
 
 cdef const char *get_driver_name(GDALDriverH driver):
     """Return Python name of the driver"""
@@ -216,6 +335,115 @@ cdef GDALDatasetH open_dataset(
             CSLDestroy(options)
 
 
+def _metadata_cache_key(filename, drivers, options):
+    """Key of a dataset in the metadata cache
+
+    The key combines the path, size, modification time (in nanoseconds
+    for local files) and, for network filesystems, the ETag of the dataset's file with the allowed drivers
+    and the open options.
+
+    Returns
+    -------
+    tuple or None
+        None if the dataset can't be cached.
+
+    """
+    cdef VSIStatBufL st_buf
+    cdef char **metadata = NULL
+    cdef const char *etag_c = NULL
+
+    if filename.startswith(_UNCACHEABLE_PREFIXES):
+        return None
+
+    filename_b = filename.encode('utf-8')
+    if VSIStatL(<const char *>filename_b, &st_buf) != 0:
+        return None
+
+    etag = None
+    if filename.startswith("/vsi"):
+        metadata = VSIGetFileMetadata(<const char *>filename_b, "HEADERS", NULL)
+        if metadata != NULL:
+            etag_c = CSLFetchNameValue(metadata, "ETag")
+            if etag_c != NULL:
+                etag = etag_c
+            CSLDestroy(metadata)
+
+    mtime = st_buf.st_mtime
+    if not filename.startswith("/vsi"):
+        # Local files are modified more often than once per second.
+        try:
+            mtime = os.stat(filename).st_mtime_ns
+        except OSError:
+            pass
+
+    return (
+        filename,
+        st_buf.st_size,
+        mtime,
+        etag,
+        tuple(drivers) if drivers else None,
+        tuple(sorted((str(k).upper(), str(v)) for k, v in options.items())),
+    )
+
+
+@attr.s(slots=True)
+class IOStats:
+    """Counts and timings of a dataset's I/O.
+
+    Attributes
+    ----------
+    band_calls, multi_band_calls, mask_calls : int
+        Numbers of single band, multiple band, and mask band reads
+        and writes. Single band calls are the writes of overviews by
+        update_overviews().
+    pixels : int
+        Number of pixels transferred, summed over bands.
+    bytes : int
+        Number of bytes transferred to or from arrays.
+    gdal_time : float
+        Seconds spent in GDAL's RasterIO functions, which run with
+        the GIL released.
+    vsi_bytes_read, vsi_requests : int
+        Bytes read and requests made by the virtual filesystem. These
+        are counted for datasets backed by a FilePath and for network
+        filesystems when GDAL's CPL_VSIL_NETWORK_STATS_ENABLED config
+        option is on. Otherwise they are zero.
+    cache_used_delta : int
+        Change in the size of GDAL's block cache, in bytes. Growth
+        indicates blocks that were read or decompressed because they
+        were not already cached.
+
+    """
+    band_calls = attr.ib(default=0)
+    multi_band_calls = attr.ib(default=0)
+    mask_calls = attr.ib(default=0)
+    pixels = attr.ib(default=0)
+    bytes = attr.ib(default=0)
+    gdal_time = attr.ib(default=0.0)
+    vsi_bytes_read = attr.ib(default=0)
+    vsi_requests = attr.ib(default=0)
+    cache_used_delta = attr.ib(default=0)
+
+    def reset(self):
+        """Set all counts and timings to zero."""
+        for field in attr.fields(IOStats):
+            setattr(self, field.name, field.default)
+
+    def _add(self, kind, pixels, nbytes, gdal_time, vsi_bytes_read, vsi_requests, cache_used_delta):
+        if kind == "band":
+            self.band_calls += 1
+        elif kind == "mask":
+            self.mask_calls += 1
+        else:
+            self.multi_band_calls += 1
+        self.pixels += pixels
+        self.bytes += nbytes
+        self.gdal_time += gdal_time
+        self.vsi_bytes_read += vsi_bytes_read
+        self.vsi_requests += vsi_requests
+        self.cache_used_delta += cache_used_delta
+
+
 cdef class DatasetBase:
     """Dataset base class
 
@@ -316,11 +544,27 @@ cdef class DatasetBase:
         self._descriptions = ()
         self._scales = ()
         self._offsets = ()
+        self._crs_wkt = None
         self._gcps = None
         self._rpcs = None
         self._read = False
+        self._metadata = None
+
+        metadata_cache = cache._metadata_cache
+        metadata_key = None
+        if metadata_cache is not None and path is not None:
+            metadata_key = _metadata_cache_key(filename, driver, kwargs)
+            if metadata_key is not None:
+                self._metadata = metadata_cache.get(metadata_key)
+
+        if self._metadata is not None:
+            self._set_attrs_from_metadata(self._metadata)
+        else:
+            self._set_attrs_from_dataset_handle()
+            if metadata_key is not None:
+                self._metadata = self._read_metadata()
+                metadata_cache.put(metadata_key, self._metadata)
 
-        self._set_attrs_from_dataset_handle()
         self._env = ExitStack()
         self._closed = False
 
@@ -330,6 +574,63 @@ cdef class DatasetBase:
             self.name,
             self.mode)
 
+    def io_stats(self):
+        """I/O statistics of the dataset
+
+        Reads and writes are counted only while statistics are being
+        collected. See `collect_io_stats()`.
+
+        Returns
+        -------
+        IOStats
+            A copy of the totals of all collected statistics.
+        """
+        if self._io_stats_total is None:
+            return IOStats()
+        return attr.evolve(self._io_stats_total)
+
+    @contextmanager
+    def collect_io_stats(self, reset=False):
+        """Collect I/O statistics within a context
+
+        Outside of this context the dataset's reads and writes are not
+        counted and cost nothing extra. Contexts may be nested.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            If True, the dataset's totals are reset to zero.
+
+        Yields
+        ------
+        IOStats
+            Statistics of the reads and writes made within the context.
+            The dataset's totals are updated as well.
+
+        Examples
+        --------
+        >>> with src.collect_io_stats() as stats:
+        ...     data = src.read(1)
+        ...
+        >>> stats.multi_band_calls
+        1
+        """
+        if self._io_stats_total is None:
+            self._io_stats_total = IOStats()
+        elif reset:
+            self._io_stats_total.reset()
+
+        stats = IOStats()
+        if self._io_stats is None:
+            self._io_stats = [self._io_stats_total]
+        self._io_stats.append(stats)
+        try:
+            yield stats
+        finally:
+            self._io_stats = [item for item in self._io_stats if item is not stats]
+            if len(self._io_stats) == 1:
+                self._io_stats = None
+
     def _set_attrs_from_dataset_handle(self):
         cdef GDALDriverH driver = NULL
         driver = GDALGetDatasetDriver(self._hds)
@@ -338,14 +639,61 @@ cdef class DatasetBase:
         self.width = GDALGetRasterXSize(self._hds)
         self.height = GDALGetRasterYSize(self._hds)
         self.shape = (self.height, self.width)
-        self._transform = self.read_transform()
-        self._crs = self.read_crs()
 
-        # touch self.meta, triggering data type evaluation.
-        _ = self.meta
+        # Reading the transform is cheap and warns about datasets that
+        # are not georeferenced. The CRS, data types, and nodata values
+        # are read on first access.
+        self._transform = self.read_transform()
 
         log.debug("Dataset %r is started.", self)
 
+    def _set_attrs_from_metadata(self, metadata):
+        """Set attributes from cached metadata instead of GDAL"""
+        self.driver = metadata.driver
+        self._count = metadata.count
+        self.width = metadata.width
+        self.height = metadata.height
+        self.shape = (self.height, self.width)
+        self._transform = list(metadata.transform)
+        self._crs = metadata.crs
+        self._dtypes = list(metadata.dtypes)
+        self._nodatavals = list(metadata.nodatavals)
+        self._block_shapes = list(metadata.block_shapes)
+        self._descriptions = metadata.descriptions
+        self._units = metadata.units
+        self._scales = metadata.scales
+        self._offsets = metadata.offsets
+        self._read = True
+
+        log.debug("Dataset %r is started from cached metadata.", self)
+
+    def _read_metadata(self):
+        """Read the header metadata to be cached"""
+        tags = {
+            (0, None): self.tags(),
+            (0, 'IMAGE_STRUCTURE'): self.tags(ns='IMAGE_STRUCTURE'),
+        }
+        for bidx in self.indexes:
+            tags[(bidx, None)] = self.tags(bidx)
+
+        return DatasetMetadata(
+            driver=self.driver,
+            count=self.count,
+            width=self.width,
+            height=self.height,
+            transform=tuple(self.get_transform()),
+            crs=self.crs,
+            dtypes=self.dtypes,
+            nodatavals=self.nodatavals,
+            block_shapes=tuple(self.block_shapes),
+            descriptions=self.descriptions,
+            units=self.units,
+            scales=self.scales,
+            offsets=self.offsets,
+            overviews=tuple(tuple(self.overviews(bidx)) for bidx in self.indexes),
+            tags=tags,
+        )
+
     cdef GDALDatasetH handle(self) except NULL:
         """Return the object's GDAL dataset handle"""
         if self._hds == NULL:
@@ -418,9 +766,23 @@ cdef class DatasetBase:
         """Start the dataset's life cycle"""
         pass
 
+    def _retain_attrs(self):
+        """Read attributes that must remain available after closing
+
+        The CRS is kept as WKT and parsed on first access.
+        """
+        cdef const char *wkt = NULL
+
+        if not self._read and self._crs is None and self._crs_wkt is None:
+            wkt = GDALGetProjectionRef(self._hds)
+            self._crs_wkt = wkt if wkt != NULL else ""
+        _ = self.dtypes
+        _ = self.get_nodatavals()
+
     def stop(self):
         """Close the GDAL dataset handle"""
         if self._hds != NULL:
+            self._retain_attrs()
             refcount = GDALDereferenceDataset(self._hds)
             if refcount == 0:
                 GDALClose(self._hds)
@@ -1044,7 +1406,11 @@ cdef class DatasetBase:
         # _read tells us that the CRS was read before and really is
         # None.
         if not self._read and self._crs is None:
-            self._crs = self.read_crs()
+            if self._hds == NULL and self._crs_wkt is not None:
+                self._crs = self._handle_crswkt(self._crs_wkt)
+            else:
+                self._crs = self.read_crs()
+            self._read = self._crs is None
         return self._crs
 
     def get_transform(self):
@@ -1119,6 +1485,11 @@ cdef class DatasetBase:
         cdef char *key = NULL
         cdef const char *val = NULL
 
+        if self._metadata is not None and self._hds != NULL:
+            tags = self._metadata.tags.get((bidx, ns))
+            if tags is not None:
+                return dict(tags)
+
         if bidx > 0:
             obj = self.band(bidx)
         else:
@@ -1313,6 +1684,10 @@ cdef class DatasetBase:
         cdef GDALRasterBandH ovrband = NULL
         cdef GDALRasterBandH band = NULL
 
+        if self._metadata is not None and self._hds != NULL:
+            if 0 < bidx <= len(self._metadata.overviews):
+                return list(self._metadata.overviews[bidx - 1])
+
         band = self.band(bidx)
         num_overviews = GDALGetOverviewCount(band)
         factors = []
@@ -203,6 +203,13 @@ cdef class ConfigEnv:
             set_gdal_config(key, val)
             self.options[key] = val
 
+    def del_config_options(self, *keys):
+        """Delete GDAL config options."""
+        for key in keys:
+            if key in self.options:
+                del self.options[key]
+                del_gdal_config(key)
+
     def clear_config_options(self):
         """Clear GDAL config options."""
         while self.options:
@@ -343,81 +350,117 @@ class PROJDataFinder:
         return datadir if os.path.exists(datadir) else None
 
 
-cdef class GDALEnv(ConfigEnv):
-    """Configuration and driver management"""
+# Drivers are registered once per process, not once per environment,
+# and data files are searched for again only if the variables which
+# locate them change. Environments are made by every call of a function
+# decorated by ensure_env outside of an Env, so this must be cheap.
+_start_lock = threading.Lock()
+_drivers_registered = False
+_data_key = None
+_gdal_data_path = None
 
-    def __init__(self, **options):
-        super().__init__(**options)
-        self._have_registered_drivers = False
 
-    def start(self):
-        CPLPushErrorHandler(<CPLErrorHandler>logging_error_handler)
+def _find_data():
+    """Find GDAL and PROJ data files and set PROJ's search path.
 
-        # The outer if statement prevents each thread from acquiring a
-        # lock when the environment starts, and the inner avoids a
-        # potential race condition.
-        if not self._have_registered_drivers:
+    Returns
+    -------
+    str or None
+        The GDAL_DATA config option, if one is needed.
+
+    """
+    gdal_data_path = None
+
+    if 'GDAL_DATA' in os.environ:
+        log.debug("GDAL_DATA found in environment.")
+        gdal_data_path = os.environ['GDAL_DATA']
+
+    else:
+        path = GDALDataFinder().search_wheel()
+
+        if path:
+            log.debug("GDAL data found in package: path=%r.", path)
+            gdal_data_path = path
+
+        # See https://github.com/rasterio/rasterio/issues/1631.
+        elif GDALDataFinder().find_file("header.dxf"):
+            log.debug("GDAL data files are available at built-in paths.")
 
-            with threading.Lock():
+        else:
+            path = GDALDataFinder().search()
+
+            if path:
+                log.debug("GDAL data found in other locations: path=%r.", path)
+                gdal_data_path = path
+
+    if 'PROJ_LIB' in os.environ:
+        log.debug("PROJ_LIB found in environment.")
+        path = os.environ["PROJ_LIB"]
+        set_proj_data_search_path(path)
+
+    else:
+        path = PROJDataFinder().search_wheel()
+
+        if path:
+            log.debug("PROJ data found in package: path=%r.", path)
+            set_proj_data_search_path(path)
+
+        elif PROJDataFinder().has_data():
+            log.debug("PROJ data files are available at built-in paths.")
+
+        else:
+            path = PROJDataFinder().search()
 
-                if not self._have_registered_drivers:
-                    GDALAllRegister()
-                    OGRRegisterAll()
-                    install_filepath_plugin(filepath_plugin)
+            if path:
+                log.debug("PROJ data found in other locations: path=%r.", path)
+                set_proj_data_search_path(path)
 
-                    if 'GDAL_DATA' in os.environ:
-                        log.debug("GDAL_DATA found in environment.")
-                        self.update_config_options(GDAL_DATA=os.environ['GDAL_DATA'])
+    return gdal_data_path
 
-                    else:
-                        path = GDALDataFinder().search_wheel()
 
-                        if path:
-                            log.debug("GDAL data found in package: path=%r.", path)
-                            self.update_config_options(GDAL_DATA=path)
+cdef class GDALEnv(ConfigEnv):
+    """Configuration and driver management"""
 
-                        # See https://github.com/rasterio/rasterio/issues/1631.
-                        elif GDALDataFinder().find_file("header.dxf"):
-                            log.debug("GDAL data files are available at built-in paths.")
+    def __init__(self, **options):
+        super().__init__(**options)
+        self._have_registered_drivers = False
 
-                        else:
-                            path = GDALDataFinder().search()
+    def start(self):
+        global _drivers_registered, _data_key, _gdal_data_path
+
+        CPLPushErrorHandler(<CPLErrorHandler>logging_error_handler)
 
-                            if path:
-                                log.debug("GDAL data found in other locations: path=%r.", path)
-                                self.update_config_options(GDAL_DATA=path)
+        if not self._have_registered_drivers:
+            data_key = (
+                os.environ.get('GDAL_DATA'), os.environ.get('PROJ_LIB'),
+                sys.prefix, __file__)
 
-                    if 'PROJ_LIB' in os.environ:
-                        log.debug("PROJ_LIB found in environment.")
-                        path = os.environ["PROJ_LIB"]
-                        set_proj_data_search_path(path)
+            # The outer if statement prevents each environment from
+            # acquiring the lock when it starts, and the inner ones
+            # avoid a potential race condition.
+            if not _drivers_registered or data_key != _data_key:
 
-                    else:
-                        path = PROJDataFinder().search_wheel()
+                with _start_lock:
 
-                        if path:
-                            log.debug("PROJ data found in package: path=%r.", path)
-                            set_proj_data_search_path(path)
+                    if not _drivers_registered:
+                        GDALAllRegister()
+                        OGRRegisterAll()
+                        install_filepath_plugin(filepath_plugin)
 
-                        elif PROJDataFinder().has_data():
-                            log.debug("PROJ data files are available at built-in paths.")
+                        if driver_count() == 0:
+                            CPLPopErrorHandler()
+                            raise ValueError("Drivers not registered.")
 
-                        else:
-                            path = PROJDataFinder().search()
+                        _drivers_registered = True
 
-                            if path:
-                                log.debug("PROJ data found in other locations: path=%r.", path)
-                                set_proj_data_search_path(path)
+                    if data_key != _data_key:
+                        _gdal_data_path = _find_data()
+                        _data_key = data_key
 
-                    if driver_count() == 0:
-                        CPLPopErrorHandler()
-                        raise ValueError("Drivers not registered.")
+            if _gdal_data_path is not None:
+                self.update_config_options(GDAL_DATA=_gdal_data_path)
 
-                    # Flag the drivers as registered, otherwise every thread
-                    # will acquire a threadlock every time a new environment
-                    # is started rather than just whenever the first thread
-                    # actually makes it this far.
-                    self._have_registered_drivers = True
+            self._have_registered_drivers = True
 
         log.debug("Started GDALEnv: self=%r.", self)
 
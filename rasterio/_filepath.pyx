@@ -26,24 +26,54 @@ Filesystem Handling
 This plugin currently only defines the "open" callback. The other features are
 either not needed or have usable default implementations.
 
-The entire filesystem's state is stored in a global dictionary mapping
-in-memory GDAL filenames to :class:`~rasterio._filepath.FilePathBase` objects.
+Files are opened for reading or, if the file-like object has a ``write``
+method, for writing. Writes go directly to the file-like object without
+buffering the whole file. Objects which can not seek accept only sequential
+writes, which is enough for drivers and creation options that stream their
+output.
+
+The entire filesystem's state is stored in a global weak-valued dictionary
+mapping in-memory GDAL filenames to :class:`~rasterio._filepath.FilePathBase`
+objects. A file disappears when its FilePath is closed or garbage collected,
+but not while GDAL has a handle open on it.
 
 File Handling
 *************
 
-This plugin implements the bare minimum for reading from an open file-like
-object. It does this by mapping GDAL's function calls (ex. read, seek) to
-the corresponding method call on the file-like object.
+This plugin implements the bare minimum for reading from and writing to an
+open file-like object. It does this by mapping GDAL's function calls (ex.
+read, write, seek) to the corresponding method call on the file-like object.
+
+Each handle opened by GDAL keeps its own file position. Reads are
+positional (like ``pread``) and do not depend on the seek state of the
+wrapped file-like object, which may be shared with other handles or with
+the caller. When the file-like object is a plain OS-level file, data is
+read with :func:`os.preadv`. Otherwise the file-like object's ``readinto``
+method is used, if it has one. In both cases data is written directly into
+GDAL's buffer without an intermediate ``bytes`` object. The ``read`` method
+is the last resort.
+
+GDAL's multi-range reads are supported. Nearby ranges are coalesced into
+a single read of the file-like object. Optionally, a file wrapper keeps a
+cache of fixed-size, aligned blocks of the file. Small reads, such as those
+of TIFF headers and tile offsets, are then served from a few large reads of
+whole blocks. This can greatly reduce the number of requests made to remote
+object stores.
 
 """
 
 include "gdal.pxi"
 
+from collections import OrderedDict
+import io
 import logging
+import os
+import threading
 from uuid import uuid4
+import weakref
 
-from libc.string cimport memcpy
+from cpython.buffer cimport PyBUF_READ, PyBUF_WRITE
+from cpython.memoryview cimport PyMemoryView_FromMemory
 
 log = logging.getLogger(__name__)
 
@@ -68,7 +98,17 @@ cdef bytes FILESYSTEM_PREFIX_BYTES = FILESYSTEM_PREFIX.encode("ascii")
 # the plugin to determine what "files" exist on "disk".
 # Currently the only way to "create" a file in the filesystem is to add
 # an entry to this dictionary. GDAL will then Open the path later.
-cdef _FILESYSTEM_INFO = {}
+# Entries are weak so that a FilePath which is never closed does not
+# keep its file-like object alive.
+cdef _FILESYSTEM_INFO = weakref.WeakValueDictionary()
+
+# Handles opened by GDAL and not yet closed. Each holds a reference to
+# its file wrapper, which stays in the filesystem until they are closed.
+cdef set _OPEN_HANDLES = set()
+
+# Ranges of a multi-range read that are separated by no more than this
+# many bytes are coalesced into a single read of the file-like object.
+cdef Py_ssize_t MULTI_RANGE_MERGE_GAP = 65536
 
 
 cdef int install_filepath_plugin(VSIFilesystemPluginCallbacksStruct *callbacks_struct):
@@ -78,6 +118,11 @@ cdef int install_filepath_plugin(VSIFilesystemPluginCallbacksStruct *callbacks_s
     callbacks_struct.tell = <VSIFilesystemPluginTellCallback>filepath_tell
     callbacks_struct.seek = <VSIFilesystemPluginSeekCallback>filepath_seek
     callbacks_struct.read = <VSIFilesystemPluginReadCallback>filepath_read
+    callbacks_struct.read_multi_range = <VSIFilesystemPluginReadMultiRangeCallback>filepath_read_multi_range
+    callbacks_struct.eof = <VSIFilesystemPluginEofCallback>filepath_eof
+    callbacks_struct.write = <VSIFilesystemPluginWriteCallback>filepath_write
+    callbacks_struct.flush = <VSIFilesystemPluginFlushCallback>filepath_flush
+    callbacks_struct.truncate = <VSIFilesystemPluginTruncateCallback>filepath_truncate
     callbacks_struct.close = <VSIFilesystemPluginCloseCallback>filepath_close
     callbacks_struct.pUserData = <void*>_FILESYSTEM_INFO
 
@@ -95,6 +140,17 @@ cdef void uninstall_filepath_plugin(VSIFilesystemPluginCallbacksStruct *callback
     callbacks_struct = NULL
 
 
+cdef class _FilePathHandle:
+    """A file handle opened by GDAL, with its own file position."""
+
+    cdef object file_wrapper
+    cdef vsi_l_offset pos
+
+    def __init__(self, file_wrapper):
+        self.file_wrapper = file_wrapper
+        self.pos = 0
+
+
 ## Filesystem Functions
 
 cdef void* filepath_open(void *pUserData, const char *pszFilename, const char *pszAccess) with gil:
@@ -104,15 +160,13 @@ cdef void* filepath_open(void *pUserData, const char *pszFilename, const char *p
     
     """
     cdef object file_wrapper
-
-    if pszAccess != b"r" and pszAccess != b"rb":
-        log.error("FilePath is currently a read-only interface.")
-        return NULL
+    cdef _FilePathHandle handle
+    cdef str access = pszAccess.decode("ascii")
 
     if pUserData is NULL:
         log.error("FilePath filesystem accessed with uninitialized filesystem info.")
         return NULL
-    cdef dict filesystem_info = <object>pUserData
+    cdef object filesystem_info = <object>pUserData
 
     try:
         file_wrapper = filesystem_info[pszFilename]
@@ -123,59 +177,192 @@ cdef void* filepath_open(void *pUserData, const char *pszFilename, const char *p
     if not hasattr(file_wrapper, "_file_obj"):
         log.error("Unexpected file object found in FilePath filesystem.")
         return NULL
-    return <void *>file_wrapper
+
+    # The handle is kept alive until GDAL closes it.
+    handle = _FilePathHandle(file_wrapper)
+
+    if access.strip("b") != "r":
+        if not hasattr(file_wrapper._file_obj, "write"):
+            log.error("File-like object is not writable: %s", pszFilename)
+            return NULL
+        try:
+            if access.startswith("w"):
+                file_wrapper._truncate(0)
+            elif access.startswith("a"):
+                handle.pos = len(file_wrapper)
+        except Exception:
+            log.exception("Failed to open file-like object for writing: %s", pszFilename)
+            return NULL
+    _OPEN_HANDLES.add(handle)
+    return <void *>handle
 
 ## File functions
 
 cdef vsi_l_offset filepath_tell(void *pFile) with gil:
-    cdef object file_wrapper = <object>pFile
-    cdef object file_obj = file_wrapper._file_obj
-    cdef int pos = file_obj.tell()
-    return <vsi_l_offset>pos
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    return handle.pos
 
 
 cdef int filepath_seek(void *pFile, vsi_l_offset nOffset, int nWhence) except -1 with gil:
-    cdef object file_wrapper = <object>pFile
-    cdef object file_obj = file_wrapper._file_obj
-    # TODO: Add "seekable" check?
-    file_obj.seek(nOffset, nWhence)
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    if nWhence == os.SEEK_SET:
+        handle.pos = nOffset
+    elif nWhence == os.SEEK_CUR:
+        handle.pos += nOffset
+    elif nWhence == os.SEEK_END:
+        handle.pos = len(handle.file_wrapper) + nOffset
+    else:
+        return -1
     return 0
 
 
 cdef size_t filepath_read(void *pFile, void *pBuffer, size_t nSize, size_t nCount) with gil:
-    cdef object file_wrapper = <object>pFile
-    cdef object file_obj = file_wrapper._file_obj
-    cdef bytes python_data = file_obj.read(nSize * nCount)
-    cdef int num_bytes = len(python_data)
-    # NOTE: We have to cast to char* first, otherwise Cython doesn't do the conversion properly
-    memcpy(pBuffer, <void*><char*>python_data, num_bytes)
-    return <size_t>(num_bytes / nSize)
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    cdef size_t num_bytes = 0
+
+    if nSize == 0 or nCount == 0:
+        return 0
+
+    # A writable view over GDAL's buffer. It must not outlive this call.
+    buffer_view = PyMemoryView_FromMemory(<char *>pBuffer, nSize * nCount, PyBUF_WRITE)
+    try:
+        num_bytes = handle.file_wrapper._read(buffer_view, handle.pos)
+    except Exception:
+        log.exception("Failed to read from file-like object.")
+        return 0
+    finally:
+        buffer_view.release()
+
+    handle.pos += num_bytes
+    return num_bytes // nSize
+
+
+cdef int filepath_read_multi_range(void *pFile, int nRanges, void **ppData, const vsi_l_offset *panOffsets, const size_t *panSizes) with gil:
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    cdef int i
+
+    buffer_views = [
+        PyMemoryView_FromMemory(<char *>ppData[i], panSizes[i], PyBUF_WRITE)
+        for i in range(nRanges)
+    ]
+    offsets = [panOffsets[i] for i in range(nRanges)]
+    try:
+        if not handle.file_wrapper._read_multi_range(buffer_views, offsets):
+            return -1
+    except Exception:
+        log.exception("Failed to read ranges from file-like object.")
+        return -1
+    finally:
+        for buffer_view in buffer_views:
+            buffer_view.release()
+    return 0
+
+
+cdef int filepath_eof(void *pFile) with gil:
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    try:
+        return 1 if handle.pos >= len(handle.file_wrapper) else 0
+    except Exception:
+        return 0
+
+
+cdef size_t filepath_write(void *pFile, const void *pBuffer, size_t nSize, size_t nCount) with gil:
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    cdef size_t num_bytes = 0
+
+    if nSize == 0 or nCount == 0:
+        return 0
+
+    # A read-only view over GDAL's buffer. It must not outlive this call.
+    buffer_view = PyMemoryView_FromMemory(<char *>pBuffer, nSize * nCount, PyBUF_READ)
+    try:
+        num_bytes = handle.file_wrapper._pwrite(buffer_view, handle.pos)
+    except Exception:
+        log.exception("Failed to write to file-like object.")
+        return 0
+    finally:
+        buffer_view.release()
+
+    handle.pos += num_bytes
+    return num_bytes // nSize
+
+
+cdef int filepath_flush(void *pFile) with gil:
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    try:
+        handle.file_wrapper._flush()
+    except Exception:
+        log.exception("Failed to flush file-like object.")
+        return -1
+    return 0
+
+
+cdef int filepath_truncate(void *pFile, vsi_l_offset nNewSize) with gil:
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    try:
+        handle.file_wrapper._truncate(nNewSize)
+    except Exception:
+        log.exception("Failed to truncate file-like object.")
+        return -1
+    return 0
 
 
 cdef int filepath_close(void *pFile) except -1 with gil:
     # Optional
-    cdef object file_wrapper = <object>pFile
-    del _FILESYSTEM_INFO[file_wrapper._filepath_path]
+    cdef _FilePathHandle handle = <_FilePathHandle>pFile
+    _OPEN_HANDLES.discard(handle)
     return 0
 
 
+def _io_counters(path):
+    """Bytes read and read requests made for a file in the filesystem.
+
+    Parameters
+    ----------
+    path : str
+        A /vsipythonfilelike/ path.
+
+    Returns
+    -------
+    tuple of int or None
+        None if there is no such file.
+
+    """
+    file_wrapper = _FILESYSTEM_INFO.get(path[len(FILESYSTEM_PREFIX):].encode("utf-8"))
+    if file_wrapper is None:
+        return None
+    return file_wrapper._bytes_read, file_wrapper._read_requests
+
+
 cdef class FilePathBase:
     """Base for a BytesIO-like class backed by a Python file-like object."""
 
-    def __init__(self, filelike_obj, dirname=None, filename=None):
+    def __init__(self, filelike_obj, dirname=None, filename=None, block_size=0, cache_size=16777216):
         """A file in an in-memory filesystem.
 
         Parameters
         ----------
         filelike_obj : file-like objects
-            A file opened in binary mode
+            A file opened in binary mode. It must have a read or a write
+            method.
         filename : str
             An optional filename used internally by GDAL. If not provided then
             a unique one will be generated.
+        block_size : int, optional
+            Size in bytes of the aligned blocks of the read-ahead cache.
+            Reads smaller than this are served from whole blocks read from
+            the file-like object. The default, 0, disables the cache.
+        cache_size : int, optional
+            Maximum number of bytes held in the read-ahead cache. The
+            least recently used blocks are discarded first.
 
         """
-        if isinstance(filelike_obj, (bytes, str)) or not hasattr(filelike_obj, "read"):
+        if isinstance(filelike_obj, (bytes, str)) or not (
+            hasattr(filelike_obj, "read") or hasattr(filelike_obj, "write")
+        ):
             raise TypeError("FilePath expects file-like objects only.")
+        if block_size < 0 or cache_size < 0:
+            raise ValueError("block_size and cache_size must not be negative.")
 
         # Make an in-memory directory specific to this dataset to help organize
         # auxiliary files.
@@ -193,8 +380,345 @@ cdef class FilePathBase:
         self._file_obj = filelike_obj
         self.mode = "r"
         self.closed = False
+
+        # The means to read from the file-like object without copies.
+        # Plain OS-level files are read with os.preadv, written with
+        # os.pwrite, and need no lock. Everything else is read or written
+        # after a seek and the lock keeps handles in different threads
+        # from interleaving.
+        self._lock = threading.Lock()
+        self._fileno = None
+        if hasattr(os, "preadv") and isinstance(
+            filelike_obj, (io.FileIO, io.BufferedReader, io.BufferedWriter, io.BufferedRandom)
+        ):
+            try:
+                # Data buffered by the file object must reach the OS first.
+                if hasattr(filelike_obj, "flush") and not filelike_obj.closed:
+                    filelike_obj.flush()
+                self._fileno = filelike_obj.fileno()
+            except (OSError, ValueError):
+                pass
+        self._readinto = getattr(filelike_obj, "readinto", None)
+
+        try:
+            self._seekable = filelike_obj.seekable()
+        except AttributeError:
+            self._seekable = hasattr(filelike_obj, "seek")
+        # Objects which can not seek are written sequentially. This is the
+        # position of their next write.
+        self._stream_pos = 0
+
+        # Bytes read from the file-like object and the number of reads.
+        self._bytes_read = 0
+        self._read_requests = 0
+
+        # The read-ahead cache maps block indexes to bytes, least recently
+        # used first.
+        self._block_size = block_size
+        self._cache_blocks = cache_size // block_size if block_size else 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         _FILESYSTEM_INFO[self._filepath_path] = self
 
+    def _pread(self, buffer_view, offset):
+        """Read into a writable buffer from a position in the file.
+
+        The seek state of the file-like object is not relied on.
+
+        Parameters
+        ----------
+        buffer_view : memoryview
+            Writable, contiguous bytes.
+        offset : int
+            Position in the file to read from.
+
+        Returns
+        -------
+        int
+            The number of bytes read. Less than the size of the buffer
+            only at the end of the file.
+
+        """
+        cdef Py_ssize_t size = len(buffer_view)
+        cdef Py_ssize_t total = 0
+        cdef Py_ssize_t count
+
+        self._read_requests += 1
+
+        if self._fileno is not None:
+            while total < size:
+                count = os.preadv(self._fileno, [buffer_view[total:]], offset + total)
+                if count <= 0:
+                    break
+                total += count
+            self._bytes_read += total
+            return total
+
+        with self._lock:
+            self._file_obj.seek(offset)
+            while total < size:
+                if self._readinto is not None:
+                    count = self._readinto(buffer_view[total:]) or 0
+                else:
+                    data = self._file_obj.read(size - total)
+                    count = len(data)
+                    buffer_view[total:total + count] = data
+                if count <= 0:
+                    break
+                total += count
+        self._bytes_read += total
+        return total
+
+    def _pwrite(self, buffer_view, offset):
+        """Write bytes to a position in the file.
+
+        Objects which can not seek only accept writes at the end of
+        the bytes already written.
+
+        Parameters
+        ----------
+        buffer_view : memoryview
+            Contiguous bytes.
+        offset : int
+            Position in the file to write to.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+
+        """
+        cdef Py_ssize_t size = len(buffer_view)
+        cdef Py_ssize_t total = 0
+        cdef Py_ssize_t count
+
+        if self._fileno is not None:
+            while total < size:
+                total += os.pwrite(self._fileno, buffer_view[total:], offset + total)
+
+        else:
+            with self._lock:
+                if self._seekable:
+                    self._file_obj.seek(offset)
+                elif offset != self._stream_pos:
+                    raise OSError(
+                        "File-like object can not seek and accepts only sequential writes."
+                    )
+                while total < size:
+                    count = self._file_obj.write(buffer_view[total:])
+                    # Some file-like objects do not report a count.
+                    total += size - total if count is None else count
+                if not self._seekable:
+                    self._stream_pos += total
+
+        self._invalidate_cache(offset, total)
+        return total
+
+    def _flush(self):
+        """Flush the file-like object, if possible."""
+        if self._fileno is None and hasattr(self._file_obj, "flush"):
+            with self._lock:
+                self._file_obj.flush()
+
+    def _truncate(self, size):
+        """Resize the file-like object, if possible.
+
+        Objects which can not be resized are left alone, unless they
+        must be emptied and have content.
+
+        """
+        if self._fileno is not None:
+            os.ftruncate(self._fileno, size)
+        elif hasattr(self._file_obj, "truncate") and self._seekable:
+            with self._lock:
+                self._file_obj.truncate(size)
+        elif size == 0 and len(self) > 0:
+            raise OSError("File-like object can not be truncated.")
+
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _invalidate_cache(self, offset, size):
+        """Discard cached blocks which overlap a range of the file."""
+        if not self._cache_blocks or size <= 0:
+            return
+        block_size = self._block_size
+        with self._cache_lock:
+            for index in range(offset // block_size, (offset + size - 1) // block_size + 1):
+                self._cache.pop(index, None)
+
+    def _read(self, buffer_view, offset):
+        """Read into a writable buffer, using the read-ahead cache.
+
+        Reads of at least one block bypass the cache.
+
+        Parameters
+        ----------
+        buffer_view : memoryview
+            Writable, contiguous bytes.
+        offset : int
+            Position in the file to read from.
+
+        Returns
+        -------
+        int
+            The number of bytes read.
+
+        """
+        cdef Py_ssize_t size = len(buffer_view)
+        if not self._cache_blocks or size >= self._block_size:
+            return self._pread(buffer_view, offset)
+        if size == 0:
+            return 0
+
+        block_size = self._block_size
+        first = offset // block_size
+        last = (offset + size - 1) // block_size
+        blocks = self._get_blocks(range(first, last + 1))
+        return self._copy_from_blocks(buffer_view, offset, blocks)
+
+    def _read_multi_range(self, buffer_views, offsets):
+        """Read into several writable buffers.
+
+        Parameters
+        ----------
+        buffer_views : list of memoryview
+            Writable, contiguous bytes.
+        offsets : list of int
+            Positions in the file to read from.
+
+        Returns
+        -------
+        bool
+            True if every buffer was filled.
+
+        """
+        cdef Py_ssize_t gap = MULTI_RANGE_MERGE_GAP
+        ranges = sorted(zip(offsets, buffer_views), key=lambda item: item[0])
+
+        if self._cache_blocks:
+            block_size = self._block_size
+            small = [
+                (offset, view) for offset, view in ranges
+                if 0 < len(view) < block_size
+            ]
+            indexes = set()
+            for offset, view in small:
+                indexes.update(
+                    range(offset // block_size, (offset + len(view) - 1) // block_size + 1)
+                )
+            blocks = self._get_blocks(sorted(indexes))
+            for offset, view in small:
+                if self._copy_from_blocks(view, offset, blocks) < len(view):
+                    return False
+            ranges = [
+                (offset, view) for offset, view in ranges
+                if len(view) >= block_size
+            ]
+
+        # Coalesce nearby ranges into groups and read each group at once.
+        groups = []
+        for offset, view in ranges:
+            end = offset + len(view)
+            if groups and offset <= groups[-1][1] + gap:
+                groups[-1][1] = max(groups[-1][1], end)
+                groups[-1][2].append((offset, view))
+            else:
+                groups.append([offset, end, [(offset, view)]])
+
+        for start, end, members in groups:
+            if len(members) == 1:
+                offset, view = members[0]
+                if self._pread(view, offset) < len(view):
+                    return False
+                continue
+            data = bytearray(end - start)
+            count = self._pread(memoryview(data), start)
+            data_view = memoryview(data)
+            for offset, view in members:
+                size = len(view)
+                if offset + size > start + count:
+                    return False
+                view[:] = data_view[offset - start:offset - start + size]
+
+        return True
+
+    def _get_blocks(self, indexes):
+        """Get blocks from the cache, reading the missing ones.
+
+        Runs of consecutive missing blocks are read from the file-like
+        object at once.
+
+        Parameters
+        ----------
+        indexes : sequence of int
+            Sorted block indexes.
+
+        Returns
+        -------
+        dict
+            Mapping of block index to bytes. A block at the end of the
+            file may be short or empty.
+
+        """
+        block_size = self._block_size
+        blocks = {}
+        missing = []
+
+        with self._cache_lock:
+            for index in indexes:
+                if index in self._cache:
+                    self._cache.move_to_end(index)
+                    blocks[index] = self._cache[index]
+                else:
+                    missing.append(index)
+
+        runs = []
+        for index in missing:
+            if runs and index == runs[-1][-1] + 1:
+                runs[-1].append(index)
+            else:
+                runs.append([index])
+
+        for run in runs:
+            data = bytearray(len(run) * block_size)
+            count = self._pread(memoryview(data), run[0] * block_size)
+            for i, index in enumerate(run):
+                block = bytes(data[i * block_size:min((i + 1) * block_size, count)])
+                blocks[index] = block
+
+            with self._cache_lock:
+                for index in run:
+                    self._cache[index] = blocks[index]
+                while len(self._cache) > self._cache_blocks:
+                    self._cache.popitem(last=False)
+
+        return blocks
+
+    def _copy_from_blocks(self, buffer_view, offset, blocks):
+        """Copy bytes from cached blocks into a writable buffer.
+
+        Returns
+        -------
+        int
+            The number of bytes copied. Less than the size of the buffer
+            only at the end of the file.
+
+        """
+        block_size = self._block_size
+        size = len(buffer_view)
+        total = 0
+        while total < size:
+            index, start = divmod(offset + total, block_size)
+            block = blocks[index]
+            count = min(len(block) - start, size - total)
+            if count <= 0:
+                break
+            buffer_view[total:total + count] = memoryview(block)[start:start + count]
+            total += count
+        return total
+
     def exists(self):
         """Test if the in-memory file exists.
 
@@ -219,17 +743,35 @@ cdef class FilePathBase:
         except (TypeError, AttributeError):
             pass
 
-        try:
-            return self._file_obj.size
-        except AttributeError:
-            raise RuntimeError("Could not determine length for provided "
-                               "file-like object.")
+        size = getattr(self._file_obj, "size", None)
+        if isinstance(size, int):
+            return size
+
+        if self._fileno is not None:
+            return os.fstat(self._fileno).st_size
+
+        if self._seekable:
+            with self._lock:
+                pos = self._file_obj.tell()
+                try:
+                    return self._file_obj.seek(0, os.SEEK_END)
+                finally:
+                    self._file_obj.seek(pos)
+
+        if hasattr(self._file_obj, "write"):
+            return self._stream_pos
+
+        raise RuntimeError("Could not determine length for provided "
+                           "file-like object.")
 
     def close(self):
-        """Mark the file as closed.
+        """Mark the file as closed and remove it from the filesystem.
 
         This does not actually attempt to close the file; that is left up
-        to the user.
+        to the user. Datasets which are already open on the file may
+        continue to use it. A FilePath which is never closed is removed
+        from the filesystem when it is garbage collected.
 
         """
         self.closed = True
+        _FILESYSTEM_INFO.pop(self._filepath_path, None)
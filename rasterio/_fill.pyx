@@ -5,17 +5,21 @@
 include "gdal.pxi"
 
 import numpy as np
+from rasterio._base cimport progress_func, ProgressReporter
 from rasterio._err cimport exc_wrap_int
 from rasterio._io cimport MemoryDataset
 
 
 def _fillnodata(image, mask, double max_search_distance=100.0,
-                int smoothing_iterations=0):
+                int smoothing_iterations=0, progress=None, cancel=None):
     cdef GDALRasterBandH image_band = NULL
     cdef GDALRasterBandH mask_band = NULL
     cdef char **alg_options = NULL
     cdef MemoryDataset image_dataset = None
     cdef MemoryDataset mask_dataset = None
+    cdef ProgressReporter reporter = None
+    cdef void *progress_arg = NULL
+    cdef int retval = 0
 
     try:
         # copy numpy ndarray into an in-memory dataset.
@@ -27,10 +31,20 @@ def _fillnodata(image, mask, double max_search_distance=100.0,
             mask_dataset = MemoryDataset(mask_cast)
             mask_band = mask_dataset.band(1)
 
+        if progress is not None or cancel is not None:
+            reporter = ProgressReporter(progress, cancel, pixels=image.size)
+            progress_arg = reporter.arg()
+
         alg_options = CSLSetNameValue(alg_options, "TEMP_FILE_DRIVER", "MEM")
-        exc_wrap_int(
-            GDALFillNodata(image_band, mask_band, max_search_distance, 0,
-                           smoothing_iterations, alg_options, NULL, NULL))
+        with nogil:
+            retval = GDALFillNodata(
+                image_band, mask_band, max_search_distance, 0,
+                smoothing_iterations, alg_options,
+                <void *>progress_func if progress_arg != NULL else NULL,
+                progress_arg)
+        if reporter is not None:
+            reporter.raise_if_stopped()
+        exc_wrap_int(retval)
         return np.asarray(image_dataset)
     finally:
         if image_dataset is not None:
@@ -15,6 +15,7 @@ cdef class DatasetWriterBase(DatasetReaderBase):
     cdef readonly object _init_gcps
     cdef readonly object _init_rpcs
     cdef readonly object _options
+    cdef readonly object _vsi_path
 
 
 cdef class BufferedDatasetWriterBase(DatasetWriterBase):
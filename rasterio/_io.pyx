@@ -5,15 +5,19 @@
 from enum import Enum, IntEnum
 from collections import Counter
 from contextlib import contextmanager, ExitStack
+import json
 import logging
+import math
 import os
 import sys
+from time import perf_counter
 from uuid import uuid4
 import warnings
 
 import attr
 import numpy as np
 
+from rasterio import cache
 from rasterio._base import tastes_like_gdal
 from rasterio._base cimport open_dataset
 from rasterio._err import (
@@ -27,6 +31,7 @@ from rasterio.errors import (
     UnsupportedOperation, OverviewCreationError, RasterBlockError, InvalidArrayError
 )
 from rasterio.dtypes import is_ndarray, _is_complex_int, _getnpdtype, _gdal_typename, _get_gdal_dtype
+from rasterio.profiling import profiled, _argument
 from rasterio.sample import sample_gen
 from rasterio.transform import Affine
 from rasterio._path import _parse_path, _UnparsedPath
@@ -38,9 +43,15 @@ from libc.stdio cimport FILE
 from rasterio.enums import Resampling
 from rasterio.env import GDALVersion
 from rasterio.errors import ResamplingAlgorithmError, DatasetIOShapeError
-from rasterio._base cimport get_driver_name, DatasetBase
+from rasterio._base cimport (
+    get_driver_name, DatasetBase, progress_func, ProgressReporter)
 from rasterio._err cimport exc_wrap_int, exc_wrap_pointer, exc_wrap_vsilfile
 
+try:
+    from rasterio._filepath import _io_counters as _filepath_io_counters
+except ImportError:
+    _filepath_io_counters = None
+
 cimport numpy as np
 
 log = logging.getLogger(__name__)
@@ -246,6 +257,57 @@ cdef int io_multi_mask(GDALDatasetH hds, int mode, double x0, double y0,
     return exc_wrap_int(retval)
 
 
+def _vsi_io_counters(name):
+    """Bytes read and requests made by the virtual filesystem so far.
+
+    Counters are kept by FilePath objects and, when GDAL's
+    CPL_VSIL_NETWORK_STATS_ENABLED config option is on, by GDAL's
+    network filesystems. The latter are process-wide.
+
+    Returns
+    -------
+    tuple of int
+
+    """
+    cdef char *stats_c = NULL
+
+    if _filepath_io_counters is not None and name and name.startswith("/vsipythonfilelike/"):
+        return _filepath_io_counters(name) or (0, 0)
+
+    IF (CTE_GDAL_MAJOR_VERSION, CTE_GDAL_MINOR_VERSION) >= (3, 2):
+        enabled = CPLGetConfigOption("CPL_VSIL_NETWORK_STATS_ENABLED", "NO")
+        if enabled.upper() in (b"YES", b"ON", b"TRUE"):
+            stats_c = VSINetworkStatsGetAsSerializedJSON(NULL)
+            if stats_c != NULL:
+                try:
+                    stats = json.loads(stats_c)
+                finally:
+                    CPLFree(stats_c)
+                get = stats.get("methods", {}).get("GET", {})
+                return get.get("downloaded_bytes", 0), get.get("count", 0)
+
+    return (0, 0)
+
+
+cdef object _io_stats_start(DatasetBase dataset):
+    """Note the state of counters before an I/O call."""
+    return (perf_counter(), GDALGetCacheUsed64(), _vsi_io_counters(dataset.name))
+
+
+cdef _io_stats_record(DatasetBase dataset, object start, str kind, object data, int count):
+    """Record an I/O call in the dataset's collected statistics."""
+    gdal_time = perf_counter() - start[0]
+    cache_used_delta = GDALGetCacheUsed64() - start[1]
+    vsi_bytes_read, vsi_requests = _vsi_io_counters(dataset.name)
+    vsi_bytes_read -= start[2][0]
+    vsi_requests -= start[2][1]
+    pixels = data.shape[-1] * data.shape[-2] * count
+    for stats in dataset._io_stats:
+        stats._add(
+            kind, pixels, data.nbytes, gdal_time, vsi_bytes_read,
+            vsi_requests, cache_used_delta)
+
+
 cdef _delete_dataset_if_exists(path):
     """Delete a dataset if it already exists.
 
@@ -373,6 +435,26 @@ cdef char **convert_options(kwargs):
     return options
 
 
+def _read_span_attributes(args, kwds, result):
+    """Profiling span attributes of a read call."""
+    return {
+        "path": args[0].name,
+        "indexes": _argument(args, kwds, 1, "indexes"),
+        "window": _argument(args, kwds, 3, "window"),
+        "bytes": getattr(result, "nbytes", None),
+    }
+
+
+def _write_span_attributes(args, kwds, result):
+    """Profiling span attributes of a write call."""
+    return {
+        "path": args[0].name,
+        "indexes": _argument(args, kwds, 2, "indexes"),
+        "window": _argument(args, kwds, 3, "window"),
+        "bytes": getattr(_argument(args, kwds, 1, "arr"), "nbytes", None),
+    }
+
+
 @attr.s(slots=True, frozen=True)
 class Statistics:
     """Raster band statistics.
@@ -392,6 +474,7 @@ class Statistics:
 cdef class DatasetReaderBase(DatasetBase):
     """Provides data and metadata reading methods."""
 
+    @profiled("read", _read_span_attributes)
     def read(self, indexes=None, out=None, window=None, masked=False,
             out_shape=None, boundless=False, resampling=Resampling.nearest,
             fill_value=None, out_dtype=None):
@@ -495,7 +578,7 @@ cdef class DatasetReaderBase(DatasetBase):
             dtype = self.dtypes[idx]
             check_dtypes.add(dtype)
 
-            ndv = self._nodatavals[idx]
+            ndv = self.nodatavals[idx]
 
             log.debug("Output nodata value read from file: %r", ndv)
 
@@ -928,10 +1011,18 @@ cdef class DatasetReaderBase(DatasetBase):
                         if MaskFlags.nodata in flags:
                             warnings.warn(NodataShadowWarning())
 
+                if self._io_stats is not None:
+                    start = _io_stats_start(self)
                 io_multi_mask(self._hds, 0, xoff, yoff, width, height, out, indexes_arr, resampling=resampling)
+                if self._io_stats is not None:
+                    _io_stats_record(self, start, "mask", out, indexes_count)
 
             else:
+                if self._io_stats is not None:
+                    start = _io_stats_start(self)
                 io_multi_band(self._hds, 0, xoff, yoff, width, height, out, indexes_arr, resampling=resampling)
+                if self._io_stats is not None:
+                    _io_stats_record(self, start, "multi_band", out, indexes_count)
 
         except CPLE_BaseError as cplerr:
             raise RasterioIOError("Read or write failed. {}".format(cplerr))
@@ -1397,6 +1488,11 @@ cdef class DatasetWriterBase(DatasetReaderBase):
         filename = internal_path.name
         vsi_path = internal_path.as_vsi()
         name_b = vsi_path.encode('utf-8')
+
+        # Cached header metadata of the file goes stale when it is
+        # written.
+        self._vsi_path = vsi_path
+        cache._evict(vsi_path)
         fname = name_b
 
         # Process dataset opening options.
@@ -1542,6 +1638,13 @@ cdef class DatasetWriterBase(DatasetReaderBase):
             self.name,
             self.mode)
 
+    def close(self):
+        """Close the dataset and unwind attached exit stack."""
+        DatasetReaderBase.close(self)
+        # Metadata cached while the dataset was open is stale.
+        if self._vsi_path is not None:
+            cache._evict(self._vsi_path)
+
     def _set_crs(self, crs):
         """Writes a coordinate reference system to the dataset."""
         crs = CRS.from_user_input(crs)
@@ -1628,6 +1731,7 @@ cdef class DatasetWriterBase(DatasetReaderBase):
                 raise ValueError("Invalid nodata value: %r", val)
         self._nodatavals = vals
 
+    @profiled("write", _write_span_attributes)
     def write(self, arr, indexes=None, window=None, masked=False):
         """Write the arr array into indexed bands of the dataset.
 
@@ -1736,7 +1840,11 @@ cdef class DatasetWriterBase(DatasetReaderBase):
         indexes_count = <int>indexes_arr.shape[0]
 
         try:
+            if self._io_stats is not None:
+                start = _io_stats_start(self)
             io_multi_band(self._hds, 1, xoff, yoff, width, height, arr, indexes_arr)
+            if self._io_stats is not None:
+                _io_stats_record(self, start, "multi_band", arr, indexes_count)
         except CPLE_BaseError as cplerr:
             raise RasterioIOError("Read or write failed. {}".format(cplerr))
 
@@ -1919,20 +2027,45 @@ cdef class DatasetWriterBase(DatasetReaderBase):
                 GDALFillRaster(mask, 255, 0)
             elif mask_array is False:
                 GDALFillRaster(mask, 0, 0)
-            elif mask_array.dtype == bool:
-                array = 255 * mask_array.astype(np.uint8)
-                io_band(mask, 1, xoff, yoff, width, height, array)
             else:
-                io_band(mask, 1, xoff, yoff, width, height, mask_array)
+                if mask_array.dtype == bool:
+                    array = 255 * mask_array.astype(np.uint8)
+                else:
+                    array = mask_array
+                if self._io_stats is not None:
+                    start = _io_stats_start(self)
+                io_band(mask, 1, xoff, yoff, width, height, array)
+                if self._io_stats is not None:
+                    _io_stats_record(self, start, "mask", array, 1)
 
         except CPLE_BaseError as cplerr:
             raise RasterioIOError("Read or write failed. {}".format(cplerr))
 
-    def build_overviews(self, factors, resampling=Resampling.nearest):
+    def build_overviews(self, factors, resampling=Resampling.nearest,
+                        progress=None, cancel=None):
         """Build overviews at one or more decimation factors for all
-        bands of the dataset."""
+        bands of the dataset.
+
+        Parameters
+        ----------
+        factors : list of int
+            Decimation factors of the overviews.
+        resampling : Resampling, optional
+            Resampling algorithm. Defaults to Resampling.nearest.
+        progress : callable, optional
+            A function called as overviews are built with the completed
+            fraction and the throughput in pixels per second. See
+            :mod:`rasterio.progress`.
+        cancel : CancellationToken, optional
+            A token that stops the build when cancelled.
+
+        """
         cdef int *factors_c = NULL
+        cdef int n_factors = 0
         cdef const char *resampling_c = NULL
+        cdef ProgressReporter reporter = None
+        cdef void *progress_arg = NULL
+        cdef int retval = 0
 
         try:
             # GDALBuildOverviews() takes a string algo name, not a
@@ -1971,18 +2104,131 @@ cdef class DatasetWriterBase(DatasetReaderBase):
             for i, factor in enumerate(factors):
                 factors_c[i] = factor
 
+            n_factors = len(factors)
+
             try:
+                if progress is not None or cancel is not None:
+                    reporter = ProgressReporter(
+                        progress, cancel,
+                        pixels=<double>self.width * self.height * self.count)
+                    progress_arg = reporter.arg()
+
                 resampling_b = resampling_alg.encode('utf-8')
                 resampling_c = resampling_b
                 GDALFlushCache(self._hds)
-                exc_wrap_int(
-                    GDALBuildOverviews(self._hds, resampling_c,
-                                       len(factors), factors_c, 0, NULL, NULL,
-                                       NULL))
+                with nogil:
+                    retval = GDALBuildOverviews(
+                        self._hds, resampling_c, n_factors, factors_c, 0, NULL,
+                        <void *>progress_func if progress_arg != NULL else NULL,
+                        progress_arg)
+                if reporter is not None:
+                    reporter.raise_if_stopped()
+                exc_wrap_int(retval)
             finally:
                 if factors_c != NULL:
                     CPLFree(factors_c)
 
+    def update_overviews(self, window, resampling=Resampling.nearest):
+        """Regenerate the overviews of all bands over a window.
+
+        Overview pixels that cover the window are computed again from
+        the dataset's full resolution pixels. Other overview pixels are
+        not changed. Use this after writing to a window of a dataset
+        with overviews.
+
+        Parameters
+        ----------
+        window : Window or tuple
+            The region of the dataset, in full resolution pixels, that
+            has changed.
+        resampling : Resampling, optional
+            Resampling algorithm. Defaults to Resampling.nearest.
+
+        Returns
+        -------
+        None
+
+        """
+        cdef GDALRasterBandH band = NULL
+        cdef GDALRasterBandH ovr_band = NULL
+        cdef MemoryDataset temp = None
+        cdef int i
+        cdef int ovr_count
+
+        validate_resampling(resampling)
+
+        if isinstance(window, tuple):
+            window = Window.from_slices(*window, self.height, self.width)
+        try:
+            window = intersection(window, Window(0, 0, self.width, self.height))
+        except WindowError:
+            return
+
+        col_off, row_off = window.col_off, window.row_off
+        col_stop, row_stop = col_off + window.width, row_off + window.height
+
+        for bidx in self.indexes:
+            band = self.band(bidx)
+            ovr_count = GDALGetOverviewCount(band)
+            if ovr_count == 0:
+                continue
+
+            # The overview window of each level and the full resolution
+            # window it covers.
+            levels = []
+            for i in range(ovr_count):
+                ovr_band = GDALGetOverview(band, i)
+                ovr_width = GDALGetRasterBandXSize(ovr_band)
+                ovr_height = GDALGetRasterBandYSize(ovr_band)
+                xfactor = self.width / ovr_width
+                yfactor = self.height / ovr_height
+                ovr_col_off = math.floor(col_off / xfactor)
+                ovr_row_off = math.floor(row_off / yfactor)
+                ovr_window = Window(
+                    ovr_col_off, ovr_row_off,
+                    min(ovr_width, math.ceil(col_stop / xfactor)) - ovr_col_off,
+                    min(ovr_height, math.ceil(row_stop / yfactor)) - ovr_row_off)
+                src_col_off = ovr_window.col_off * xfactor
+                src_row_off = ovr_window.row_off * yfactor
+                src_window = Window(
+                    src_col_off, src_row_off,
+                    min(self.width - src_col_off, ovr_window.width * xfactor),
+                    min(self.height - src_row_off, ovr_window.height * yfactor))
+                levels.append((i, ovr_window, src_window))
+
+            # One full resolution read covers the windows of all levels.
+            read_window = Window.from_slices(
+                (math.floor(min(w.row_off for _, _, w in levels)),
+                 math.ceil(max(w.row_off + w.height for _, _, w in levels))),
+                (math.floor(min(w.col_off for _, _, w in levels)),
+                 math.ceil(max(w.col_off + w.width for _, _, w in levels))))
+            data = np.ascontiguousarray(self.read(bidx, window=read_window))
+
+            # Overviews are computed from an in-memory dataset, which has
+            # no overviews of its own for GDAL to substitute.
+            temp = MemoryDataset(data)
+            try:
+                if self.nodatavals[bidx - 1] is not None:
+                    temp.nodata = self.nodatavals[bidx - 1]
+                for i, ovr_window, src_window in levels:
+                    ovr_data = np.empty(
+                        (ovr_window.height, ovr_window.width), dtype=data.dtype)
+                    io_band(
+                        temp.band(1), 0, src_window.col_off - read_window.col_off,
+                        src_window.row_off - read_window.row_off,
+                        src_window.width, src_window.height, ovr_data,
+                        resampling=resampling)
+                    if self._io_stats is not None:
+                        start = _io_stats_start(self)
+                    io_band(
+                        GDALGetOverview(band, i), 1, ovr_window.col_off,
+                        ovr_window.row_off, ovr_window.width, ovr_window.height,
+                        ovr_data)
+                    if self._io_stats is not None:
+                        _io_stats_record(self, start, "band", ovr_data, 1)
+            finally:
+                temp.close()
+
     def _set_gcps(self, gcps, crs=None):
         cdef char *srcwkt = NULL
         cdef GDAL_GCP *gcplist = <GDAL_GCP *>CPLMalloc(len(gcps) * sizeof(GDAL_GCP))
@@ -2212,6 +2458,8 @@ cdef class BufferedDatasetWriterBase(DatasetWriterBase):
         # configuration to be done.
         vsi_filename = path.as_vsi()
         name_b = vsi_filename.encode('utf-8')
+        self._vsi_path = vsi_filename
+        cache._evict(vsi_filename)
 
         memdrv = GDALGetDriverByName("MEM")
 
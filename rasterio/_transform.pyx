@@ -4,16 +4,24 @@
 
 include "gdal.pxi"
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
 import logging
 import warnings
 
+import numpy as np
+
 from rasterio._err import GDALError
 from rasterio._err cimport exc_wrap_pointer
-from rasterio.errors import NotGeoreferencedWarning, TransformWarning
+from rasterio.errors import NotGeoreferencedWarning, TransformError, TransformWarning
+
+from libc.limits cimport INT_MAX
 
 log = logging.getLogger(__name__)
 
+# Smallest number of points worth transforming in a separate thread.
+cdef Py_ssize_t MIN_POINTS_PER_THREAD = 16384
+
 
 def _transform_from_gcps(gcps):
     cdef double gt[6]
@@ -44,21 +52,176 @@ def _transform_from_gcps(gcps):
     return [gt[i] for i in range(6)]
 
 
+cdef int _transform_by_row(
+        GDALTransformerFunc pfnTransformer, void *pTransformArg,
+        int bDstToSrc, int n, double *x, double *y, double *z,
+        int *panSuccess) nogil:
+    """Call a transformer once per run of points with equal y and z.
+
+    GDAL's approximate transformer only interpolates along runs of
+    points like these, such as the rows of a pixel grid, and falls
+    back to the exact transformer for any other list of points.
+
+    """
+    cdef int start = 0
+    cdef int end
+    cdef int retval = 1
+
+    while start < n:
+        end = start + 1
+        while end < n and y[end] == y[start] and z[end] == z[start]:
+            end += 1
+        if not pfnTransformer(
+                pTransformArg, bDstToSrc, end - start, x + start, y + start,
+                z + start, panSuccess + start):
+            retval = 0
+        start = end
+
+    return retval
+
+
+cdef class _TransformerHandle:
+    """A GDAL transformer function and its argument
+
+    Handles are not safe to share between threads. A clone has its own
+    copy of the transformer.
+    """
+
+    cdef GDALTransformerFunc pfnTransformer
+    cdef void *pTransformArg
+    cdef bint by_row
+    cdef bint owned
+
+    def __cinit__(self):
+        self.pfnTransformer = NULL
+        self.pTransformArg = NULL
+        self.by_row = False
+        self.owned = False
+
+    def __dealloc__(self):
+        if self.owned and self.pTransformArg != NULL:
+            GDALDestroyTransformer(self.pTransformArg)
+        self.pTransformArg = NULL
+
+    cdef _TransformerHandle clone(self):
+        cdef _TransformerHandle handle = _TransformerHandle.__new__(_TransformerHandle)
+        handle.pfnTransformer = self.pfnTransformer
+        handle.pTransformArg = exc_wrap_pointer(GDALCloneTransformer(self.pTransformArg))
+        handle.by_row = self.by_row
+        handle.owned = True
+        return handle
+
+    def transform(self, int bDstToSrc, double[::1] x, double[::1] y, double[::1] z, int[::1] success):
+        """Transform coordinates in place without the GIL.
+
+        Returns
+        -------
+        bool
+            False if the transformer failed.
+        """
+        cdef Py_ssize_t n = x.shape[0]
+        cdef Py_ssize_t start = 0
+        cdef int count = 0
+        cdef int retval = 1
+
+        with nogil:
+            # GDAL transformers count points with an int.
+            while start < n:
+                count = <int>min(n - start, <Py_ssize_t>INT_MAX)
+                if self.by_row:
+                    if not _transform_by_row(
+                            self.pfnTransformer, self.pTransformArg, bDstToSrc,
+                            count, &x[start], &y[start], &z[start], &success[start]):
+                        retval = 0
+                elif not self.pfnTransformer(
+                        self.pTransformArg, bDstToSrc, count, &x[start],
+                        &y[start], &z[start], &success[start]):
+                    retval = 0
+                start += count
+
+        return bool(retval)
+
+
+def _as_coordinates(values):
+    """Copy coordinates into a flat float64 array."""
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "biuf":
+        raise TypeError("Coordinates must be numbers")
+    return np.array(arr, dtype=np.float64).reshape(-1)
+
+
+def _transform_arrays(_TransformerHandle handle, xs, ys, zs, transform_direction, num_threads=1, method="RPCs"):
+    """Transform arrays or sequences of coordinates.
+
+    The coordinates are copied once into float64 arrays and
+    transformed without the GIL. Large inputs may be split between
+    threads, each with its own clone of the transformer. A warning
+    naming the method, "RPCs" or "GCPs", is raised if the transformer
+    fails.
+
+    Returns
+    -------
+    tuple of ndarray
+        Transformed x and y and a boolean array which is False where a
+        point could not be transformed, with the shape of xs.
+    """
+    shape = np.shape(xs)
+    x = _as_coordinates(xs)
+    y = _as_coordinates(ys)
+    n = x.shape[0]
+    if zs is None:
+        z = np.zeros(n, dtype=np.float64)
+    else:
+        z = _as_coordinates(zs)
+        if z.shape[0] == 1:
+            z = np.full(n, z[0])
+    if not y.shape[0] == z.shape[0] == n:
+        raise TransformError("Input coordinates must be of equal length")
+
+    success = np.zeros(n, dtype=np.intc)
+    bDstToSrc = int(transform_direction)
+
+    num_threads = min(num_threads, n // MIN_POINTS_PER_THREAD)
+    if num_threads > 1:
+        offsets = np.linspace(0, n, num_threads + 1).astype(np.intp)
+        handles = [handle] + [handle.clone() for _ in range(num_threads - 1)]
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [
+                executor.submit(
+                    thread_handle.transform, bDstToSrc, x[start:stop], y[start:stop],
+                    z[start:stop], success[start:stop])
+                for thread_handle, start, stop in zip(handles, offsets[:-1], offsets[1:])]
+            ok = all([future.result() for future in futures])
+    elif n > 0:
+        ok = handle.transform(bDstToSrc, x, y, z, success)
+    else:
+        ok = True
+
+    if not ok:
+        warnings.warn(
+            "Could not transform points using {}.".format(method),
+            TransformWarning)
+
+    return x.reshape(shape), y.reshape(shape), success.astype(bool).reshape(shape)
+
+
 cdef class RPCTransformerBase:
     """
     Rational Polynomial Coefficients (RPC) transformer base class
     """
     cdef void *_transformer
+    cdef void *_approx_transformer
     cdef bint _closed
 
     def __cinit__(self):
         self._transformer = NULL
+        self._approx_transformer = NULL
         self._closed = True
 
     def __dealloc__(self):
         self.close()
 
-    def __init__(self, rpcs, **kwargs):
+    def __init__(self, rpcs, approx_error=None, **kwargs):
         """
         Construct a new RPC transformer
 
@@ -71,6 +234,13 @@ cdef class RPCTransformerBase:
         rpcs : rasterio.rpc.RPC or dict
             RPCs for a dataset. If passing a dict, should be in the form expected
             by rasterio.rpc.RPC.from_gdal.
+        approx_error : float, optional
+            If given, the RPCs are evaluated exactly only at the ends and
+            middle of rows of coordinates and linearly interpolated
+            between them, as long as the interpolation error is less than
+            this value, in units of the transformed coordinates. See
+            GDALCreateApproxTransformer. By default, the RPCs are
+            evaluated for every coordinate.
         kwargs : dict
             GDALCreateRPCTransformer options. See
             https://gdal.org/api/gdal_alg.html#_CPPv426GDALCreateRPCTransformerV2PK13GDALRPCInfoV2idPPc.
@@ -121,12 +291,61 @@ cdef class RPCTransformerBase:
             GDALExtractRPCInfo(papszMD, &rpcinfo)
             self._transformer = exc_wrap_pointer(GDALCreateRPCTransformer(&rpcinfo, bReversed, dfPixErrThreshold, options))
             self._closed = False
+            if approx_error:
+                self._approx_transformer = exc_wrap_pointer(
+                    GDALCreateApproxTransformer(
+                        GDALRPCTransform, self._transformer, approx_error))
         finally:
             CSLDestroy(options)
             CSLDestroy(papszMD)
 
         self._env = ExitStack()
 
+    cdef _TransformerHandle _handle(self):
+        if self._transformer == NULL:
+            raise ValueError("Unexpected NULL transformer")
+
+        cdef _TransformerHandle handle = _TransformerHandle.__new__(_TransformerHandle)
+        if self._approx_transformer != NULL:
+            handle.pfnTransformer = GDALApproxTransform
+            handle.pTransformArg = self._approx_transformer
+            handle.by_row = True
+        else:
+            handle.pfnTransformer = GDALRPCTransform
+            handle.pTransformArg = self._transformer
+        return handle
+
+    def _transform_arrays(self, xs, ys, zs, transform_direction, num_threads=1):
+        """
+        Computation of dataset pixel/line <-> lon/lat/height coordinate arrays using RPCs
+
+        Parameters
+        ----------
+        xs, ys, zs : array_like
+            Coordinates to be transformed. May be either pixel/line/height or
+            lon/lat/height. zs may be None.
+        transform_direction : TransformDirection
+            The transform direction i.e. forward implies pixel/line -> lon/lat/height
+            while reverse implies lon/lat/height -> pixel/line.
+        num_threads : int, optional
+            Large arrays may be split between this many threads, each with
+            its own copy of the transformer.
+
+        Raises
+        ------
+        ValueError
+            If transformer is NULL
+
+        Returns
+        -------
+        tuple of ndarray
+            Transformed coordinates and a boolean success mask.
+
+        """
+        return _transform_arrays(
+            self._handle(), xs, ys, zs, transform_direction, num_threads=num_threads,
+            method="RPCs")
+
     def _transform(self, xs, ys, zs, transform_direction):
         """
         General computation of dataset pixel/line <-> lon/lat/height coordinates using RPCs
@@ -159,60 +378,21 @@ cdef class RPCTransformerBase:
         When RPC_DEM option is used, height (zs) values in _transform are ignored by GDAL and instead sampled from a DEM
 
         """
-        if self._transformer == NULL:
-            raise ValueError("Unexpected NULL transformer")
-
-        cdef int i
-        cdef double *x = NULL
-        cdef double *y = NULL
-        cdef double *z = NULL
-        cdef int bDstToSrc = transform_direction
-        cdef int src_count
-        cdef int *panSuccess = NULL
-
-        n = len(xs)
-        x = <double *>CPLMalloc(n * sizeof(double))
-        y = <double *>CPLMalloc(n * sizeof(double))
-        z = <double *>CPLMalloc(n * sizeof(double))
-        panSuccess = <int *>CPLMalloc(n * sizeof(int))
-
-        for i in range(n):
-            x[i] = xs[i]
-            y[i] = ys[i]
-            z[i] = zs[i]
-
-        try:
-            err = GDALRPCTransform(self._transformer, bDstToSrc, n, x, y, z, panSuccess)
-            if err == GDALError.failure:
-                warnings.warn(
-                "Could not transform points using RPCs.",
-                TransformWarning)
-            res_xs = [0] * n
-            res_ys = [0] * n
-            res_zs = [0] * n
-            checked = False
-            for i in range(n):
-                # GDALRPCTransformer may return a success overall despite individual points failing. Warn once.
-                if not panSuccess[i] and not checked:
-                    warnings.warn(
-                    "One or more points could not be transformed using RPCs.",
-                    TransformWarning)
-                    checked = True
-                res_xs[i] = x[i]
-                res_ys[i] = y[i]
-                res_zs[i] = z[i]
-        finally:
-            CPLFree(x)
-            CPLFree(y)
-            CPLFree(z)
-            CPLFree(panSuccess)
-
-        return (res_xs, res_ys)
+        x, y, success = self._transform_arrays(xs, ys, zs, transform_direction)
+        # GDALRPCTransform may return a success overall despite individual points failing. Warn once.
+        if not success.all():
+            warnings.warn(
+            "One or more points could not be transformed using RPCs.",
+            TransformWarning)
+        return (x.tolist(), y.tolist())
 
     def close(self):
         """
         Destroy transformer
         """
+        if self._approx_transformer != NULL:
+            GDALDestroyApproxTransformer(self._approx_transformer)
+        self._approx_transformer = NULL
         if self._transformer != NULL:
             GDALDestroyRPCTransformer(self._transformer)
         self._transformer = NULL
@@ -228,16 +408,18 @@ cdef class RPCTransformerBase:
 
 cdef class GCPTransformerBase:
     cdef void *_transformer
+    cdef void *_approx_transformer
     cdef bint _closed
 
     def __cinit__(self):
         self._transformer = NULL
+        self._approx_transformer = NULL
         self._closed = True
 
     def __dealloc__(self):
         self.close()
 
-    def __init__(self, gcps):
+    def __init__(self, gcps, approx_error=None):
         """
         Construct a new GCP transformer
 
@@ -250,6 +432,13 @@ cdef class GCPTransformerBase:
         ----------
         gcps : a sequence of GroundControlPoint
             Ground Control Points for a dataset.
+        approx_error : float, optional
+            If given, the GCP interpolation is evaluated exactly only at
+            the ends and middle of rows of coordinates and linearly
+            interpolated between them, as long as the interpolation error
+            is less than this value, in units of the transformed
+            coordinates. See GDALCreateApproxTransformer. By default, the
+            GCP interpolation is evaluated for every coordinate.
         """
         cdef int bReversed = 1
         cdef int nReqOrder = 0  # let GDAL determine polynomial order
@@ -269,11 +458,60 @@ cdef class GCPTransformerBase:
                 gcplist[i].dfGCPZ = obj.z or 0.0
             self._transformer = exc_wrap_pointer(GDALCreateGCPTransformer(nGCPCount, gcplist, nReqOrder, bReversed))
             self._closed = False
+            if approx_error:
+                self._approx_transformer = exc_wrap_pointer(
+                    GDALCreateApproxTransformer(
+                        GDALGCPTransform, self._transformer, approx_error))
         finally:
             CPLFree(gcplist)
 
         self._env = ExitStack()
 
+    cdef _TransformerHandle _handle(self):
+        if self._transformer == NULL:
+            raise ValueError("Unexpected NULL transformer")
+
+        cdef _TransformerHandle handle = _TransformerHandle.__new__(_TransformerHandle)
+        if self._approx_transformer != NULL:
+            handle.pfnTransformer = GDALApproxTransform
+            handle.pTransformArg = self._approx_transformer
+            handle.by_row = True
+        else:
+            handle.pfnTransformer = GDALGCPTransform
+            handle.pTransformArg = self._transformer
+        return handle
+
+    def _transform_arrays(self, xs, ys, zs, transform_direction, num_threads=1):
+        """
+        Computation of dataset pixel/line <-> lon/lat/height coordinate arrays using GCPs
+
+        Parameters
+        ----------
+        xs, ys, zs : array_like
+            Coordinates to be transformed. May be either pixel/line/height or
+            lon/lat/height. zs may be None.
+        transform_direction : TransformDirection
+            The transform direction i.e. forward implies pixel/line -> lon/lat/height
+            while reverse implies lon/lat/height -> pixel/line.
+        num_threads : int, optional
+            Large arrays may be split between this many threads, each with
+            its own copy of the transformer.
+
+        Raises
+        ------
+        ValueError
+            If transformer is NULL
+
+        Returns
+        -------
+        tuple of ndarray
+            Transformed coordinates and a boolean success mask.
+
+        """
+        return _transform_arrays(
+            self._handle(), xs, ys, zs, transform_direction, num_threads=num_threads,
+            method="GCPs")
+
     def _transform(self, xs, ys, zs, transform_direction):
         """
         General computation of dataset pixel/line <-> lon/lat/height coordinates using GCPs
@@ -301,60 +539,21 @@ cdef class GCPTransformerBase:
         -------
         tuple of list
         """
-        if self._transformer == NULL:
-            raise ValueError("Unexpected NULL transformer")
-
-        cdef int i
-        cdef double *x = NULL
-        cdef double *y = NULL
-        cdef double *z = NULL
-        cdef int bDstToSrc = transform_direction
-        cdef int src_count
-        cdef int *panSuccess = NULL
-
-        n = len(xs)
-        x = <double *>CPLMalloc(n * sizeof(double))
-        y = <double *>CPLMalloc(n * sizeof(double))
-        z = <double *>CPLMalloc(n * sizeof(double))
-        panSuccess = <int *>CPLMalloc(n * sizeof(int))
-
-        for i in range(n):
-            x[i] = xs[i]
-            y[i] = ys[i]
-            z[i] = zs[i]
-
-        try:
-            err = GDALGCPTransform(self._transformer, bDstToSrc, n, x, y, z, panSuccess)
-            if err == GDALError.failure:
-                warnings.warn(
-                "Could not transform points using GCPs.",
-                TransformWarning)
-            res_xs = [0] * n
-            res_ys = [0] * n
-            res_zs = [0] * n
-            checked = False
-            for i in range(n):
-                # GDALGCPTransformer may return a success overall despite individual points failing. Warn once.
-                if not panSuccess[i] and not checked:
-                    warnings.warn(
-                    "One or more points could not be transformed using GCPs.",
-                    TransformWarning)
-                    checked = True
-                res_xs[i] = x[i]
-                res_ys[i] = y[i]
-                res_zs[i] = z[i]
-        finally:
-            CPLFree(x)
-            CPLFree(y)
-            CPLFree(z)
-            CPLFree(panSuccess)
-
-        return (res_xs, res_ys)
+        x, y, success = self._transform_arrays(xs, ys, zs, transform_direction)
+        # GDALGCPTransform may return a success overall despite individual points failing. Warn once.
+        if not success.all():
+            warnings.warn(
+            "One or more points could not be transformed using GCPs.",
+            TransformWarning)
+        return (x.tolist(), y.tolist())
 
     def close(self):
         """
         Destroy transformer
         """
+        if self._approx_transformer != NULL:
+            GDALDestroyApproxTransformer(self._approx_transformer)
+        self._approx_transformer = NULL
         if self._transformer != NULL:
             GDALDestroyGCPTransformer(self._transformer)
         self._transformer = NULL
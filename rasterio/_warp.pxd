@@ -23,6 +23,19 @@ cdef extern from "gdalwarper.h" nogil:
                         int nSrcXOff=0, int nSrcYOff=0,
                         int nSrcXSize=0, int nSrcYSize=0,
                         double dfProgressBase=0.0, double dfProgressScale=1.0)
+        int WarpRegion( int nDstXOff, int nDstYOff,
+                        int nDstXSize, int nDstYSize,
+                        int nSrcXOff, int nSrcYOff,
+                        int nSrcXSize, int nSrcYSize,
+                        double dfSrcXExtraSize, double dfSrcYExtraSize,
+                        double dfProgressBase, double dfProgressScale)
+        int ComputeSourceWindow( int nDstXOff, int nDstYOff,
+                                 int nDstXSize, int nDstYSize,
+                                 int *pnSrcXOff, int *pnSrcYOff,
+                                 int *pnSrcXSize, int *pnSrcYSize,
+                                 double *pdfSrcXExtraSize,
+                                 double *pdfSrcYExtraSize,
+                                 double *pdfSrcFillRatio)
         int WarpRegionToBuffer( int nDstXOff, int nDstYOff,
                                 int nDstXSize, int nDstYSize,
                                 void *pDataBuf,
@@ -4,6 +4,7 @@
 
 from collections import UserDict
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
 import logging
 import uuid
@@ -15,7 +16,7 @@ import numpy as np
 
 import rasterio
 from rasterio._base import _transform
-from rasterio._base cimport open_dataset
+from rasterio._base cimport open_dataset, progress_func, ProgressReporter
 from rasterio._err import (
     CPLE_BaseError, CPLE_IllegalArgError, CPLE_NotSupportedError,
     CPLE_AppDefinedError, CPLE_OpenFailedError)
@@ -23,27 +24,34 @@ from rasterio import dtypes
 from rasterio.control import GroundControlPoint
 from rasterio.enums import Resampling, MaskFlags, ColorInterp
 from rasterio.env import GDALVersion
+from rasterio._path import _UnparsedPath
 from rasterio.crs import CRS
 from rasterio.errors import (
     GDALOptionNotImplementedError,
     DriverRegistrationError, CRSError, RasterioIOError,
-    RasterioDeprecationWarning, WarpOptionsError, WarpedVRTError,
-    WarpOperationError)
+    RasterioDeprecationWarning, TransformError, WarpOptionsError,
+    WarpedVRTError, WarpOperationError)
 from rasterio.transform import Affine, from_bounds, guard_transform, tastes_like_gdal
 
 cimport cython
 cimport numpy as np
+from libc.limits cimport INT_MAX
 from libc.math cimport HUGE_VAL
 
 from rasterio._base cimport get_driver_name
 from rasterio._err cimport exc_wrap, exc_wrap_pointer, exc_wrap_int
 from rasterio._io cimport (
-    DatasetReaderBase, MemoryDataset, in_dtype_range, io_auto)
+    DatasetReaderBase, DatasetWriterBase, MemoryDataset, in_dtype_range,
+    io_auto)
 from rasterio._features cimport GeomBuilder, OGRGeomBuilder
 from rasterio.crs cimport CRS
 
 log = logging.getLogger(__name__)
 
+# Inputs are split between threads only if each thread gets at least
+# this many points.
+cdef Py_ssize_t MIN_POINTS_PER_THREAD = 65536
+
 # Gauss (7) is not supported for warp
 SUPPORTED_RESAMPLING = [r for r in Resampling if r.value != 7 and r.value <= 13]
 # rms supported since GDAL 3.3
@@ -91,39 +99,8 @@ def _transform_geom(
         src_crs, dst_crs, geom, antimeridian_cutting, antimeridian_offset,
         int precision):
     """Return a transformed geometry."""
-    cdef char **options = NULL
-    cdef OGRCoordinateTransformationH transform = NULL
-    cdef OGRGeometryFactory *factory = NULL
-
-    cdef CRS src = CRS.from_user_input(src_crs)
-    cdef CRS dst = CRS.from_user_input(dst_crs)
-
-    transform = exc_wrap_pointer(OCTNewCoordinateTransformation(src._osr, dst._osr))
-
-    # GDAL cuts on the antimeridian by default and using different
-    # logic in versions >= 2.2.
-    if GDALVersion().runtime() < GDALVersion.parse('2.2'):
-        valb = str(antimeridian_offset).encode('utf-8')
-        options = CSLSetNameValue(options, "DATELINEOFFSET", <const char *>valb)
-        if antimeridian_cutting:
-            options = CSLSetNameValue(options, "WRAPDATELINE", "YES")
-
-    factory = new OGRGeometryFactory()
-    try:
-        if isinstance(geom, (dict, Mapping, UserDict)) or hasattr(geom, "__geo_interface__"):
-            out_geom = _transform_single_geom(geom, factory, transform, options, precision)
-        else:
-            out_geom = [
-                _transform_single_geom(single_geom, factory, transform, options, precision)
-                for single_geom in geom
-            ]
-    finally:
-        del factory
-        OCTDestroyCoordinateTransformation(transform)
-        if options != NULL:
-            CSLDestroy(options)
-
-    return out_geom
+    return CRSTransformerBase(src_crs, dst_crs)._transform_geom(
+        geom, antimeridian_cutting, antimeridian_offset, precision)
 
 cdef GDALWarpOptions * create_warp_options(
         GDALResampleAlg resampling, object src_nodata, object dst_nodata, int src_count,
@@ -213,6 +190,83 @@ cdef GDALWarpOptions * create_warp_options(
     return psWOptions
 
 
+def _format_transform(in_transform):
+    if not in_transform:
+        return in_transform
+    in_transform = guard_transform(in_transform)
+    # If working with identity transform, assume it is crs-less data
+    # and that translating the matrix very slightly will avoid #674 and #1272
+    eps = 1e-100
+    if in_transform.almost_equals(identity) or in_transform.almost_equals(Affine(1, 0, 0, 0, -1, 0)):
+        in_transform = in_transform.translation(eps, eps)
+    return in_transform
+
+
+cdef void *_create_transformer(
+        GDALDatasetH src_dataset, GDALDatasetH dst_dataset, object rpcs,
+        object kwargs, bint *use_approx) except NULL:
+    """Return an image to image transformer for warping
+
+    This is used in _reproject() and WarpPlanBase. The transformer is
+    wrapped in an approximate transformer unless RPCs are used with a
+    DEM or coordinate operation. use_approx is set accordingly.
+
+    """
+    cdef char **imgProjOptions = NULL
+    cdef void *hTransformArg = NULL
+    cdef void *hApproxTransformArg = NULL
+    cdef double tolerance = 0.125
+
+    use_approx[0] = True
+
+    # Set up GDALCreateGenImgProjTransformer2 keyword arguments.
+    imgProjOptions = CSLSetNameValue(imgProjOptions, "GCPS_OK", "TRUE")
+    if rpcs:
+        imgProjOptions = CSLSetNameValue(imgProjOptions, "SRC_METHOD", "RPC")
+
+    # See https://gdal.org/doxygen/gdal__alg_8h.html#a94cd172f78dbc41d6f407d662914f2e3
+    # for a list of supported options. I (Sean) don't see harm in
+    # copying all the function's keyword arguments to the image to
+    # image transformer options mapping; unsupported options should be
+    # okay.
+    for key, val in kwargs.items():
+        key = key.upper().encode('utf-8')
+        if key in {b"RPC_DEM", b"COORDINATE_OPERATION"}:
+            # don't .upper() since might be a path
+            val = str(val).encode('utf-8')
+
+            if rpcs:
+                use_approx[0] = False
+        else:
+            val = str(val).upper().encode('utf-8')
+        imgProjOptions = CSLSetNameValue(
+            imgProjOptions, <const char *>key, <const char *>val)
+        log.debug("Set _reproject Transformer option {0!r}={1!r}".format(key, val))
+
+    try:
+        hTransformArg = exc_wrap_pointer(
+            GDALCreateGenImgProjTransformer2(
+                src_dataset, dst_dataset, imgProjOptions))
+        if not use_approx[0]:
+            log.debug("Created exact transformer")
+            return hTransformArg
+
+        hApproxTransformArg = exc_wrap_pointer(
+            GDALCreateApproxTransformer(
+                GDALGenImgProjTransform, hTransformArg, tolerance))
+        GDALApproxTransformerOwnsSubtransformer(hApproxTransformArg, 1)
+        log.debug("Created approximate transformer")
+        return hApproxTransformArg
+
+    except:
+        if hTransformArg != NULL:
+            GDALDestroyGenImgProjTransformer(hTransformArg)
+        raise
+
+    finally:
+        CSLDestroy(imgProjOptions)
+
+
 def _reproject(
         source, destination,
         src_transform=None,
@@ -230,6 +284,9 @@ def _reproject(
         num_threads=1,
         warp_mem_limit=0,
         working_data_type=0,
+        plan=None,
+        progress=None,
+        cancel=None,
         **kwargs):
     """
     Reproject a source raster to a destination raster.
@@ -304,6 +361,15 @@ def _reproject(
         56 MB. The default (0) means 64 MB with GDAL 2.2.
         The warp operation's memory limit in MB. The default (0)
         means 64 MB with GDAL 2.2.
+    plan : WarpPlanBase, optional
+        A plan whose transformer and chunk layout are used instead of
+        creating new ones. Its geometry must match the source and
+        destination.
+    progress : callable, optional
+        Called with the completed fraction of the warp and its
+        throughput in pixels per second.
+    cancel : CancellationToken, optional
+        Stops the warp when cancelled.
     kwargs:  dict, optional
         Additional arguments passed to both the image to image
         transformer GDALCreateGenImgProjTransformer2() (for example,
@@ -321,11 +387,11 @@ def _reproject(
     cdef char **warp_extras = NULL
     cdef const char* pszWarpThread = NULL
     cdef int i
-    cdef double tolerance = 0.125
     cdef void *hTransformArg = NULL
     cdef GDALTransformerFunc pfnTransformer = NULL
     cdef GDALWarpOptions *psWOptions = NULL
     cdef bint bUseApproxTransformer = True
+    cdef bint bOwnsTransformer = plan is None
 
     # Validate nodata values immediately.
     if src_nodata is not None:
@@ -338,17 +404,6 @@ def _reproject(
             raise ValueError("dst_nodata must be in valid range for "
                              "destination dtype")
 
-    def format_transform(in_transform):
-        if not in_transform:
-            return in_transform
-        in_transform = guard_transform(in_transform)
-        # If working with identity transform, assume it is crs-less data
-        # and that translating the matrix very slightly will avoid #674 and #1272
-        eps = 1e-100
-        if in_transform.almost_equals(identity) or in_transform.almost_equals(Affine(1, 0, 0, 0, -1, 0)):
-            in_transform = in_transform.translation(eps, eps)
-        return in_transform
-
     cdef MemoryDataset mem_raster = None
     cdef MemoryDataset src_mem = None
 
@@ -371,7 +426,7 @@ def _reproject(
             src_count = source.shape[0]
             src_bidx = range(1, src_count + 1)
             src_mem = MemoryDataset(source,
-                                         transform=format_transform(src_transform),
+                                         transform=_format_transform(src_transform),
                                          gcps=gcps,
                                          rpcs=rpcs,
                                          crs=src_crs, 
@@ -419,7 +474,7 @@ def _reproject(
                     raise ValueError("Invalid destination shape")
                 dst_bidx = src_bidx
 
-            mem_raster = MemoryDataset(destination, transform=format_transform(dst_transform), crs=dst_crs)
+            mem_raster = MemoryDataset(destination, transform=_format_transform(dst_transform), crs=dst_crs)
             dst_dataset = mem_raster.handle()
 
             if dst_alpha:
@@ -459,54 +514,22 @@ def _reproject(
             mem_raster = None
         raise
 
-    # Set up GDALCreateGenImgProjTransformer2 keyword arguments.
-    cdef char **imgProjOptions = NULL
-    imgProjOptions = CSLSetNameValue(imgProjOptions, "GCPS_OK", "TRUE")
-    if rpcs:
-        imgProjOptions = CSLSetNameValue(imgProjOptions, "SRC_METHOD", "RPC")
-
-    # See https://gdal.org/doxygen/gdal__alg_8h.html#a94cd172f78dbc41d6f407d662914f2e3
-    # for a list of supported options. I (Sean) don't see harm in
-    # copying all the function's keyword arguments to the image to
-    # image transformer options mapping; unsupported options should be
-    # okay.
-    for key, val in kwargs.items():
-        key = key.upper().encode('utf-8')
-        if key in {b"RPC_DEM", b"COORDINATE_OPERATION"}:
-            # don't .upper() since might be a path
-            val = str(val).encode('utf-8')
-
-            if rpcs:
-                bUseApproxTransformer = False
+    try:
+        if plan is None:
+            hTransformArg = _create_transformer(
+                src_dataset, dst_dataset, rpcs, kwargs, &bUseApproxTransformer)
         else:
-            val = str(val).upper().encode('utf-8')
-        imgProjOptions = CSLSetNameValue(
-            imgProjOptions, <const char *>key, <const char *>val)
-        log.debug("Set _reproject Transformer option {0!r}={1!r}".format(key, val))
+            hTransformArg = (<WarpPlanBase?>plan)._handle()
+            bUseApproxTransformer = (<WarpPlanBase>plan)._approx
 
-    try:
-        hTransformArg = exc_wrap_pointer(
-            GDALCreateGenImgProjTransformer2(
-                src_dataset, dst_dataset, imgProjOptions))
         if bUseApproxTransformer:
-            hTransformArg = exc_wrap_pointer(
-                GDALCreateApproxTransformer(
-                    GDALGenImgProjTransform, hTransformArg, tolerance))
             pfnTransformer = GDALApproxTransform
-            GDALApproxTransformerOwnsSubtransformer(hTransformArg, 1)
-            log.debug("Created approximate transformer")
         else:
             pfnTransformer = GDALGenImgProjTransform
-            log.debug("Created exact transformer")
 
         log.debug("Created transformer and options.")
 
     except:
-        if bUseApproxTransformer:
-            GDALDestroyApproxTransformer(hTransformArg)
-        else:
-            GDALDestroyGenImgProjTransformer(hTransformArg)
-        CPLFree(imgProjOptions)
         if src_mem is not None:
             src_mem.close()
             src_mem = None
@@ -563,25 +586,55 @@ def _reproject(
     cdef GDALWarpOperation oWarper
     cdef int rows
     cdef int cols
+    cdef int dst_xoff, dst_yoff, dst_xsize, dst_ysize
+    cdef int src_xoff, src_yoff, src_xsize, src_ysize
+    cdef double src_xextra, src_yextra
+    cdef double progress_base = 0.0
+    cdef double progress_scale = 1.0
+    cdef ProgressReporter reporter = None
+
+    if isinstance(destination, tuple):
+        rows, cols = destination[3]
+    else:
+        rows, cols = destination.shape[-2:]
+
+    if progress is not None or cancel is not None:
+        reporter = ProgressReporter(
+            progress, cancel, pixels=<double>rows * cols * src_count)
+        psWOptions.pfnProgress = <void *>progress_func
+        psWOptions.pProgressArg = reporter.arg()
 
     try:
         exc_wrap_int(oWarper.Initialize(psWOptions))
-        if isinstance(destination, tuple):
-            rows, cols = destination[3]
-        else:
-            rows, cols = destination.shape[-2:]
 
         log.debug(
             "Chunk and warp window: %d, %d, %d, %d.",
             0, 0, cols, rows)
 
-        if num_threads > 1:
+        if plan is not None:
+            err = 0
+            for chunk in (<WarpPlanBase>plan)._get_chunks(&oWarper, cols, rows):
+                (dst_xoff, dst_yoff, dst_xsize, dst_ysize, src_xoff, src_yoff,
+                 src_xsize, src_ysize, src_xextra, src_yextra) = chunk
+                progress_scale = <double>dst_xsize * dst_ysize / (<double>cols * rows)
+                with nogil:
+                    err = oWarper.WarpRegion(
+                        dst_xoff, dst_yoff, dst_xsize, dst_ysize, src_xoff,
+                        src_yoff, src_xsize, src_ysize, src_xextra, src_yextra,
+                        progress_base, progress_scale)
+                progress_base += progress_scale
+                if err:
+                    break
+        elif num_threads > 1:
             with nogil:
                 err = oWarper.ChunkAndWarpMulti(0, 0, cols, rows)
         else:
             with nogil:
                 err = oWarper.ChunkAndWarpImage(0, 0, cols, rows)
 
+        if reporter is not None:
+            reporter.raise_if_stopped()
+
         try:
             exc_wrap_int(err)
         except CPLE_BaseError as base:
@@ -592,13 +645,13 @@ def _reproject(
 
     # Clean up transformer, warp options, and dataset handles.
     finally:
-        if bUseApproxTransformer:
-            GDALDestroyApproxTransformer(hTransformArg)
-        else:
-            GDALDestroyGenImgProjTransformer(hTransformArg)
+        if bOwnsTransformer:
+            if bUseApproxTransformer:
+                GDALDestroyApproxTransformer(hTransformArg)
+            else:
+                GDALDestroyGenImgProjTransformer(hTransformArg)
 
         GDALDestroyWarpOptions(psWOptions)
-        CPLFree(imgProjOptions)
 
         if mem_raster is not None:
             mem_raster.close()
@@ -607,6 +660,170 @@ def _reproject(
             src_mem.close()
 
 
+cdef _collect_chunks(
+        GDALWarpOperation *warper, int xoff, int yoff, int xsize, int ysize,
+        double memory_limit, int src_pixel_bits, int dst_pixel_bits,
+        list chunks):
+    """Split a destination window into chunks that fit in memory
+
+    Chunks are appended to the list as tuples of destination window,
+    source window, and extra source sizes, the arguments of
+    GDALWarpOperation::WarpRegion(). The window is split in halves
+    along its longer side, like GDAL's own chunking.
+
+    """
+    cdef int src_xoff = 0
+    cdef int src_yoff = 0
+    cdef int src_xsize = 0
+    cdef int src_ysize = 0
+    cdef double src_xextra = 0.0
+    cdef double src_yextra = 0.0
+    cdef double fill_ratio = 0.0
+    cdef int half
+
+    exc_wrap_int(
+        warper.ComputeSourceWindow(
+            xoff, yoff, xsize, ysize, &src_xoff, &src_yoff, &src_xsize,
+            &src_ysize, &src_xextra, &src_yextra, &fill_ratio))
+
+    memory = (
+        <double>src_xsize * src_ysize * src_pixel_bits
+        + <double>xsize * ysize * dst_pixel_bits) / 8
+
+    if memory > memory_limit and (xsize > 2 or ysize > 2):
+        if xsize > ysize:
+            half = xsize // 2
+            _collect_chunks(
+                warper, xoff, yoff, half, ysize, memory_limit,
+                src_pixel_bits, dst_pixel_bits, chunks)
+            _collect_chunks(
+                warper, xoff + half, yoff, xsize - half, ysize, memory_limit,
+                src_pixel_bits, dst_pixel_bits, chunks)
+        else:
+            half = ysize // 2
+            _collect_chunks(
+                warper, xoff, yoff, xsize, half, memory_limit,
+                src_pixel_bits, dst_pixel_bits, chunks)
+            _collect_chunks(
+                warper, xoff, yoff + half, xsize, ysize - half, memory_limit,
+                src_pixel_bits, dst_pixel_bits, chunks)
+    else:
+        chunks.append(
+            (xoff, yoff, xsize, ysize, src_xoff, src_yoff, src_xsize,
+             src_ysize, src_xextra, src_yextra))
+
+
+cdef class WarpPlanBase:
+    """Transformer and chunk layout of a reprojection between two grids
+
+    The image to image transformer is created once. The chunks of the
+    warp and their source windows are computed on first use and cached
+    for each band count, working data type, and memory limit.
+    """
+
+    cdef void *_hTransformArg
+    cdef bint _approx
+    cdef object _chunks
+    cdef readonly object src_shape
+    cdef readonly object src_transform
+    cdef readonly object src_crs
+    cdef readonly object dst_shape
+    cdef readonly object dst_transform
+    cdef readonly object dst_crs
+    cdef readonly object gcps
+    cdef readonly object rpcs
+
+    def __cinit__(self):
+        self._hTransformArg = NULL
+        self._approx = False
+        self._chunks = {}
+
+    def __dealloc__(self):
+        self.close()
+
+    def __init__(
+            self, src_shape, src_transform, src_crs, dst_shape,
+            dst_transform, dst_crs, gcps=None, rpcs=None, **kwargs):
+        cdef DatasetWriterBase src_mem = None
+        cdef DatasetWriterBase dst_mem = None
+
+        if not src_crs:
+            raise CRSError("Missing src_crs.")
+        if not dst_crs:
+            raise CRSError("Missing dst_crs.")
+
+        self.src_shape = tuple(src_shape)
+        self.src_transform = src_transform
+        self.src_crs = CRS.from_user_input(src_crs)
+        self.dst_shape = tuple(dst_shape)
+        self.dst_transform = dst_transform
+        self.dst_crs = CRS.from_user_input(dst_crs)
+        self.gcps = gcps
+        self.rpcs = rpcs
+
+        # The transformer reads the georeferencing and extent of these
+        # band-less datasets and keeps no reference to them. The extent
+        # matters: PROJ may pick a different pipeline for a different
+        # area of use.
+        src_height, src_width = self.src_shape[-2:]
+        dst_height, dst_width = self.dst_shape[-2:]
+        try:
+            src_mem = DatasetWriterBase(
+                _UnparsedPath(f"/vsimem/warpplan-{uuid.uuid4().hex}"), "w",
+                driver="MEM", count=0, width=src_width, height=src_height,
+                dtype="uint8", transform=_format_transform(src_transform),
+                crs=self.src_crs, gcps=gcps, rpcs=rpcs)
+            dst_mem = DatasetWriterBase(
+                _UnparsedPath(f"/vsimem/warpplan-{uuid.uuid4().hex}"), "w",
+                driver="MEM", count=0, width=dst_width, height=dst_height,
+                dtype="uint8", transform=_format_transform(dst_transform),
+                crs=self.dst_crs)
+            self._hTransformArg = _create_transformer(
+                src_mem.handle(), dst_mem.handle(), rpcs, kwargs, &self._approx)
+        finally:
+            if src_mem is not None:
+                src_mem.close()
+            if dst_mem is not None:
+                dst_mem.close()
+
+    def close(self):
+        """Destroy the transformer"""
+        if self._hTransformArg != NULL:
+            if self._approx:
+                GDALDestroyApproxTransformer(self._hTransformArg)
+            else:
+                GDALDestroyGenImgProjTransformer(self._hTransformArg)
+        self._hTransformArg = NULL
+        self._chunks = {}
+
+    @property
+    def closed(self):
+        """Whether the transformer has been destroyed"""
+        return self._hTransformArg == NULL
+
+    cdef void *_handle(self) except NULL:
+        if self._hTransformArg == NULL:
+            raise ValueError("WarpPlan is closed")
+        return self._hTransformArg
+
+    cdef list _get_chunks(self, GDALWarpOperation *warper, int cols, int rows):
+        cdef const GDALWarpOptions *options = warper.GetOptions()
+        cdef int pixel_bits = (
+            GDALGetDataTypeSizeBits(options.eWorkingDataType) * options.nBandCount)
+
+        key = (cols, rows, pixel_bits, options.dfWarpMemoryLimit)
+        chunks = self._chunks.get(key)
+        if chunks is None:
+            chunks = []
+            # One more bit per pixel for the validity masks.
+            _collect_chunks(
+                warper, 0, 0, cols, rows, options.dfWarpMemoryLimit,
+                pixel_bits + 1, pixel_bits + 1, chunks)
+            self._chunks[key] = chunks
+            log.debug("Collected %d warp chunks.", len(chunks))
+        return chunks
+
+
 def _calculate_default_transform(
     src_crs,
     dst_crs,
@@ -1431,8 +1648,6 @@ cdef double antimeridian_max(data):
 
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
 def _transform_bounds(
     CRS src_crs,
     CRS dst_crs,
@@ -1442,19 +1657,185 @@ def _transform_bounds(
     double top,
     int densify_pts,
 ):
-    IF (CTE_GDAL_MAJOR_VERSION, CTE_GDAL_MINOR_VERSION) >= (3, 4):
-        cdef double out_left = np.inf
-        cdef double out_bottom = np.inf
-        cdef double out_right = np.inf
-        cdef double out_top = np.inf
-        cdef OGRCoordinateTransformationH transform = NULL
-        transform = OCTNewCoordinateTransformation(src_crs._osr, dst_crs._osr)
-        transform = exc_wrap_pointer(transform)
-
-        # OCTTransformBounds() returns TRUE/FALSE contrary to most GDAL API functions
-        cdef int status = 0
+    """Return transformed bounds."""
+    return CRSTransformerBase(src_crs, dst_crs)._transform_bounds(
+        left, bottom, right, top, densify_pts)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _transform_arrays(CRSTransformerBase transformer, double[::1] x, double[::1] y, double[::1] z=None):
+    """Transform coordinates in place without the GIL."""
+    cdef OGRCoordinateTransformationH transform = transformer._handle()
+    cdef Py_ssize_t n = x.shape[0]
+    cdef Py_ssize_t start = 0
+    cdef int count = 0
+    cdef int success = 1
+    cdef bint has_z = z is not None
+    cdef double *z_ptr = NULL
+
+    # Bounds are not checked below.
+    if y.shape[0] != n or (has_z and z.shape[0] != n):
+        raise TransformError("xs, ys, and zs arrays must be the same size")
+
+    with nogil:
+        # OCTTransform() counts points with an int.
+        while start < n and success:
+            count = <int>min(n - start, <Py_ssize_t>INT_MAX)
+            if has_z:
+                z_ptr = &z[start]
+            success = OCTTransform(transform, count, &x[start], &y[start], z_ptr)
+            start += count
+
+    # OCTTransform() returns TRUE/FALSE contrary to most GDAL API functions
+    exc_wrap_int(success == 0)
+
+
+cdef class CRSTransformerBase:
+    """Transformation of coordinates between two CRS
+
+    Holds an OGR coordinate transformation so that its PROJ pipeline is
+    set up once and reused. Not safe to share between threads.
+    """
+
+    cdef OGRCoordinateTransformationH _osr_transform
+    cdef readonly object src_crs
+    cdef readonly object dst_crs
+
+    def __cinit__(self):
+        self._osr_transform = NULL
+
+    def __dealloc__(self):
+        self.close()
+
+    def __init__(self, src_crs, dst_crs):
+        cdef CRS src = CRS.from_user_input(src_crs)
+        cdef CRS dst = CRS.from_user_input(dst_crs)
+
+        self._osr_transform = exc_wrap_pointer(
+            OCTNewCoordinateTransformation(src._osr, dst._osr))
+        self.src_crs = src
+        self.dst_crs = dst
+
+    def close(self):
+        """Destroy the coordinate transformation"""
+        if self._osr_transform != NULL:
+            OCTDestroyCoordinateTransformation(self._osr_transform)
+        self._osr_transform = NULL
+
+    @property
+    def closed(self):
+        """Whether the coordinate transformation has been destroyed"""
+        return self._osr_transform == NULL
+
+    cdef OGRCoordinateTransformationH _handle(self) except NULL:
+        if self._osr_transform == NULL:
+            raise ValueError("Transformer is closed")
+        return self._osr_transform
+
+    def _transform(self, xs, ys, zs, num_threads=1):
+        """Transform arrays or sequences of coordinates.
 
+        The coordinates are copied once into float64 arrays and
+        transformed without the GIL. Large inputs may be split between
+        threads, each with its own coordinate transformation.
+
+        Returns
+        -------
+        tuple of ndarray or tuple of list
+            Arrays with the shape of xs if xs is an ndarray, otherwise
+            lists.
+        """
+        self._handle()
+
+        as_arrays = isinstance(xs, np.ndarray)
+        shape = np.shape(xs)
+        if np.shape(ys) != shape or (zs is not None and np.shape(zs) != shape):
+            raise TransformError("xs, ys, and zs arrays must have the same shape")
+        x = np.array(xs, dtype=np.float64).reshape(-1)
+        y = np.array(ys, dtype=np.float64).reshape(-1)
+        z = None if zs is None else np.array(zs, dtype=np.float64).reshape(-1)
+        n = x.shape[0]
+
+        num_threads = min(num_threads, n // MIN_POINTS_PER_THREAD)
+        if num_threads > 1:
+            offsets = np.linspace(0, n, num_threads + 1).astype(np.intp)
+            transformers = [self] + [
+                CRSTransformerBase(self.src_crs, self.dst_crs)
+                for _ in range(num_threads - 1)]
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                futures = [
+                    executor.submit(
+                        _transform_arrays, transformer, x[start:stop], y[start:stop],
+                        None if z is None else z[start:stop])
+                    for transformer, start, stop in zip(transformers, offsets[:-1], offsets[1:])]
+                for future in futures:
+                    future.result()
+        elif n > 0:
+            _transform_arrays(self, x, y, z)
+
+        results = (x, y) if z is None else (x, y, z)
+        if as_arrays:
+            return tuple(arr.reshape(shape) for arr in results)
+        else:
+            return tuple(arr.tolist() for arr in results)
+
+    def _transform_geom(
+            self, geom, antimeridian_cutting, antimeridian_offset,
+            int precision):
+        """Return a transformed geometry."""
+        cdef char **options = NULL
+        cdef OGRCoordinateTransformationH transform = self._handle()
+        cdef OGRGeometryFactory *factory = NULL
+
+        # GDAL cuts on the antimeridian by default and using different
+        # logic in versions >= 2.2.
+        if GDALVersion().runtime() < GDALVersion.parse('2.2'):
+            valb = str(antimeridian_offset).encode('utf-8')
+            options = CSLSetNameValue(options, "DATELINEOFFSET", <const char *>valb)
+            if antimeridian_cutting:
+                options = CSLSetNameValue(options, "WRAPDATELINE", "YES")
+
+        factory = new OGRGeometryFactory()
         try:
+            if isinstance(geom, (dict, Mapping, UserDict)) or hasattr(geom, "__geo_interface__"):
+                out_geom = _transform_single_geom(geom, factory, transform, options, precision)
+            else:
+                out_geom = [
+                    _transform_single_geom(single_geom, factory, transform, options, precision)
+                    for single_geom in geom
+                ]
+        finally:
+            del factory
+            if options != NULL:
+                CSLDestroy(options)
+
+        return out_geom
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def _transform_bounds(
+        self,
+        double left,
+        double bottom,
+        double right,
+        double top,
+        int densify_pts,
+    ):
+        """Return transformed bounds."""
+        cdef OGRCoordinateTransformationH transform = self._handle()
+        cdef CRS src_crs = self.src_crs
+        cdef CRS dst_crs = self.dst_crs
+
+        IF (CTE_GDAL_MAJOR_VERSION, CTE_GDAL_MINOR_VERSION) >= (3, 4):
+            cdef double out_left = np.inf
+            cdef double out_bottom = np.inf
+            cdef double out_right = np.inf
+            cdef double out_top = np.inf
+
+            # OCTTransformBounds() returns TRUE/FALSE contrary to most GDAL API functions
+            cdef int status = 0
+
             status = OCTTransformBounds(
                 transform,
                 left, bottom, right, top,
@@ -1462,74 +1843,72 @@ def _transform_bounds(
                 densify_pts
             )
             exc_wrap_int(status == 0)
-        finally:
-            OCTDestroyCoordinateTransformation(transform)
-        return out_left, out_bottom, out_right, out_top
+            return out_left, out_bottom, out_right, out_top
 
-    ELSE:
-        if src_crs == dst_crs:
-            return (left, bottom, right, top)
+        ELSE:
+            if src_crs == dst_crs:
+                return (left, bottom, right, top)
 
-        if densify_pts < 0:
-            raise ValueError("densify_pts must be positive")
+            if densify_pts < 0:
+                raise ValueError("densify_pts must be positive")
 
-        cdef bint degree_output = dst_crs.is_geographic
-        cdef bint degree_input = src_crs.is_geographic
+            cdef bint degree_output = dst_crs.is_geographic
+            cdef bint degree_input = src_crs.is_geographic
 
-        if degree_output and densify_pts < 2:
-            raise ValueError("densify_pts must be 2+ for degree output")
+            if degree_output and densify_pts < 2:
+                raise ValueError("densify_pts must be 2+ for degree output")
 
-        cdef int side_pts = densify_pts + 1  # add one because we are densifying
-        cdef int boundary_len = side_pts * 4
-        x_boundary_array = np.empty(boundary_len, dtype=np.float64)
-        y_boundary_array = np.empty(boundary_len, dtype=np.float64)
-        cdef double delta_x = 0
-        cdef double delta_y = 0
-        cdef int iii = 0
+            cdef int side_pts = densify_pts + 1  # add one because we are densifying
+            cdef int boundary_len = side_pts * 4
+            x_boundary_array = np.empty(boundary_len, dtype=np.float64)
+            y_boundary_array = np.empty(boundary_len, dtype=np.float64)
+            cdef double delta_x = 0
+            cdef double delta_y = 0
+            cdef int iii = 0
 
-        if degree_input and right < left:
-            # handle antimeridian
-            delta_x = (right - left + 360.0) / side_pts
-        else:
-            delta_x = (right - left) / side_pts
-        if degree_input and top < bottom:
-            # handle antimeridian
-            # depending on the axis order, longitude has the potential
-            # to be on the y axis. It shouldn't reach here if it is latitude.
-            delta_y = (top - bottom + 360.0) / side_pts
-        else:
-            delta_y = (top - bottom) / side_pts
-
-        # build densified bounding box
-        # Note: must be a linear ring for antimeridian logic
-        for iii in range(side_pts):
-            # left boundary
-            y_boundary_array[iii] = top - iii * delta_y
-            x_boundary_array[iii] = left
-            # bottom boundary
-            y_boundary_array[iii + side_pts] = bottom
-            x_boundary_array[iii + side_pts] = left + iii * delta_x
-            # right boundary
-            y_boundary_array[iii + side_pts * 2] = bottom + iii * delta_y
-            x_boundary_array[iii + side_pts * 2] = right
-            # top boundary
-            y_boundary_array[iii + side_pts * 3] = top
-            x_boundary_array[iii + side_pts * 3] = right - iii * delta_x
-
-        x_boundary_array, y_boundary_array = _transform(
-            src_crs, dst_crs, x_boundary_array, y_boundary_array, None,
-        )
+            if degree_input and right < left:
+                # handle antimeridian
+                delta_x = (right - left + 360.0) / side_pts
+            else:
+                delta_x = (right - left) / side_pts
+            if degree_input and top < bottom:
+                # handle antimeridian
+                # depending on the axis order, longitude has the potential
+                # to be on the y axis. It shouldn't reach here if it is latitude.
+                delta_y = (top - bottom + 360.0) / side_pts
+            else:
+                delta_y = (top - bottom) / side_pts
+
+            # build densified bounding box
+            # Note: must be a linear ring for antimeridian logic
+            for iii in range(side_pts):
+                # left boundary
+                y_boundary_array[iii] = top - iii * delta_y
+                x_boundary_array[iii] = left
+                # bottom boundary
+                y_boundary_array[iii + side_pts] = bottom
+                x_boundary_array[iii + side_pts] = left + iii * delta_x
+                # right boundary
+                y_boundary_array[iii + side_pts * 2] = bottom + iii * delta_y
+                x_boundary_array[iii + side_pts * 2] = right
+                # top boundary
+                y_boundary_array[iii + side_pts * 3] = top
+                x_boundary_array[iii + side_pts * 3] = right - iii * delta_x
+
+            x_boundary_array, y_boundary_array = self._transform(
+                x_boundary_array, y_boundary_array, None,
+            )
 
-        if degree_output:
-            left = antimeridian_min(x_boundary_array)
-            right = antimeridian_max(x_boundary_array)
-        else:
-            x_boundary_array = np.ma.masked_invalid(x_boundary_array, copy=False)
-            left = x_boundary_array.min()
-            right = x_boundary_array.max()
+            if degree_output:
+                left = antimeridian_min(x_boundary_array)
+                right = antimeridian_max(x_boundary_array)
+            else:
+                x_boundary_array = np.ma.masked_invalid(x_boundary_array, copy=False)
+                left = x_boundary_array.min()
+                right = x_boundary_array.max()
 
-        y_boundary_array = np.ma.masked_invalid(y_boundary_array, copy=False)
-        bottom = y_boundary_array.min()
-        top = y_boundary_array.max()
+            y_boundary_array = np.ma.masked_invalid(y_boundary_array, copy=False)
+            bottom = y_boundary_array.min()
+            top = y_boundary_array.max()
 
-        return left, bottom, right, top
+            return left, bottom, right, top
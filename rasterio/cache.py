@@ -0,0 +1,185 @@
+"""A process-wide cache of dataset header metadata
+
+Opening a dataset queries GDAL for its driver, shape, data types,
+nodata values, CRS, transform and other header metadata, and parses
+the CRS WKT. Applications that open the same files again and again
+can enable a cache of this metadata. Datasets opened in read mode
+while the cache is enabled take their metadata from the cache instead
+of querying GDAL. GDAL still opens the file.
+
+Entries are keyed by the dataset's path, its size, its modification
+time, its ETag if the file is on a network filesystem, the allowed
+drivers, and the open options. A file that is modified gets a new
+entry, and the entries of a file are discarded when rasterio opens it
+for writing and when it closes it. Datasets in memory or in Python file objects are not cached.
+
+The cache is disabled by default.
+
+Examples
+--------
+
+>>> import rasterio.cache
+>>> rasterio.cache.enable_metadata_cache(maxsize=1024)
+>>> with rasterio.open("tests/data/RGB.byte.tif") as src:
+...     profile = src.profile
+...
+>>> with rasterio.open("tests/data/RGB.byte.tif") as src:
+...     profile = src.profile
+...
+>>> rasterio.cache.metadata_cache_info()
+CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+
+"""
+
+from collections import namedtuple, OrderedDict
+import threading
+
+import attr
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+@attr.s(slots=True, frozen=True)
+class DatasetMetadata:
+    """Header metadata of a dataset.
+
+    Attributes
+    ----------
+    driver : str
+    count, width, height : int
+    transform : tuple of float
+        GDAL geotransform.
+    crs : CRS or None
+    dtypes, nodatavals, block_shapes, descriptions, units, scales, offsets : tuple
+        One item per band.
+    overviews : tuple of tuple
+        Overview factors of each band.
+    tags : dict
+        Tags keyed by (band index, namespace). Band index 0 and
+        namespace None are the dataset and the default namespace.
+
+    """
+    driver = attr.ib()
+    count = attr.ib()
+    width = attr.ib()
+    height = attr.ib()
+    transform = attr.ib()
+    crs = attr.ib()
+    dtypes = attr.ib()
+    nodatavals = attr.ib()
+    block_shapes = attr.ib()
+    descriptions = attr.ib()
+    units = attr.ib()
+    scales = attr.ib()
+    offsets = attr.ib()
+    overviews = attr.ib()
+    tags = attr.ib()
+
+
+class MetadataCache:
+    """A thread-safe LRU mapping of keys to DatasetMetadata."""
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, filename):
+        """Discard the entries of a file."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == filename]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+# The enabled cache, or None.
+_metadata_cache = None
+
+
+def enable_metadata_cache(maxsize=1024):
+    """Enable the process-wide metadata cache.
+
+    If the cache is already enabled, its entries are kept and its size
+    limit is changed.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of cached datasets. The least recently used
+        entries are evicted first.
+
+    Returns
+    -------
+    None
+
+    """
+    global _metadata_cache
+    if _metadata_cache is None:
+        _metadata_cache = MetadataCache(maxsize)
+    elif maxsize < 1:
+        raise ValueError("maxsize must be a positive integer")
+    else:
+        _metadata_cache.maxsize = maxsize
+
+
+def disable_metadata_cache():
+    """Disable the process-wide metadata cache and discard its entries."""
+    global _metadata_cache
+    _metadata_cache = None
+
+
+def clear_metadata_cache():
+    """Discard all entries of the metadata cache and reset its counts."""
+    if _metadata_cache is not None:
+        _metadata_cache.clear()
+
+
+def _evict(filename):
+    """Discard the entries of a file which is opened for writing."""
+    if _metadata_cache is not None:
+        _metadata_cache.evict(filename)
+
+
+def metadata_cache_info():
+    """Statistics of the metadata cache.
+
+    Returns
+    -------
+    CacheInfo or None
+        A named tuple of hits, misses, maxsize and currsize, or None if
+        the cache is not enabled.
+
+    """
+    if _metadata_cache is None:
+        return None
+    return _metadata_cache.info()
@@ -19,10 +19,11 @@ not call PROJ functions directly, but invokes them via calls to GDAL's
 
 """
 
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import json
 import logging
 import pickle
+import threading
 import typing
 import warnings
 import re
@@ -47,6 +48,46 @@ _RE_PROJ_PARAM = re.compile(r"""
     \s*?            # consume remaining whitespace, if any
 """, re.X)
 
+# CRS objects are interned: equal inputs to the from_* methods return
+# the same object. The cache is keyed by the kind and normalized value
+# of the input and by the values of the config options which change how
+# inputs are parsed, and holds up to this many objects.
+_CRS_CACHE_MAXSIZE = 512
+_crs_cache = OrderedDict()
+_crs_cache_lock = threading.Lock()
+
+_CRS_CONFIG_OPTIONS = (
+    b"OSR_USE_NON_DEPRECATED", b"OSR_USE_ETMERC", b"OSR_STRIP_TOWGS84",
+    b"OSR_ADD_TOWGS84_ON_IMPORT_FROM_EPSG",
+    b"OSR_DEFAULT_AXIS_MAPPING_STRATEGY")
+
+
+cdef object _crs_config():
+    """Values of the config options which change how CRS are parsed."""
+    cdef const char *val = NULL
+    values = []
+    for name in _CRS_CONFIG_OPTIONS:
+        val = CPLGetConfigOption(<const char *>name, NULL)
+        values.append(None if val == NULL else <bytes>val)
+    return tuple(values)
+
+
+cdef object _crs_cache_get(object key):
+    key = (key, _crs_config())
+    with _crs_cache_lock:
+        obj = _crs_cache.get(key)
+        if obj is not None:
+            _crs_cache.move_to_end(key)
+        return obj
+
+
+cdef object _crs_cache_put(object key, object obj):
+    key = (key, _crs_config())
+    with _crs_cache_lock:
+        _crs_cache[key] = obj
+        while len(_crs_cache) > _CRS_CACHE_MAXSIZE:
+            _crs_cache.popitem(last=False)
+    return obj
 
 
 cdef _safe_osr_release(OGRSpatialReferenceH srs):
@@ -110,10 +151,13 @@ cdef class CRS:
     @property
     def data(self):
         """A PROJ4 dict representation of the CRS.
+
+        The dict is a copy: interned CRS are shared and must not be
+        changed.
         """
         if not self._data:
             self._data = self.to_dict()
-        return self._data
+        return self._data.copy()
 
     @property
     def is_valid(self):
@@ -570,7 +614,7 @@ cdef class CRS:
         CRSError
 
         """
-        cdef CRS obj = CRS.__new__(CRS)
+        cdef CRS obj
 
         try:
             code = int(code)
@@ -582,6 +626,13 @@ cdef class CRS:
         if code <= 0:
             raise CRSError("EPSG codes are positive integers")
 
+        key = ("EPSG", code)
+        cached = _crs_cache_get(key)
+        if cached is not None:
+            return cached
+
+        obj = CRS.__new__(CRS)
+
         try:
             exc_wrap_ogrerr(exc_wrap_int(OSRImportFromEPSG(obj._osr, <int>code)))
         except OverflowError as err:
@@ -591,7 +642,7 @@ cdef class CRS:
         else:
             osr_set_traditional_axis_mapping_strategy(obj._osr)
             obj._epsg = code
-            return obj
+            return _crs_cache_put(key, obj)
 
     @staticmethod
     def from_proj4(proj):
@@ -611,7 +662,7 @@ cdef class CRS:
         CRSError
 
         """
-        cdef CRS obj = CRS.__new__(CRS)
+        cdef CRS obj
 
         # Filter out nonsensical items that might have crept in.
         items_filtered = []
@@ -627,13 +678,20 @@ cdef class CRS:
         proj = ' '.join(items_filtered)
         proj_b = proj.encode('utf-8')
 
+        key = ("PROJ4", proj)
+        cached = _crs_cache_get(key)
+        if cached is not None:
+            return cached
+
+        obj = CRS.__new__(CRS)
+
         try:
             exc_wrap_ogrerr(exc_wrap_int(OSRImportFromProj4(obj._osr, <const char *>proj_b)))
         except CPLE_BaseError as exc:
             raise CRSError("The PROJ4 dict could not be understood. {}".format(exc))
         else:
             osr_set_traditional_axis_mapping_strategy(obj._osr)
-            return obj
+            return _crs_cache_put(key, obj)
 
     @staticmethod
     def from_dict(initialdata=None, **kwargs):
@@ -685,6 +743,11 @@ cdef class CRS:
         proj = ' '.join(pjargs)
         b_proj = proj.encode('utf-8')
 
+        key = ("PROJ4", proj)
+        cached = _crs_cache_get(key)
+        if cached is not None:
+            return cached
+
         cdef CRS obj = CRS.__new__(CRS)
 
         try:
@@ -693,7 +756,7 @@ cdef class CRS:
             raise CRSError("The PROJ4 dict could not be understood. {}".format(exc))
         else:
             osr_set_traditional_axis_mapping_strategy(obj._osr)
-            return obj
+            return _crs_cache_put(key, obj)
 
     @staticmethod
     def from_wkt(wkt, morph_from_esri_dialect=False):
@@ -721,6 +784,11 @@ cdef class CRS:
         if not isinstance(wkt, str):
             raise ValueError("A string is expected")
 
+        key = ("WKT", wkt)
+        cached = _crs_cache_get(key)
+        if cached is not None:
+            return cached
+
         wkt_b= wkt.encode('utf-8')
         wkt_c = wkt_b
 
@@ -732,7 +800,7 @@ cdef class CRS:
             raise CRSError("The WKT could not be parsed. {}".format(exc))
         else:
             osr_set_traditional_axis_mapping_strategy(obj._osr)
-            return obj
+            return _crs_cache_put(key, obj)
 
     @staticmethod
     def from_user_input(value, morph_from_esri_dialect=False):
@@ -765,9 +833,14 @@ cdef class CRS:
         elif isinstance(value, int):
             return CRS.from_epsg(value)
         elif isinstance(value, dict):
-            return CRS(**value)
+            return CRS.from_dict(**value)
 
         elif isinstance(value, str):
+            key = ("INPUT", value)
+            cached = _crs_cache_get(key)
+            if cached is not None:
+                return cached
+
             text_b = value.encode('utf-8')
             text_c = text_b
             obj = CRS.__new__(CRS)
@@ -777,7 +850,7 @@ cdef class CRS:
                 raise CRSError("The WKT could not be parsed. {}".format(exc))
             else:
                 osr_set_traditional_axis_mapping_strategy(obj._osr)
-                return obj
+                return _crs_cache_put(key, obj)
 
         else:
             raise CRSError("CRS is invalid: {!r}".format(value))
@@ -866,9 +939,6 @@ cdef class CRS:
     def __dealloc__(self):
         _safe_osr_release(self._osr)
 
-    def __hash__(self):
-        return hash(self.wkt)
-
     def __getitem__(self, item):
         return self.data[item]
 
@@ -893,18 +963,20 @@ cdef class CRS:
         return self.to_wkt()
 
     def __setstate__(self, state):
+        # The parsed CRS is shared by all unpickled copies of a CRS.
         cdef CRS tmp
         tmp = CRS.from_wkt(state)
+        _safe_osr_release(self._osr)
         self._osr = OSRClone(tmp._osr)
         self._wkt = tmp._wkt
-        self._data = tmp.data
+        self._data = dict(tmp._data or {})
         self._epsg = tmp._epsg
 
     def __copy__(self):
         return pickle.loads(pickle.dumps(self))
 
     def __hash__(self):
-        return hash(self.to_wkt())
+        return hash(self.wkt)
 
     def __str__(self):
         return self.to_string()
@@ -921,11 +993,28 @@ cdef class CRS:
         cdef OGRSpatialReferenceH osr_o = NULL
         cdef CRS crs_o
 
+        if self is other:
+            return True
+
         try:
             crs_o = CRS.from_user_input(other)
         except CRSError:
             return False
 
+        if crs_o is self:
+            return True
+
+        # Identical WKT is the common case and is cheap to check: str
+        # objects cache their hashes.
+        try:
+            wkt_s = self.wkt
+            wkt_o = crs_o.wkt
+        except CRSError:
+            pass
+        else:
+            if wkt_s and hash(wkt_s) == hash(wkt_o) and wkt_s == wkt_o:
+                return True
+
         epsg_s = self.to_epsg()
         epsg_o = crs_o.to_epsg()
 
@@ -19,6 +19,7 @@ with rasterio._loading.add_gdal_dll_directories():
     from rasterio._version import gdal_version
     from rasterio.errors import (
         EnvError, GDALVersionError, RasterioDeprecationWarning)
+    from rasterio.profiling import Profiler
     from rasterio.session import Session, DummySession
 
 
@@ -110,7 +111,7 @@ class Env:
         }
 
     def __init__(self, session=None, aws_unsigned=False, profile_name=None,
-                 session_class=Session.aws_or_dummy, **options):
+                 session_class=Session.aws_or_dummy, profiling=False, **options):
         """Create a new GDAL/AWS environment.
 
         Note: this class is a context manager. GDAL isn't configured
@@ -126,6 +127,11 @@ class Env:
             A shared credentials profile name, as per boto3.
         session_class : Session, optional
             A sub-class of Session.
+        profiling : bool, optional
+            If True, calls of Rasterio's I/O and processing functions
+            are profiled while the environment is entered. The spans
+            are recorded by the environment's profiler attribute. See
+            rasterio.profiling.
         **options : optional
             A mapping of GDAL configuration options, e.g.,
             `CPL_DEBUG=True, CHECK_WITH_INVERT_PROJ=False`.
@@ -208,6 +214,7 @@ class Env:
 
         self.options = options.copy()
         self.context_options = {}
+        self.profiler = Profiler() if profiling else None
 
     @classmethod
     def from_defaults(cls, *args, **kwargs):
@@ -280,20 +287,29 @@ class Env:
         else:
             self._has_parent_env = True
             self.context_options = getenv()
-            setenv(**self.options)
+            # Only the options which differ from the parent's are set,
+            # and only they are restored on exit.
+            setenv(**{
+                key: val for key, val in self.options.items()
+                if key not in self.context_options
+                or self.context_options[key] != val})
 
         self.credentialize()
 
+        if self.profiler is not None:
+            self.profiler.start()
+
         log.debug("Entered env context: %r", self)
         return self
 
     def __exit__(self, exc_type=None, exc_val=None, exc_tb=None):
         log.debug("Exiting env context: %r", self)
-        delenv()
+        if self.profiler is not None:
+            self.profiler.stop()
         if self._has_parent_env:
-            defenv()
-            setenv(**self.context_options)
+            _restore_options(self.context_options)
         else:
+            delenv()
             log.debug("Exiting outermost env")
             # See note directly above where _discovered_options is globally
             # defined.
@@ -304,6 +320,20 @@ class Env:
         log.debug("Exited env context: %r", self)
 
 
+def _restore_options(options):
+    """Restore the options of the existing environment.
+
+    Options which were added are deleted and options which were changed
+    are set to their former values. Others are left alone.
+    """
+    current = local._env.options
+    local._env.del_config_options(
+        *[key for key in current if key not in options])
+    local._env.update_config_options(**{
+        key: val for key, val in options.items()
+        if key not in current or current[key] != val})
+
+
 def defenv(**options):
     """Create a default environment if necessary."""
     if local._env:
@@ -354,6 +384,98 @@ def delenv():
     local._env = None
 
 
+@attr.s(slots=True)
+class EnvSnapshot:
+    """The options of an Env, for use in other threads and processes.
+
+    Envs are thread-local: the options and credentials of an Env
+    entered in one thread are not those of another thread. A snapshot,
+    taken by :func:`snapshot`, carries them to other threads, and can be
+    pickled to carry them to other processes. Entering the Env of a
+    snapshot sets its options and credentials without resolving a
+    session again.
+
+    Attributes
+    ----------
+    options : dict
+        GDAL configuration options, including credentials.
+
+    Notes
+    -----
+    Credentials are pickled with the snapshot.
+
+    """
+
+    options = attr.ib(factory=dict, converter=dict)
+
+    def env(self):
+        """An Env with the options of the snapshot.
+
+        Returns
+        -------
+        Env
+
+        """
+        env = Env(session=DummySession())
+        # Credentials were resolved by the snapshot's Env and are set
+        # as they are, bypassing the checks of Env's constructor.
+        env.options.update(self.options)
+        return env
+
+    def is_active(self):
+        """Whether the current thread's Env has the snapshot's options.
+
+        Returns
+        -------
+        bool
+
+        """
+        if not local._env:
+            return False
+        options = local._env.options
+        return all(
+            key in options and options[key] == val
+            for key, val in self.options.items())
+
+    def activate(self):
+        """Enter the Env of the snapshot for the life of the thread.
+
+        The Env is never exited. This is meant to be called once, by
+        the initializer of a worker thread or process. Nothing is done
+        if the snapshot is already active.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.is_active():
+            self.env().__enter__()
+
+
+def snapshot():
+    """Take a snapshot of the current thread's Env.
+
+    Returns
+    -------
+    EnvSnapshot
+        The options of the current Env, or no options if no Env exists.
+
+    Examples
+    --------
+
+    >>> with Env(GDAL_HTTP_MAX_RETRY=3):
+    ...     snap = snapshot()
+    ...
+    >>> def task(path):
+    ...     with snap.env():
+    ...         with rasterio.open(path) as src:
+    ...             return src.profile
+
+    """
+    return EnvSnapshot(getenv() if hasenv() else {})
+
+
 class NullContextManager:
 
     def __init__(self):
@@ -420,25 +542,24 @@ def ensure_env_with_credentials(f):
     """
     @wraps(f)
     def wrapper(*args, **kwds):
-        if local._env:
-            env_ctor = Env
-        else:
-            env_ctor = Env.from_defaults
-
         fp_arg = kwds.get("fp", None) or args[0]
 
         if isinstance(fp_arg, str):
             session_cls = Session.cls_from_path(fp_arg)
+        else:
+            session_cls = DummySession
 
-            if local._env and session_cls.hascreds(getenv()):
-                session_cls = DummySession
-
-            session = session_cls()
-
+        if local._env:
+            # An environment which has the credentials is used as is.
+            if session_cls.hascreds(local._env.options):
+                return f(*args, **kwds)
+            env_ctor = Env
         else:
-            session = DummySession()
+            env_ctor = Env.from_defaults
 
-        with env_ctor(session=session):
+        # Sessions made with default arguments are cached, so that
+        # credentials are not resolved again on every call.
+        with env_ctor(session=session_cls.cached()):
             return f(*args, **kwds)
 
     return wrapper
@@ -158,3 +158,7 @@ class DatasetIOShapeError(RasterioError):
 
 class WarpOperationError(RasterioError):
     """Raised when a warp operation fails."""
+
+
+class OperationCancelledError(RasterioError):
+    """Raised when a long running operation is cancelled."""
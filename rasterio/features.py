@@ -15,6 +15,7 @@ with rasterio._loading.add_gdal_dll_directories():
     from rasterio.enums import MergeAlg
     from rasterio.env import ensure_env, GDALVersion
     from rasterio.errors import ShapeSkipWarning
+    from rasterio.profiling import profiled, _argument
     from rasterio._features import _shapes, _sieve, _rasterize, _bounds
     from rasterio import warp
     from rasterio.rio.helpers import coords
@@ -75,7 +76,21 @@ def geometry_mask(
         default_value=mask_value).astype('bool')
 
 
+def _shapes_span_attributes(args, kwds, count):
+    """Profiling span attributes of a shapes call."""
+    source = _argument(args, kwds, 0, "source")
+    if isinstance(source, rasterio.Band):
+        source = source.ds
+    return {"path": getattr(source, "name", None), "count": count}
+
+
+def _rasterize_span_attributes(args, kwds, result):
+    """Profiling span attributes of a rasterize call."""
+    return {"bytes": getattr(result, "nbytes", None)}
+
+
 @ensure_env
+@profiled("shapes", _shapes_span_attributes)
 def shapes(source, mask=None, connectivity=4, transform=IDENTITY):
     """Get shapes and values of connected regions in a dataset or array.
 
@@ -174,6 +189,7 @@ def sieve(source, size, out=None, mask=None, connectivity=4):
     return out
 
 
+@profiled("rasterize", _rasterize_span_attributes)
 @ensure_env
 def rasterize(
         shapes,
@@ -16,7 +16,9 @@ def fillnodata(
         image,
         mask=None,
         max_search_distance=100.0,
-        smoothing_iterations=0):
+        smoothing_iterations=0,
+        progress=None,
+        cancel=None):
     """Fill holes in raster data by interpolation
 
     This algorithm will interpolate values for all designated nodata
@@ -52,6 +54,12 @@ def fillnodata(
     smoothing_iterations : integer, optional
         The number of 3x3 smoothing filter passes to run. The default is
         0.
+    progress : callable, optional
+        A function called as the fill progresses with the completed
+        fraction and the throughput in pixels per second. See
+        :mod:`rasterio.progress`.
+    cancel : CancellationToken, optional
+        A token that stops the fill when cancelled.
 
     Returns
     -------
@@ -71,4 +79,5 @@ def fillnodata(
     max_search_distance = float(max_search_distance)
     smoothing_iterations = int(smoothing_iterations)
     return _fillnodata(
-        image, mask, max_search_distance, smoothing_iterations)
+        image, mask, max_search_distance, smoothing_iterations,
+        progress=progress, cancel=cancel)
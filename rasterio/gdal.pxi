@@ -60,7 +60,8 @@ cdef extern from "cpl_string.h" nogil:
 
 cdef extern from "sys/stat.h" nogil:
     struct stat:
-        pass
+        long long st_size
+        long st_mtime
 
 
 cdef extern from "cpl_vsi.h" nogil:
@@ -139,6 +140,15 @@ cdef extern from "cpl_vsi.h" nogil:
     int VSIFTruncateL(VSILFILE *fp, vsi_l_offset nNewSize)
     size_t VSIFWriteL(void *buffer, size_t nSize, size_t nCount, VSILFILE *fp)
     int VSIStatL(const char *pszFilename, VSIStatBufL *psStatBuf)
+    char **VSIGetFileMetadata(const char *pszFilename, const char *pszDomain,
+                              char **papszOptions)
+
+
+IF (CTE_GDAL_MAJOR_VERSION, CTE_GDAL_MINOR_VERSION) >= (3, 2):
+    cdef extern from "cpl_vsi.h" nogil:
+
+        char *VSINetworkStatsGetAsSerializedJSON(char **papszOptions)
+
 
 cdef extern from "ogr_srs_api.h" nogil:
 
@@ -339,6 +349,7 @@ cdef extern from "gdal.h" nogil:
     int GDALSetProjection(GDALDatasetH hds, const char *wkt)
     void GDALGetBlockSize(GDALRasterBandH , int *xsize, int *ysize)
     int GDALGetRasterDataType(GDALRasterBandH band)
+    int GDALGetDataTypeSizeBits(GDALDataType eDataType)
     double GDALGetRasterNoDataValue(GDALRasterBandH band, int *success)
     int GDALSetRasterNoDataValue(GDALRasterBandH band, double value)
     int GDALDeleteRasterNoDataValue(GDALRasterBandH hBand)
@@ -410,6 +421,7 @@ cdef extern from "gdal.h" nogil:
     void GDALSetCacheMax(int nBytes)
     GIntBig GDALGetCacheMax64()
     void GDALSetCacheMax64(GIntBig nBytes)
+    GIntBig GDALGetCacheUsed64()
     CPLErr GDALDeleteDataset(GDALDriverH, const char *)
     char** GDALGetFileList(GDALDatasetH hDS)
     CPLErr GDALCopyDatasetFiles (GDALDriverH hDriver, const char * pszNewName, const char * pszOldName)
@@ -686,6 +698,8 @@ cdef extern from "gdal_alg.h" nogil:
                              double *x, double *y, double *z, int *panSuccess)
     void GDALDestroyApproxTransformer(void *)
     void GDALApproxTransformerOwnsSubtransformer(void *, int)
+    void *GDALCloneTransformer(void *pTransformerArg)
+    void GDALDestroyTransformer(void *pTransformerArg)
     int GDALFillNodata(GDALRasterBandH dst_band, GDALRasterBandH mask_band,
                        double max_search_distance, int deprecated,
                        int smoothing_iterations, char **options,
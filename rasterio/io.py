@@ -14,6 +14,7 @@ with rasterio._loading.add_gdal_dll_directories():
         MemoryFileBase)
     from rasterio.windows import WindowMethodsMixin
     from rasterio.env import ensure_env
+    from rasterio.lazy import ArrayMethodsMixin
     from rasterio.transform import TransformMethodsMixin
     from rasterio._path import _UnparsedPath
     try:
@@ -26,7 +27,7 @@ log = logging.getLogger(__name__)
 
 
 class DatasetReader(DatasetReaderBase, WindowMethodsMixin,
-                    TransformMethodsMixin):
+                    TransformMethodsMixin, ArrayMethodsMixin):
     """An unbuffered data and metadata reader"""
 
     def __repr__(self):
@@ -35,7 +36,7 @@ class DatasetReader(DatasetReaderBase, WindowMethodsMixin,
 
 
 class DatasetWriter(DatasetWriterBase, WindowMethodsMixin,
-                    TransformMethodsMixin):
+                    TransformMethodsMixin, ArrayMethodsMixin):
     """An unbuffered data and metadata writer. Its methods write data
     directly to disk.
     """
@@ -46,7 +47,7 @@ class DatasetWriter(DatasetWriterBase, WindowMethodsMixin,
 
 
 class BufferedDatasetWriter(BufferedDatasetWriterBase, WindowMethodsMixin,
-                            TransformMethodsMixin):
+                            TransformMethodsMixin, ArrayMethodsMixin):
     """Maintains data and metadata in a buffer, writing to disk or
     network only when `close()` is called.
 
@@ -182,30 +183,45 @@ class _FilePath(FilePathBase):
 
     """
 
-    def __init__(self, filelike_obj, dirname=None, filename=None):
+    def __init__(self, filelike_obj, dirname=None, filename=None, block_size=0, cache_size=16777216):
         """Create a new wrapper around the provided file-like object.
 
         Parameters
         ----------
         filelike_obj : file-like object
-            Open file-like object. Currently only reading is supported.
+            Open file-like object, readable or writable.
         filename : str, optional
             An optional filename. A unique one will otherwise be generated.
+        block_size : int, optional
+            Size in bytes of the aligned blocks of the read-ahead cache.
+            Reads smaller than this are served from whole blocks read
+            from the file-like object, which reduces the number of
+            requests made to remote stores. The default, 0, disables
+            the cache.
+        cache_size : int, optional
+            Maximum number of bytes held in the read-ahead cache.
 
         Returns
         -------
         PythonVSIFile
         """
         super().__init__(
-            filelike_obj, dirname=dirname, filename=filename
+            filelike_obj,
+            dirname=dirname,
+            filename=filename,
+            block_size=block_size,
+            cache_size=cache_size,
         )
 
     @ensure_env
-    def open(self, driver=None, sharing=False, **kwargs):
+    def open(self, driver=None, width=None, height=None, count=None, crs=None,
+             transform=None, dtype=None, nodata=None, sharing=False, **kwargs):
         """Open the file and return a Rasterio dataset object.
 
-        The provided file-like object is assumed to be readable.
-        Writing is currently not supported.
+        If the file-like object has content, the file is opened in 'r'
+        mode. Otherwise, the file is opened in 'w' mode and the dataset
+        is written directly to the file-like object. Formats which need
+        to seek while writing require a seekable file-like object.
 
         Parameters are optional and have the same semantics as the
         parameters of `rasterio.open()`.
@@ -214,9 +230,15 @@ class _FilePath(FilePathBase):
 
         if self.closed:
             raise IOError("I/O operation on closed file.")
-        # Assume we were given a non-empty file-like object
         log.debug("VSI path: {}".format(mempath.path))
-        return DatasetReader(mempath, driver=driver, sharing=sharing, **kwargs)
+        if not hasattr(self._file_obj, "write") or len(self) > 0:
+            return DatasetReader(mempath, driver=driver, sharing=sharing, **kwargs)
+        else:
+            writer = get_writer_for_driver(driver)
+            return writer(mempath, 'w+', driver=driver, width=width,
+                          height=height, count=count, crs=crs,
+                          transform=transform, dtype=dtype,
+                          nodata=nodata, sharing=sharing, **kwargs)
 
     def __enter__(self):
         return self
@@ -0,0 +1,268 @@
+"""Lazy, ndarray-like views of datasets
+
+A :class:`LazyArray` has the shape, data type and number of dimensions
+of a dataset's bands, but holds no pixels. Indexing it reads only the
+indexed region of the dataset, in a single call of the dataset's read
+method. Slices with a step larger than 1 become decimated reads.
+
+LazyArrays can be wrapped by libraries that build lazy pipelines from
+ndarray-like objects, such as dask and xarray. Their chunks attribute
+follows the block layout of the dataset.
+
+Examples
+--------
+
+>>> with rasterio.open("tests/data/RGB.byte.tif") as src:
+...     arr = src.as_array()
+...     arr.shape
+...     red = arr[0, 100:200, 300:400]
+...     preview = arr[:, ::10, ::10]
+...
+(3, 718, 791)
+
+>>> import dask.array as da
+>>> data = da.from_array(arr, chunks=arr.chunks)
+
+"""
+
+import math
+import threading
+
+import numpy as np
+
+from rasterio.enums import Resampling
+from rasterio.windows import Window
+
+
+class LazyArray:
+    """A lazy, ndarray-like view of a dataset's bands.
+
+    Parameters
+    ----------
+    dataset : dataset object
+        A dataset opened in a readable mode. It must stay open while
+        the array is used.
+    indexes : list of int, optional
+        Bands of the dataset in the array. Default: all bands.
+    masked : bool, optional
+        If True, indexing returns masked arrays. Default: False.
+    resampling : Resampling, optional
+        Resampling algorithm of decimated reads. Default:
+        Resampling.nearest.
+
+    Attributes
+    ----------
+    dataset : dataset object
+    indexes : list of int
+    shape : tuple
+        Number of bands, rows and columns.
+    dtype : numpy.dtype
+    ndim : int
+    chunks : tuple
+        Chunk lengths along each axis, in dask's format: one band by
+        the block shape of the dataset's first band.
+
+    Notes
+    -----
+    Indexes are integers, slices or Ellipsis, and band indexes may also
+    be sequences of integers. A slice with a step larger than 1 reads a
+    window decimated with the resampling algorithm, rather than picking
+    every step-th pixel. The result has the same shape as NumPy's.
+
+    Reads are serialized by a lock, so that the dataset is never read by
+    two threads at once.
+
+    """
+
+    def __init__(self, dataset, indexes=None, masked=False,
+                 resampling=Resampling.nearest):
+        self.dataset = dataset
+        if indexes is None:
+            indexes = list(dataset.indexes)
+        self.indexes = list(indexes)
+        self.masked = masked
+        self.resampling = resampling
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<LazyArray name='{}' shape={} dtype={}>".format(
+            self.dataset.name, self.shape, self.dtype)
+
+    @property
+    def shape(self):
+        return (len(self.indexes), self.dataset.height, self.dataset.width)
+
+    @property
+    def dtype(self):
+        return np.result_type(
+            *[self.dataset.dtypes[bidx - 1] for bidx in self.indexes])
+
+    @property
+    def ndim(self):
+        return 3
+
+    @property
+    def size(self):
+        return math.prod(self.shape)
+
+    @property
+    def nbytes(self):
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def chunks(self):
+        block_height, block_width = self.dataset.block_shapes[self.indexes[0] - 1]
+        return (
+            (1,) * len(self.indexes),
+            _chunk_lengths(self.dataset.height, block_height),
+            _chunk_lengths(self.dataset.width, block_width),
+        )
+
+    def __array__(self, dtype=None):
+        data = self[...]
+        if isinstance(data, np.ma.MaskedArray):
+            data = data.filled()
+        return np.asarray(data, dtype=dtype)
+
+    def read(self):
+        """Read the whole array.
+
+        Returns
+        -------
+        numpy ndarray or MaskedArray
+
+        """
+        return self[...]
+
+    def __getitem__(self, key):
+        band_key, row_key, col_key = _expand_key(key, self.ndim)
+
+        if isinstance(band_key, (int, np.integer)):
+            indexes = self.indexes[_check_index(band_key, len(self.indexes))]
+        elif isinstance(band_key, slice):
+            indexes = self.indexes[band_key]
+        else:
+            indexes = [
+                self.indexes[_check_index(i, len(self.indexes))]
+                for i in band_key]
+
+        rows, row_step, row_flip, row_squeeze = _axis_range(row_key, self.dataset.height)
+        cols, col_step, col_flip, col_squeeze = _axis_range(col_key, self.dataset.width)
+
+        if isinstance(indexes, list):
+            out_shape = (len(indexes), len(rows), len(cols))
+        else:
+            out_shape = (len(rows), len(cols))
+
+        if 0 in out_shape:
+            data = np.empty(out_shape, dtype=self.dtype)
+            if self.masked:
+                data = np.ma.masked_array(data)
+        else:
+            window = Window(
+                cols.start, rows.start,
+                min(len(cols) * col_step, self.dataset.width - cols.start),
+                min(len(rows) * row_step, self.dataset.height - rows.start))
+            with self._lock:
+                data = self.dataset.read(
+                    indexes, window=window, out_shape=out_shape,
+                    masked=self.masked, resampling=self.resampling)
+
+        if row_flip:
+            data = data[..., ::-1, :]
+        if col_flip:
+            data = data[..., ::-1]
+        if row_squeeze and col_squeeze:
+            data = data[..., 0, 0]
+        elif row_squeeze:
+            data = data[..., 0, :]
+        elif col_squeeze:
+            data = data[..., 0]
+        return data
+
+
+class ArrayMethodsMixin:
+    """Mixin of dataset methods that return lazy arrays."""
+
+    def as_array(self, indexes=None, masked=False,
+                 resampling=Resampling.nearest):
+        """A lazy, ndarray-like view of the dataset's bands.
+
+        Parameters
+        ----------
+        indexes : list of int, optional
+            Bands of the dataset in the array. Default: all bands.
+        masked : bool, optional
+            If True, indexing the array returns masked arrays.
+        resampling : Resampling, optional
+            Resampling algorithm of decimated reads. Default:
+            Resampling.nearest.
+
+        Returns
+        -------
+        LazyArray
+
+        """
+        return LazyArray(
+            self, indexes=indexes, masked=masked, resampling=resampling)
+
+
+def _chunk_lengths(length, block_length):
+    """Lengths of the blocks along an axis."""
+    full, rest = divmod(length, block_length)
+    return (block_length,) * full + ((rest,) if rest else ())
+
+
+def _check_index(index, length):
+    if not -length <= index < length:
+        raise IndexError(
+            "index {} is out of bounds for axis with size {}".format(index, length))
+    return int(index)
+
+
+def _expand_key(key, ndim):
+    """Expand an index into one item per axis."""
+    if not isinstance(key, tuple):
+        key = (key,)
+    if any(item is None for item in key):
+        raise IndexError("LazyArray does not support new axes")
+
+    ellipses = [i for i, item in enumerate(key) if item is Ellipsis]
+    if len(ellipses) > 1:
+        raise IndexError("an index can only have a single ellipsis ('...')")
+    if ellipses:
+        i = ellipses[0]
+        fill = (slice(None),) * (ndim - len(key) + 1)
+        key = key[:i] + fill + key[i + 1:]
+    if len(key) > ndim:
+        raise IndexError(
+            "too many indices for array: array is {}-dimensional, but {} "
+            "were indexed".format(ndim, len(key)))
+    return key + (slice(None),) * (ndim - len(key))
+
+
+def _axis_range(key, length):
+    """The pixels of a row or column axis selected by an index.
+
+    Returns
+    -------
+    tuple
+        A range of increasing pixel offsets, the step between them,
+        whether the result must be reversed, and whether the axis is
+        dropped from the result.
+    """
+    if isinstance(key, (int, np.integer)):
+        start = _check_index(key, length) % length
+        return range(start, start + 1), 1, False, True
+    if not isinstance(key, slice):
+        raise IndexError(
+            "only integers, slices and ellipsis are valid indices of rows "
+            "and columns")
+
+    selected = range(*key.indices(length))
+    if selected.step > 0:
+        return selected, selected.step, False, False
+    return selected[::-1], -selected.step, True, False
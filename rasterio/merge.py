@@ -14,10 +14,16 @@ import rasterio._loading
 with rasterio._loading.add_gdal_dll_directories():
     import rasterio
     from rasterio.coords import disjoint_bounds
+    from rasterio.crs import CRS
     from rasterio.enums import Resampling
     from rasterio.errors import RasterioDeprecationWarning
+    from rasterio.parallel import ThreadPoolExecutor, _bounded_map
+    from rasterio.profiling import profiled, _argument
+    import rasterio.shutil
     from rasterio import windows
     from rasterio.transform import Affine
+    from rasterio.vrt import WarpedVRT
+    from rasterio.warp import calculate_default_transform, transform_bounds
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +97,206 @@ MERGE_METHODS = {
 }
 
 
+def _merge_span_attributes(args, kwds, result):
+    """Profiling span attributes of a merge call."""
+    datasets = _argument(args, kwds, 0, "datasets")
+    dst_path = _argument(args, kwds, 11, "dst_path")
+    return {
+        "count": len(datasets) if hasattr(datasets, "__len__") else None,
+        "dst_path": None if dst_path is None else str(dst_path),
+    }
+
+
+def _ordered_map(func, items, workers):
+    """Map func over items in a pool of threads, in order.
+
+    At most twice as many results as workers are pending at a time.
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from _bounded_map(
+            executor, func, ((item,) for item in items), 2 * workers,
+            ordered=True)
+
+
+def _read_source(src, dst_bounds, output_transform, output_width,
+                 output_height, src_count, indexes, resampling, dst_crs=None):
+    """Read the part of a source that intersects the output.
+
+    Returns
+    -------
+    tuple or None
+        The row and column offsets of the data in the output and a
+        masked array, or None if the source doesn't intersect the
+        output.
+    """
+    if dst_crs is not None and src.crs != dst_crs:
+        return _read_warped_source(
+            src, dst_bounds, output_transform, output_width, output_height,
+            indexes, resampling, dst_crs)
+
+    # Real World (tm) use of boundless reads.
+    # This approach uses the maximum amount of memory to solve the
+    # problem. Making it more efficient is a TODO.
+
+    if disjoint_bounds(dst_bounds, src.bounds):
+        logger.debug("Skipping source: src=%r", src)
+        return None
+
+    # 1. Compute spatial intersection of destination and source
+    dst_w, dst_s, dst_e, dst_n = dst_bounds
+    src_w, src_s, src_e, src_n = src.bounds
+
+    int_w = src_w if src_w > dst_w else dst_w
+    int_s = src_s if src_s > dst_s else dst_s
+    int_e = src_e if src_e < dst_e else dst_e
+    int_n = src_n if src_n < dst_n else dst_n
+
+    # 2. Compute the source window
+    src_window = windows.from_bounds(int_w, int_s, int_e, int_n, src.transform)
+
+    # 3. Compute the destination window
+    dst_window = windows.from_bounds(
+        int_w, int_s, int_e, int_n, output_transform
+    )
+
+    # 4. Read data in source window into temp
+    src_window_rnd_shp = src_window.round_lengths()
+    dst_window_rnd_shp = dst_window.round_lengths()
+    dst_window_rnd_off = dst_window_rnd_shp.round_offsets()
+
+    temp_height, temp_width = (
+        dst_window_rnd_off.height,
+        dst_window_rnd_off.width,
+    )
+    temp_shape = (src_count, temp_height, temp_width)
+
+    temp_src = src.read(
+        out_shape=temp_shape,
+        window=src_window_rnd_shp,
+        boundless=False,
+        masked=True,
+        indexes=indexes,
+        resampling=resampling,
+    )
+
+    roff, coff = (
+        max(0, dst_window_rnd_off.row_off),
+        max(0, dst_window_rnd_off.col_off),
+    )
+    return roff, coff, temp_src
+
+
+def _read_warped_source(src, dst_bounds, output_transform, output_width,
+                        output_height, indexes, resampling, dst_crs):
+    """Read a source in another CRS, reprojected to the output grid."""
+    src_bounds = transform_bounds(src.crs, dst_crs, *src.bounds)
+    if disjoint_bounds(dst_bounds, src_bounds):
+        logger.debug("Skipping source: src=%r", src)
+        return None
+
+    dst_w, dst_s, dst_e, dst_n = dst_bounds
+    src_w, src_s, src_e, src_n = src_bounds
+    dst_window = windows.from_bounds(
+        max(src_w, dst_w), max(src_s, dst_s), min(src_e, dst_e),
+        min(src_n, dst_n), output_transform)
+    col_off = max(0, int(math.floor(dst_window.col_off)))
+    row_off = max(0, int(math.floor(dst_window.row_off)))
+    col_stop = min(output_width, int(math.ceil(dst_window.col_off + dst_window.width)))
+    row_stop = min(output_height, int(math.ceil(dst_window.row_off + dst_window.height)))
+    if col_stop <= col_off or row_stop <= row_off:
+        return None
+    dst_window = windows.Window(
+        col_off, row_off, col_stop - col_off, row_stop - row_off)
+
+    if indexes is None:
+        indexes = list(range(1, src.count + 1))
+
+    # Without a nodata value, an alpha band masks the parts of the
+    # output grid that are outside the source.
+    with WarpedVRT(
+            src, crs=dst_crs, transform=output_transform, width=output_width,
+            height=output_height, resampling=resampling,
+            add_alpha=src.nodata is None) as vrt:
+        temp_src = vrt.read(indexes=indexes, window=dst_window, masked=True)
+
+    if temp_src.ndim == 2:
+        temp_src = temp_src[np.newaxis]
+
+    return row_off, col_off, temp_src
+
+
+def _nodata_mask(region, nodataval):
+    """Mask of the pixels of region equal to the nodata value."""
+    if math.isnan(nodataval):
+        return np.isnan(region)
+    elif np.issubdtype(region.dtype, np.floating):
+        return np.isclose(region, nodataval)
+    else:
+        return region == nodataval
+
+
+def _merge_update(datasets, dataset_opener, dst_path, copyto, indexes=None,
+                  resampling=Resampling.nearest, workers=1,
+                  overview_resampling=None):
+    """Merge datasets into an existing output.
+
+    Each input is composited into the window of the output that it
+    intersects, which is read and written back in turn. Bands 1 to
+    the number of bands read from the inputs are updated.
+    """
+    with rasterio.open(dst_path, "r+") as dst:
+        nodataval = dst.nodata if dst.nodata is not None else 0
+
+        if indexes is None:
+            src_count = dst.count
+        elif isinstance(indexes, int):
+            src_count = indexes
+        else:
+            src_count = len(indexes)
+
+        if src_count > dst.count:
+            raise ValueError(
+                "Inputs have {} bands to merge, the output has only {}".format(
+                    src_count, dst.count))
+        dst_indexes = list(range(1, src_count + 1))
+
+        def read_source(dataset):
+            with dataset_opener(dataset) as src:
+                return _read_source(
+                    src, dst.bounds, dst.transform, dst.width, dst.height,
+                    src_count, indexes, resampling, dst_crs=dst.crs)
+
+        updated = []
+        for idx, result in enumerate(_ordered_map(read_source, datasets, workers)):
+            if result is None:
+                continue
+
+            roff, coff, temp_src = result
+            height = min(temp_src.shape[-2], dst.height - roff)
+            width = min(temp_src.shape[-1], dst.width - coff)
+            if height <= 0 or width <= 0:
+                continue
+            window = windows.Window(coff, roff, width, height)
+
+            region = dst.read(dst_indexes, window=window)
+            region_mask = _nodata_mask(region, nodataval)
+            temp = temp_src[:, :height, :width]
+            temp_mask = np.ma.getmask(temp)
+            copyto(region, temp, region_mask, temp_mask, index=idx, roff=roff, coff=coff)
+            dst.write(region, dst_indexes, window=window)
+            updated.append(window)
+
+        if overview_resampling is not None:
+            for window in updated:
+                dst.update_overviews(window, resampling=overview_resampling)
+
+
+@profiled("merge", _merge_span_attributes)
 def merge(
     datasets,
     bounds=None,
@@ -105,11 +311,16 @@ def merge(
     target_aligned_pixels=False,
     dst_path=None,
     dst_kwds=None,
+    dst_crs=None,
+    workers=1,
+    update=False,
+    overview_resampling=None,
 ):
     """Copy valid pixels from input files to an output file.
 
-    All files must have the same number of bands, data type, and
-    coordinate reference system.
+    All files must have the same number of bands and data type. They
+    must have the same coordinate reference system unless dst_crs is
+    given.
 
     Input files are merged in their listed order using the reverse
     painter's algorithm (default) or another method. If the output file exists,
@@ -119,6 +330,10 @@ def merge(
     units of the input file coordinate reference system may be provided
     and are otherwise taken from the first input file.
 
+    If dst_crs is given, inputs in other coordinate reference systems
+    are reprojected as they are read, and bounds and resolution are in
+    the units of dst_crs.
+
     Parameters
     ----------
     datasets : list of dataset objects opened in 'r' mode, filenames or PathLike objects
@@ -178,12 +393,32 @@ def merge(
     dst_kwds : dict, optional
         Dictionary of creation options and other paramters that will be
         overlaid on the profile of the output dataset.
+    dst_crs : CRS or str, optional
+        Coordinate reference system of the output. Inputs in other
+        coordinate reference systems are reprojected to the output grid
+        with a WarpedVRT. If not set, the coordinate reference system
+        of the first input.
+    workers : int, optional
+        Number of threads reading and reprojecting inputs. Inputs are
+        still merged in their listed order, and at most twice this many
+        inputs are held in memory at a time. Default: 1.
+    update : bool, optional
+        If True and dst_path exists, merge the inputs into the existing
+        output instead of replacing it. Only the windows of the output
+        that intersect inputs are read and written. The grid, data type
+        and nodata value of the output are kept, inputs in other
+        coordinate reference systems are reprojected, and bounds, res,
+        nodata, dtype, output_count, target_aligned_pixels, dst_crs and
+        dst_kwds are ignored. Default: False.
+    overview_resampling : Resampling, optional
+        If given and update is True, the overviews of the output are
+        regenerated over the updated windows with this algorithm.
 
     Returns
     -------
-    tuple
+    tuple or None
 
-        Two elements:
+        None if dst_path is given. Otherwise, two elements:
 
             dest: numpy ndarray
                 Contents of all input rasters in single array
@@ -221,12 +456,27 @@ def merge(
 
         dataset_opener = nullcontext
 
+    if update and dst_path is not None and rasterio.shutil.exists(dst_path):
+        _merge_update(
+            datasets, dataset_opener, dst_path, copyto, indexes=indexes,
+            resampling=resampling, workers=workers,
+            overview_resampling=overview_resampling)
+        return
+
     with dataset_opener(datasets[0]) as first:
         first_profile = first.profile
         first_res = first.res
         nodataval = first.nodatavals[0]
         dt = first.dtypes[0]
 
+        if dst_crs is not None:
+            dst_crs = CRS.from_user_input(dst_crs)
+            if first.crs != dst_crs:
+                first_transform, _, _ = calculate_default_transform(
+                    first.crs, dst_crs, first.width, first.height, *first.bounds)
+                first_res = (first_transform.a, -first_transform.e)
+            first_profile["crs"] = dst_crs
+
         if indexes is None:
             src_count = first.count
         elif isinstance(indexes, int):
@@ -252,6 +502,9 @@ def merge(
         for dataset in datasets:
             with dataset_opener(dataset) as src:
                 left, bottom, right, top = src.bounds
+                if dst_crs is not None and src.crs != dst_crs:
+                    left, bottom, right, top = transform_bounds(
+                        src.crs, dst_crs, left, bottom, right, top)
             xs.extend([left, right])
             ys.extend([bottom, top])
         dst_w, dst_s, dst_e, dst_n = min(xs), min(ys), max(xs), max(ys)
@@ -322,65 +575,22 @@ def merge(
     else:
         nodataval = 0
 
-    for idx, dataset in enumerate(datasets):
+    def read_source(dataset):
         with dataset_opener(dataset) as src:
-            # Real World (tm) use of boundless reads.
-            # This approach uses the maximum amount of memory to solve the
-            # problem. Making it more efficient is a TODO.
+            return _read_source(
+                src, (dst_w, dst_s, dst_e, dst_n), output_transform,
+                output_width, output_height, src_count, indexes, resampling,
+                dst_crs)
 
-            if disjoint_bounds((dst_w, dst_s, dst_e, dst_n), src.bounds):
-                logger.debug("Skipping source: src=%r, window=%r", src)
-                continue
-
-            # 1. Compute spatial intersection of destination and source
-            src_w, src_s, src_e, src_n = src.bounds
-
-            int_w = src_w if src_w > dst_w else dst_w
-            int_s = src_s if src_s > dst_s else dst_s
-            int_e = src_e if src_e < dst_e else dst_e
-            int_n = src_n if src_n < dst_n else dst_n
-
-            # 2. Compute the source window
-            src_window = windows.from_bounds(int_w, int_s, int_e, int_n, src.transform)
-
-            # 3. Compute the destination window
-            dst_window = windows.from_bounds(
-                int_w, int_s, int_e, int_n, output_transform
-            )
-
-            # 4. Read data in source window into temp
-            src_window_rnd_shp = src_window.round_lengths()
-            dst_window_rnd_shp = dst_window.round_lengths()
-            dst_window_rnd_off = dst_window_rnd_shp.round_offsets()
-
-            temp_height, temp_width = (
-                dst_window_rnd_off.height,
-                dst_window_rnd_off.width,
-            )
-            temp_shape = (src_count, temp_height, temp_width)
-
-            temp_src = src.read(
-                out_shape=temp_shape,
-                window=src_window_rnd_shp,
-                boundless=False,
-                masked=True,
-                indexes=indexes,
-                resampling=resampling,
-            )
+    for idx, result in enumerate(_ordered_map(read_source, datasets, workers)):
+        if result is None:
+            continue
 
         # 5. Copy elements of temp into dest
-        roff, coff = (
-            max(0, dst_window_rnd_off.row_off),
-            max(0, dst_window_rnd_off.col_off),
-        )
+        roff, coff, temp_src = result
+        temp_height, temp_width = temp_src.shape[-2:]
         region = dest[:, roff : roff + temp_height, coff : coff + temp_width]
-
-        if math.isnan(nodataval):
-            region_mask = np.isnan(region)
-        elif np.issubdtype(region.dtype, np.floating):
-            region_mask = np.isclose(region, nodataval)
-        else:
-            region_mask = region == nodataval
+        region_mask = _nodata_mask(region, nodataval)
 
         # Ensure common shape, resolving issue #2202.
         temp = temp_src[:, : region.shape[1], : region.shape[2]]
@@ -0,0 +1,313 @@
+"""Parallel window-by-window processing of datasets
+
+:func:`map_windows` reads windows of one or more source datasets,
+calls a function on the data of each window in a pool of threads or
+processes, and writes the results to a destination dataset. Windows
+may be read with a halo of surrounding pixels, so that focal and
+neighborhood operations see the neighbors of the pixels at the edges
+of windows.
+
+Sources are read in the workers and results are written by the calling
+thread only, so no locking is needed in the function.
+
+Envs are thread-local, so the config options and credentials of the
+Env in which a pool is made are not those of its workers. The
+:class:`ThreadPoolExecutor` and :class:`ProcessPoolExecutor` of this
+module are the standard library's pools, with workers that enter a
+snapshot of that Env once, when they start, rather than once per task.
+
+Examples
+--------
+
+>>> from scipy.ndimage import uniform_filter
+>>> from rasterio.parallel import map_windows
+>>> def smooth(data):
+...     return uniform_filter(data, size=(1, 5, 5))
+...
+>>> with rasterio.open("tests/data/RGB.byte.tif") as src:
+...     profile = src.profile
+...     with rasterio.open("smooth.tif", "w", **profile) as dst:
+...         map_windows(smooth, src, dst, halo=2, workers=4)
+
+>>> from rasterio.parallel import ThreadPoolExecutor
+>>> with rasterio.Env(session=AWSSession(profile_name="work")):
+...     with ThreadPoolExecutor(max_workers=8) as executor:
+...         profiles = list(executor.map(read_profile, s3_paths))
+
+"""
+
+from collections import deque
+import concurrent.futures
+from concurrent.futures import FIRST_COMPLETED, wait
+import os
+import threading
+
+from rasterio.env import NullContextManager, snapshot
+from rasterio.proxy import DatasetProxy
+from rasterio.windows import Window
+
+
+def _initialize_worker(env_snapshot, initializer, initargs):
+    """Enter an Env snapshot and call the user's initializer."""
+    env_snapshot.activate()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
+    """A pool of threads that run tasks in the Env of its maker.
+
+    The options and credentials of the Env of the thread that makes the
+    pool are snapshotted, and each worker thread enters the snapshot's
+    Env once, when it starts. The parameters are those of the standard
+    library's ThreadPoolExecutor.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Maximum number of threads.
+    thread_name_prefix : str, optional
+        Prefix of the names of the threads.
+    initializer : callable, optional
+        Called at the start of each worker thread, after the Env is
+        entered.
+    initargs : tuple, optional
+        Arguments of the initializer.
+
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix="",
+                 initializer=None, initargs=()):
+        super().__init__(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix,
+            initializer=_initialize_worker,
+            initargs=(snapshot(), initializer, initargs))
+
+
+class ProcessPoolExecutor(concurrent.futures.ProcessPoolExecutor):
+    """A pool of processes that run tasks in the Env of its maker.
+
+    The options and credentials of the Env of the thread that makes the
+    pool are snapshotted and sent to each worker process, which enters
+    the snapshot's Env once, when it starts. The parameters are those
+    of the standard library's ProcessPoolExecutor.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Maximum number of processes.
+    mp_context : multiprocessing context, optional
+        Context used to start the processes.
+    initializer : callable, optional
+        Called at the start of each worker process, after the Env is
+        entered. Must be picklable.
+    initargs : tuple, optional
+        Arguments of the initializer.
+    kwargs : optional
+        Other keyword arguments of the standard library's
+        ProcessPoolExecutor.
+
+    Notes
+    -----
+    Credentials are pickled and sent to the worker processes.
+
+    """
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None,
+                 initargs=(), **kwargs):
+        super().__init__(
+            max_workers=max_workers, mp_context=mp_context,
+            initializer=_initialize_worker,
+            initargs=(snapshot(), initializer, initargs), **kwargs)
+
+
+def _bounded_map(executor, func, iterable, limit, ordered=False):
+    """Map func over argument tuples in an executor.
+
+    At most limit tasks are pending at a time, which bounds the memory
+    held by their results. Results are yielded as tasks complete, or
+    in the order of the arguments if ordered is True. Pending tasks
+    are cancelled if the generator is closed early.
+    """
+    pending = deque()
+    try:
+        for args in iterable:
+            pending.append(executor.submit(func, *args))
+            while len(pending) >= limit:
+                for future in _pop_done(pending, ordered):
+                    yield future.result()
+        while pending:
+            for future in _pop_done(pending, ordered):
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _pop_done(pending, ordered):
+    """Remove and return the next completed futures."""
+    if ordered:
+        return [pending.popleft()]
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+    return done
+
+
+class _LockedSource:
+    """A dataset that is used by one thread at a time."""
+
+    def __init__(self, dataset, lock):
+        self.dataset = dataset
+        self.width = dataset.width
+        self.height = dataset.height
+        self._lock = lock
+
+    def read(self, *args, **kwargs):
+        with self._lock:
+            return self.dataset.read(*args, **kwargs)
+
+
+def _worker_source(source, mode, locks):
+    """A source that can be read by workers.
+
+    Datasets which can't be proxied are read under a lock from locks,
+    keyed by the dataset's id, which is shared with writes to the same
+    dataset.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return DatasetProxy(source)
+    try:
+        return DatasetProxy.from_dataset(source)
+    except ValueError:
+        # Datasets in memory or open for writing can only be shared
+        # between threads.
+        if mode == "process":
+            raise
+        return _LockedSource(
+            source, locks.setdefault(id(source), threading.Lock()))
+
+
+def _read_window(source, window, halo, indexes, masked):
+    """Read a window with a halo, filling beyond the edges."""
+    halo_window = Window(
+        window.col_off - halo, window.row_off - halo,
+        window.width + 2 * halo, window.height + 2 * halo)
+    boundless = (
+        halo_window.col_off < 0 or halo_window.row_off < 0
+        or halo_window.col_off + halo_window.width > source.width
+        or halo_window.row_off + halo_window.height > source.height)
+    return source.read(
+        indexes, window=halo_window, boundless=boundless, masked=masked)
+
+
+def _process_window(func, sources, window, halo, indexes, masked):
+    """Read, process and crop the data of a window.
+
+    Returns
+    -------
+    tuple
+        The window and the result, or None.
+    """
+    arrays = [
+        _read_window(source, window, halo, indexes, masked)
+        for source in sources]
+    result = func(*arrays)
+    if result is not None and halo:
+        result = result[
+            ..., halo:halo + int(window.height), halo:halo + int(window.width)]
+    return window, result
+
+
+def map_windows(func, sources, dst, windows=None, halo=0, workers=1,
+                mode="thread", indexes=None, masked=False):
+    """Process datasets window by window in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        Called with one array per source, the data of a window and its
+        halo. Returns an array of the same height and width, the result
+        for the window and its halo, or None to write nothing. The halo
+        is cropped from the result before it is written. A 2D result is
+        written to the first band of dst, and a 3D result to as many
+        bands as it has. Must be picklable if mode is "process".
+    sources : dataset object, str, PathLike, or a list of them
+        Sources to read. They must be on the same grid as dst.
+    dst : dataset object
+        Destination opened in a writable mode.
+    windows : iterable of Window, optional
+        Windows to process. Default: the block windows of dst.
+    halo : int, optional
+        Number of pixels read around each window. Pixels beyond the
+        edges of the sources are filled with their nodata values, or
+        masked if masked is True. Default: 0.
+    workers : int, optional
+        Number of threads or processes. Default: 1.
+    mode : str, optional
+        "thread" or "process". Default: "thread".
+    indexes : int or list, optional
+        Bands of the sources to read. Default: all bands.
+    masked : bool, optional
+        If True, func is called with masked arrays. Default: False.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the mode or halo is invalid, or a source in memory or open
+        for writing is used with the "process" mode.
+
+    Notes
+    -----
+    Sources are sent to workers as :class:`~rasterio.proxy.DatasetProxy`
+    objects, which open each source once per worker thread or process.
+    Sources in memory or open for writing, including dst itself, are
+    shared between threads and used by one thread at a time.
+    Workers run in the current Env, entered once per worker.
+    At most twice as many windows as workers are in flight at a time,
+    which bounds memory use.
+
+    """
+    if mode not in ("thread", "process"):
+        raise ValueError("mode must be 'thread' or 'process'")
+    if halo < 0:
+        raise ValueError("halo must not be negative")
+
+    if isinstance(sources, (str, os.PathLike)) or hasattr(sources, "read"):
+        sources = [sources]
+    # A source may also be dst, if it is open in "r+" mode. Its reads
+    # and the writes of results share a lock.
+    locks = {}
+    sources = [_worker_source(source, mode, locks) for source in sources]
+    dst_lock = locks.get(id(dst)) or NullContextManager()
+
+    if windows is None:
+        windows = (window for _, window in dst.block_windows(1))
+
+    def write(window, result):
+        if result is None:
+            return
+        with dst_lock:
+            if result.ndim == 2:
+                dst.write(result, 1, window=window)
+            else:
+                dst.write(
+                    result, list(range(1, result.shape[0] + 1)), window=window)
+
+    if workers <= 1:
+        for window in windows:
+            write(*_process_window(func, sources, window, halo, indexes, masked))
+        return
+
+    executor_cls = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+    with executor_cls(max_workers=workers) as executor:
+        results = _bounded_map(
+            executor, _process_window,
+            ((func, sources, window, halo, indexes, masked) for window in windows),
+            2 * workers)
+        for window, result in results:
+            write(window, result)
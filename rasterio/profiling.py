@@ -0,0 +1,335 @@
+"""Profiling of Rasterio's I/O and processing functions
+
+While a :class:`Profiler` is active, calls of :func:`rasterio.open`,
+dataset read and write methods, :func:`rasterio.warp.reproject`,
+:func:`rasterio.features.rasterize`, :func:`rasterio.features.shapes`,
+and :func:`rasterio.merge.merge` are recorded as timed spans. Spans
+carry attributes such as the dataset path, the window, the number of
+bytes read or written, and the thread that made the call.
+
+Profilers are process-wide: spans of calls made in any thread are
+recorded. When no profiler is active, the cost of profiling is a single
+check per call.
+
+Examples
+--------
+
+>>> from rasterio.profiling import Profiler
+>>> with Profiler() as profiler:
+...     with rasterio.open("tests/data/RGB.byte.tif") as src:
+...         data = src.read()
+...
+>>> [span.name for span in profiler.spans]
+['open', 'read']
+>>> profiler.to_chrome_trace("trace.json")
+
+Profiling can also be enabled for the duration of an environment.
+
+>>> with rasterio.Env(profiling=True) as env:
+...     ...
+...
+>>> env.profiler.to_records()
+
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+import inspect
+import json
+import logging
+import os
+import threading
+from time import perf_counter
+
+import attr
+
+log = logging.getLogger(__name__)
+
+# Active profilers. Calls check this list without locking.
+_profilers = []
+_profilers_lock = threading.Lock()
+
+
+@attr.s(slots=True, frozen=True)
+class Span:
+    """A timed call.
+
+    Attributes
+    ----------
+    name : str
+        Name of the profiled function, such as "open" or "read".
+    start : float
+        Start time in seconds, as given by time.perf_counter().
+    duration : float
+        Duration of the call in seconds.
+    thread_id : int
+        Identifier of the thread that made the call.
+    thread_name : str
+        Name of the thread that made the call.
+    attributes : dict
+        Details of the call, such as the dataset path or window.
+
+    """
+    name = attr.ib()
+    start = attr.ib()
+    duration = attr.ib()
+    thread_id = attr.ib()
+    thread_name = attr.ib()
+    attributes = attr.ib(factory=dict)
+
+
+class Profiler:
+    """Records spans of profiled calls while active.
+
+    A profiler is activated by its start method or by entering it as a
+    context manager.
+
+    Attributes
+    ----------
+    spans : list of Span
+        Spans recorded while the profiler was active, in order of
+        their completion.
+
+    """
+
+    def __init__(self):
+        self.spans = []
+        self._origin = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Begin recording spans."""
+        if self._origin is None:
+            self._origin = perf_counter()
+        with _profilers_lock:
+            if self not in _profilers:
+                _profilers.append(self)
+
+    def stop(self):
+        """Stop recording spans."""
+        with _profilers_lock:
+            if self in _profilers:
+                _profilers.remove(self)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _record(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def to_records(self):
+        """Spans as a list of flat dicts.
+
+        Start times are in seconds since the profiler was first started.
+        The records are suitable for a pandas DataFrame.
+
+        Returns
+        -------
+        list of dict
+
+        """
+        origin = self._origin or 0.0
+        records = []
+        for span in list(self.spans):
+            record = {
+                "name": span.name,
+                "start": span.start - origin,
+                "duration": span.duration,
+                "thread_id": span.thread_id,
+                "thread_name": span.thread_name,
+            }
+            record.update(span.attributes)
+            records.append(record)
+        return records
+
+    def to_dataframe(self):
+        """Spans as a pandas DataFrame.
+
+        Requires pandas.
+
+        Returns
+        -------
+        pandas.DataFrame
+
+        """
+        import pandas as pd
+        return pd.DataFrame.from_records(self.to_records())
+
+    def to_chrome_trace(self, fp=None):
+        """Spans in Chrome's Trace Event format.
+
+        The trace can be loaded in Perfetto or chrome://tracing.
+
+        Parameters
+        ----------
+        fp : str, os.PathLike, or file object, optional
+            If given, the trace is written here as JSON.
+
+        Returns
+        -------
+        dict
+
+        """
+        origin = self._origin or 0.0
+        pid = os.getpid()
+        events = []
+        for span in list(self.spans):
+            events.append({
+                "name": span.name,
+                "cat": "rasterio",
+                "ph": "X",
+                "ts": (span.start - origin) * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {key: _jsonable(val) for key, val in span.attributes.items()},
+            })
+        for thread_id, thread_name in {(span.thread_id, span.thread_name) for span in self.spans}:
+            events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            })
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+
+        if fp is not None:
+            if hasattr(fp, "write"):
+                json.dump(trace, fp)
+            else:
+                with open(fp, "w") as f:
+                    json.dump(trace, f)
+
+        return trace
+
+
+def _jsonable(value):
+    """A JSON serializable form of an attribute value."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _argument(args, kwds, index, name, default=None):
+    """Get an argument of a call by position or by name."""
+    if name in kwds:
+        return kwds[name]
+    if len(args) > index:
+        return args[index]
+    return default
+
+
+def _record(name, start, attributes, duration=None):
+    if duration is None:
+        duration = perf_counter() - start
+    thread = threading.current_thread()
+    span = Span(name, start, duration, thread.ident, thread.name, attributes)
+    for profiler in list(_profilers):
+        profiler._record(span)
+
+
+def profiled(name, attributes=None):
+    """Decorate a function so that its calls are profiled.
+
+    Parameters
+    ----------
+    name : str
+        Name of the spans.
+    attributes : callable, optional
+        Called with the positional arguments, keyword arguments, and
+        result of a profiled call. Returns a dict of span attributes.
+        It is only called while a profiler is active. The result is
+        None if the call raised an exception.
+
+    Returns
+    -------
+    A function decorator.
+
+    Notes
+    -----
+    The span of a generator function covers the time spent producing
+    all of its items, not including time spent by the consumer between
+    items. The result passed to the attributes callable is the number of
+    items produced.
+
+    """
+    def get_attributes(args, kwds, result):
+        if attributes is None:
+            return {}
+        try:
+            return attributes(args, kwds, result)
+        except Exception:
+            log.debug("Failed to get attributes of %r span.", name, exc_info=True)
+            return {}
+
+    def decorator(f):
+        # Generator functions may be wrapped by other decorators.
+        if inspect.isgeneratorfunction(inspect.unwrap(f)):
+            @wraps(f)
+            def generator_wrapper(*args, **kwds):
+                if not _profilers:
+                    return (yield from f(*args, **kwds))
+
+                start = perf_counter()
+                duration = 0.0
+                count = 0
+                generator = f(*args, **kwds)
+                try:
+                    while True:
+                        resumed = perf_counter()
+                        try:
+                            item = next(generator)
+                        except StopIteration as stop:
+                            duration += perf_counter() - resumed
+                            return stop.value
+                        duration += perf_counter() - resumed
+                        count += 1
+                        yield item
+                finally:
+                    generator.close()
+                    _record(name, start, get_attributes(args, kwds, count), duration)
+            return generator_wrapper
+
+        @wraps(f)
+        def wrapper(*args, **kwds):
+            if not _profilers:
+                return f(*args, **kwds)
+
+            result = None
+            start = perf_counter()
+            try:
+                result = f(*args, **kwds)
+                return result
+            finally:
+                _record(name, start, get_attributes(args, kwds, result))
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def span(name, **attributes):
+    """Profile a block of code.
+
+    Parameters
+    ----------
+    name : str
+        Name of the span.
+    attributes : optional
+        Attributes of the span.
+
+    """
+    if not _profilers:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, start, attributes)
@@ -0,0 +1,40 @@
+"""Progress reporting and cancellation of long running operations
+
+:func:`rasterio.warp.reproject`, :meth:`rasterio.warp.WarpPlan.reproject`,
+:func:`rasterio.shutil.copy`, dataset ``build_overviews()``, and
+:func:`rasterio.fill.fillnodata` take two optional keyword arguments.
+
+progress
+    A callable that is called as the operation progresses with two
+    arguments: the completed fraction of the operation, from 0.0 to
+    1.0, and the throughput of the operation in pixels per second. It
+    is called when the operation has advanced by at least 1% since the
+    previous call and when it completes. If it raises an exception, the
+    operation stops and the exception is raised by the operation.
+
+cancel
+    A :class:`CancellationToken`. The operation stops and raises
+    :class:`~rasterio.errors.OperationCancelledError` soon after the
+    token is cancelled. Tokens may be cancelled from any thread.
+
+Between reports, GDAL checks for cancellation without taking Python's
+global interpreter lock.
+
+Examples
+--------
+
+>>> from rasterio.progress import CancellationToken
+>>> token = CancellationToken()
+>>> def progress(fraction, rate):
+...     print("{:.0%} at {:.0f} pixels/s".format(fraction, rate))
+...
+>>> rasterio.shutil.copy(
+...     "tests/data/RGB.byte.tif", "copy.tif", progress=progress,
+...     cancel=token)
+
+"""
+
+from rasterio._base import CancellationToken
+from rasterio.errors import OperationCancelledError
+
+__all__ = ["CancellationToken", "OperationCancelledError"]
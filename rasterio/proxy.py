@@ -0,0 +1,214 @@
+"""Picklable proxies of datasets for process pools
+
+Dataset objects hold GDAL handles and can't be sent to the workers of
+a process pool. A :class:`DatasetProxy` can: it carries the dataset's
+path, open options, the options of the Env in which it was made, and
+a copy of the dataset's header metadata. Header metadata is answered
+from the copy. Other attributes and methods, such as ``read()``, are
+those of a dataset that the proxy opens in the worker on first use,
+within an Env with the carried options.
+
+Opened datasets are cached per process and thread and reused by all
+proxies of the same dataset, so a worker opens a dataset once no matter
+how many tasks it runs.
+
+Examples
+--------
+
+>>> from concurrent.futures import ProcessPoolExecutor
+>>> from rasterio.proxy import DatasetProxy
+>>> def mean(proxy, window):
+...     return proxy.read(1, window=window).mean()
+...
+>>> with rasterio.open("tests/data/RGB.byte.tif") as src:
+...     proxy = DatasetProxy.from_dataset(src)
+...     windows = [window for _, window in src.block_windows(1)]
+...
+>>> with ProcessPoolExecutor() as executor:
+...     means = list(executor.map(mean, [proxy] * len(windows), windows))
+
+"""
+
+from collections import OrderedDict
+import os
+import threading
+
+import rasterio
+from rasterio.env import EnvSnapshot, NullContextManager, snapshot
+
+# The maximum number of datasets opened by proxies that are kept open
+# in each thread.
+MAX_OPEN_DATASETS = 64
+
+# Names of datasets which can't be reopened by name in a worker: those
+# in memory or in Python file objects, which exist only in the process
+# that made them, and warped VRTs.
+_UNPROXIABLE_PREFIXES = ("/vsimem/", "/vsipythonfilelike/", "WarpedVRT(")
+
+# Header metadata attributes copied from datasets.
+_METADATA_ATTRIBUTES = (
+    "name", "driver", "count", "width", "height", "shape", "dtypes",
+    "nodata", "nodatavals", "crs", "transform", "bounds", "res", "indexes",
+    "block_shapes", "profile", "meta",
+)
+
+
+class _DatasetCache(threading.local):
+    """Datasets opened by proxies in a process and thread."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.datasets = OrderedDict()
+
+
+_cache = _DatasetCache()
+
+
+def _cached_datasets():
+    # Handles inherited from a parent process through fork are not
+    # used, and not closed, by the child.
+    if _cache.pid != os.getpid():
+        _cache.pid = os.getpid()
+        _cache.datasets = OrderedDict()
+    return _cache.datasets
+
+
+def clear_cache():
+    """Close the datasets opened by proxies in the current thread."""
+    datasets = _cached_datasets()
+    while datasets:
+        _, dataset = datasets.popitem()
+        dataset.close()
+
+
+class DatasetProxy:
+    """A picklable proxy of a dataset opened in 'r' mode.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Path of the dataset.
+    env_options : dict, optional
+        Options of the Env in which the dataset is opened and read. By
+        default, the options of the current Env, including any
+        credentials.
+    metadata : dict, optional
+        Header metadata of the dataset. By default, the dataset is
+        opened once to get it.
+    kwargs : optional
+        Keyword arguments passed to :func:`rasterio.open`, such as
+        driver names or open options.
+
+    Attributes
+    ----------
+    path : str
+    env_options : dict
+    open_kwargs : dict
+
+    Notes
+    -----
+    Datasets in memory, such as those of MemoryFiles, or in Python file
+    objects exist only in one process and can't be proxied. Neither can
+    WarpedVRTs, which can't be reopened by name. Env options are pickled with the
+    proxy, including any credentials that they hold.
+
+    """
+
+    def __init__(self, path, env_options=None, metadata=None, **kwargs):
+        self.path = os.fspath(path)
+        if self.path.startswith(_UNPROXIABLE_PREFIXES):
+            raise ValueError(
+                "Dataset {!r} can't be reopened by name and can't be "
+                "proxied".format(self.path))
+        if env_options is None:
+            env_options = snapshot().options
+        self.env_options = dict(env_options)
+        self.open_kwargs = kwargs
+        self._snapshot = EnvSnapshot(self.env_options)
+        if metadata is None:
+            with self._env():
+                metadata = _metadata(self._dataset())
+        self._metadata = metadata
+
+    @classmethod
+    def from_dataset(cls, dataset):
+        """Make a proxy of an open dataset.
+
+        Parameters
+        ----------
+        dataset : dataset object
+            A dataset opened in 'r' mode.
+
+        Returns
+        -------
+        DatasetProxy
+
+        Raises
+        ------
+        ValueError
+            If the dataset isn't opened in 'r' mode or can't be reopened
+            by its name.
+
+        """
+        if dataset.mode != "r":
+            raise ValueError("Only datasets opened in 'r' mode can be proxied")
+        kwargs = {"driver": dataset.driver}
+        if dataset.options:
+            kwargs.update(dataset.options)
+        return cls(dataset.name, metadata=_metadata(dataset), **kwargs)
+
+    def __repr__(self):
+        return "<DatasetProxy name='{}'>".format(self.path)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in _METADATA_ATTRIBUTES:
+            return self._metadata[name]
+        attr = getattr(self._dataset(), name)
+        if callable(attr):
+            env = self._env
+
+            def method(*args, **kwargs):
+                with env():
+                    return attr(*args, **kwargs)
+            return method
+        return attr
+
+    def _env(self):
+        """A context in which the proxy's Env options are set.
+
+        In the workers of the executors of :mod:`rasterio.parallel`, the
+        options are usually already set and no Env is entered.
+        """
+        if self._snapshot.is_active():
+            return NullContextManager()
+        return self._snapshot.env()
+
+    def _key(self):
+        return (
+            self.path,
+            tuple(sorted((k, str(v)) for k, v in self.open_kwargs.items())),
+            tuple(sorted((k, str(v)) for k, v in self.env_options.items())),
+        )
+
+    def _dataset(self):
+        """The dataset, opened and cached in this process and thread."""
+        datasets = _cached_datasets()
+        key = self._key()
+        dataset = datasets.get(key)
+        if dataset is None or dataset.closed:
+            with self._env():
+                dataset = rasterio.open(self.path, **self.open_kwargs)
+            datasets[key] = dataset
+            while len(datasets) > MAX_OPEN_DATASETS:
+                _, evicted = datasets.popitem(last=False)
+                evicted.close()
+        else:
+            datasets.move_to_end(key)
+        return dataset
+
+
+def _metadata(dataset):
+    """Copy the header metadata of a dataset."""
+    return {name: getattr(dataset, name) for name in _METADATA_ATTRIBUTES}
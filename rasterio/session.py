@@ -2,6 +2,7 @@
 
 import logging
 import os
+import threading
 
 import rasterio._loading
 with rasterio._loading.add_gdal_dll_directories():
@@ -16,6 +17,24 @@ except ImportError:
     log.debug("Could not import boto3, continuing with reduced functionality.")
     boto3 = None
 
+# Environment variables which may configure default sessions. Cached
+# sessions are made again when they change.
+_CREDENTIAL_ENVIRON_PREFIXES = (
+    "AWS_", "AZURE_", "GOOGLE_", "OS_", "OSS_", "SWIFT_")
+
+# The maximum number of sessions cached in each thread.
+_SESSION_CACHE_MAXSIZE = 16
+
+
+class _SessionCache(threading.local):
+    """Sessions made with default arguments, per thread."""
+
+    def __init__(self):
+        self.sessions = {}
+
+
+_session_cache = _SessionCache()
+
 
 class Session:
     """Base for classes that configure access to secured resources.
@@ -59,6 +78,36 @@ class Session:
         """
         return NotImplemented
 
+    @classmethod
+    def cached(cls):
+        """Get a session made with default arguments.
+
+        Sessions made with default arguments resolve credentials from
+        environment variables and configuration files, which may be
+        slow. They are cached per thread and reused until the
+        environment variables of cloud providers change.
+
+        Returns
+        -------
+        Session
+
+        Notes
+        -----
+        Changes to configuration files, such as AWS's shared
+        credentials file, are not seen by cached sessions.
+
+        """
+        key = (cls, tuple(
+            item for item in os.environ.items()
+            if item[0].startswith(_CREDENTIAL_ENVIRON_PREFIXES)))
+        sessions = _session_cache.sessions
+        session = sessions.get(key)
+        if session is None:
+            if len(sessions) >= _SESSION_CACHE_MAXSIZE:
+                sessions.clear()
+            session = sessions[key] = cls()
+        return session
+
     @staticmethod
     def from_foreign_session(session, cls=None):
         """Create a session object matching the foreign `session`.
@@ -189,7 +238,10 @@ class Session:
 
         """
         try:
-            session = Session.aws_or_dummy(*args, **kwargs)
+            if boto3 is not None and not args and not kwargs:
+                session = AWSSession.cached()
+            else:
+                session = Session.aws_or_dummy(*args, **kwargs)
             session.credentials
         except RuntimeError as exc:
             log.warning("Credentials in environment have expired. Creating a DummySession.")
@@ -211,6 +263,19 @@ class DummySession(Session):
         self._session = None
         self.credentials = {}
 
+    @classmethod
+    def cached(cls):
+        """Get a dummy session.
+
+        Dummy sessions are cheap to make and are not cached.
+
+        Returns
+        -------
+        DummySession
+
+        """
+        return cls()
+
     @classmethod
     def hascreds(cls, config):
         """Determine if the given configuration has proper credentials
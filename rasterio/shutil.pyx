@@ -5,6 +5,7 @@ include "gdal.pxi"
 import logging
 import os
 
+from rasterio._base cimport progress_func, ProgressReporter
 from rasterio._io cimport DatasetReaderBase
 from rasterio._err cimport exc_wrap_int, exc_wrap_pointer
 from rasterio.drivers import driver_from_extension
@@ -49,7 +50,8 @@ def exists(path):
 
 
 @ensure_env_with_credentials
-def copy(src, dst, driver=None, strict=True, **creation_options):
+def copy(src, dst, driver=None, strict=True, progress=None, cancel=None,
+         **creation_options):
 
     """Copy a raster from a path or open dataset handle to a new destination
     with driver specific creation options.
@@ -65,6 +67,12 @@ def copy(src, dst, driver=None, strict=True, **creation_options):
     strict : bool, optional.  Default: True
         Indicates if the output must be strictly equivalent or if the
         driver may adapt as necessary
+    progress : callable, optional
+        A function called as the copy progresses with the completed
+        fraction and the throughput in pixels per second. See
+        :mod:`rasterio.progress`.
+    cancel : CancellationToken, optional
+        A token that stops the copy when cancelled.
     creation_options : dict, optional
         Creation options for output dataset
 
@@ -82,6 +90,8 @@ def copy(src, dst, driver=None, strict=True, **creation_options):
     cdef GDALDatasetH dst_dataset = NULL
     cdef GDALDriverH drv = NULL
     cdef bint close_src = False
+    cdef ProgressReporter reporter = None
+    cdef void *progress_arg = NULL
 
     # Creation options
     for key, val in creation_options.items():
@@ -133,9 +143,21 @@ def copy(src, dst, driver=None, strict=True, **creation_options):
     c_dst_path = dst
 
     try:
+        if progress is not None or cancel is not None:
+            reporter = ProgressReporter(
+                progress, cancel,
+                pixels=(<double>GDALGetRasterXSize(src_dataset) *
+                        GDALGetRasterYSize(src_dataset) *
+                        GDALGetRasterCount(src_dataset)))
+            progress_arg = reporter.arg()
+
         with nogil:
             dst_dataset = GDALCreateCopy(
-                drv, c_dst_path, src_dataset, c_strictness, options, NULL, NULL)
+                drv, c_dst_path, src_dataset, c_strictness, options,
+                <void *>progress_func if progress_arg != NULL else NULL,
+                progress_arg)
+        if reporter is not None:
+            reporter.raise_if_stopped()
         dst_dataset = exc_wrap_pointer(dst_dataset)
 
     finally:
@@ -0,0 +1,281 @@
+"""Aligned stacks of datasets, such as time series
+
+A stack is a sequence of datasets on the same grid: the same shape,
+transform, coordinate reference system, band count and data type. The
+same window of every dataset in a stack is read in a single call, with
+the datasets read concurrently by a pool of threads.
+
+The alignment of the datasets is checked once, when the stack is
+opened. The datasets stay open until the stack is closed, so that
+their handles and block caches are reused between reads. Enable the
+metadata cache of :mod:`rasterio.cache` to make opening a stack of
+files that have been opened before cheaper.
+
+Examples
+--------
+
+>>> from rasterio.stack import open_stack
+>>> with open_stack(paths, workers=8) as stack:
+...     data = stack.read(window=Window(0, 0, 256, 256))
+...
+>>> data.shape
+(365, 3, 256, 256)
+
+"""
+
+import threading
+
+import numpy as np
+
+import rasterio
+from rasterio.parallel import ThreadPoolExecutor
+from rasterio.windows import Window
+
+
+def open_stack(paths, workers=4, **kwargs):
+    """Open an aligned stack of datasets.
+
+    Parameters
+    ----------
+    paths : list of str or PathLike
+        Paths of the datasets, in order.
+    workers : int, optional
+        Number of threads reading the datasets. Default: 4.
+    kwargs : optional
+        Keyword arguments passed to :func:`rasterio.open`, such as
+        driver names or open options.
+
+    Returns
+    -------
+    DatasetStack
+
+    Raises
+    ------
+    ValueError
+        If no paths are given or the datasets are not aligned.
+
+    """
+    return DatasetStack(paths, workers=workers, **kwargs)
+
+
+class DatasetStack:
+    """An aligned stack of datasets opened in 'r' mode.
+
+    Attributes
+    ----------
+    paths : list
+        Paths of the datasets.
+    count : int
+        Number of bands of each dataset.
+    height, width : int
+        Shape of each dataset.
+    shape : tuple
+        Number of datasets, bands, rows and columns.
+    dtype : str
+        Data type of the datasets.
+    transform : Affine
+    crs : CRS
+    nodata : float or None
+        Nodata value of the first dataset.
+    block_shapes : list
+        Block shapes of the bands of the first dataset.
+
+    """
+
+    def __init__(self, paths, workers=4, **kwargs):
+        self.paths = list(paths)
+        if not self.paths:
+            raise ValueError("At least one path is required")
+        self.workers = workers
+        self._datasets = []
+        self._locks = []
+        self._executor = None
+        self._closed = False
+
+        try:
+            for path in self.paths:
+                self._datasets.append(rasterio.open(path, **kwargs))
+                self._locks.append(threading.Lock())
+            self._check_alignment()
+        except Exception:
+            self.close()
+            raise
+
+        first = self._datasets[0]
+        self.count = first.count
+        self.height = first.height
+        self.width = first.width
+        self.dtype = first.dtypes[0]
+        self.transform = first.transform
+        self.crs = first.crs
+        self.nodata = first.nodata
+        self.block_shapes = first.block_shapes
+
+    def _check_alignment(self):
+        first = self._datasets[0]
+        for path, dataset in zip(self.paths[1:], self._datasets[1:]):
+            for name in ("count", "width", "height", "transform", "crs", "dtypes"):
+                if getattr(dataset, name) != getattr(first, name):
+                    raise ValueError(
+                        "{} of {} does not match {}: {!r} != {!r}".format(
+                            name.capitalize(), path, self.paths[0],
+                            getattr(dataset, name), getattr(first, name)))
+
+    def __repr__(self):
+        return "<{} DatasetStack count={} shape={}>".format(
+            "closed" if self._closed else "open", len(self.paths),
+            self.shape)
+
+    def __len__(self):
+        return len(self.paths)
+
+    @property
+    def shape(self):
+        return (len(self.paths), self.count, self.height, self.width)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the datasets and stop the pool of threads."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for dataset in self._datasets:
+            dataset.close()
+        self._datasets = []
+        self._closed = True
+
+    def _read_one(self, index, indexes, window, out, masked):
+        with self._locks[index]:
+            return self._datasets[index].read(
+                indexes, out=out, window=window, masked=masked)
+
+    def read(self, window=None, indexes=None, out=None, masked=False):
+        """Read the same window of every dataset.
+
+        Parameters
+        ----------
+        window : Window, optional
+            The window to read. Default: the whole grid.
+        indexes : int or list, optional
+            Bands to read. If a band index number, the result has no
+            band axis. Default: all bands.
+        out : numpy ndarray, optional
+            An array of the shape of the result, into which the data is
+            read. Its data type may differ from the stack's.
+        masked : bool, optional
+            If True, the result is a masked array. Default: False.
+
+        Returns
+        -------
+        numpy ndarray
+            An array of shape (datasets, bands, rows, columns), or
+            (datasets, rows, columns) if indexes is a band index number.
+
+        Raises
+        ------
+        ValueError
+            If the stack is closed or out has the wrong shape.
+
+        """
+        if self._closed:
+            raise ValueError("DatasetStack is closed")
+
+        if window is None:
+            window = Window(0, 0, self.width, self.height)
+        elif isinstance(window, tuple):
+            window = Window.from_slices(*window, height=self.height, width=self.width)
+
+        if indexes is None:
+            indexes = list(range(1, self.count + 1))
+        height, width = int(round(window.height)), int(round(window.width))
+        if isinstance(indexes, int):
+            shape = (len(self.paths), height, width)
+        else:
+            shape = (len(self.paths), len(indexes), height, width)
+
+        if out is None:
+            out = np.empty(shape, dtype=self.dtype)
+        elif out.shape != shape:
+            raise ValueError(
+                "out has shape {!r}, but the result has shape {!r}".format(
+                    out.shape, shape))
+
+        if masked:
+            mask = np.zeros(shape, dtype=bool)
+
+        if self.workers > 1 and len(self.paths) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            results = self._executor.map(
+                lambda index: self._read_one(index, indexes, window, out[index], masked),
+                range(len(self.paths)))
+        else:
+            results = (
+                self._read_one(index, indexes, window, out[index], masked)
+                for index in range(len(self.paths)))
+
+        for index, result in enumerate(results):
+            if masked:
+                mask[index] = np.ma.getmaskarray(result)
+
+        if masked:
+            return np.ma.masked_array(out, mask=mask, fill_value=self.nodata)
+        return out
+
+    def block_windows(self, bidx=0):
+        """Iterator over the block windows of the first dataset.
+
+        Parameters
+        ----------
+        bidx : int, optional
+            Index of a band, or 0 for the blocks shared by all bands, as
+            in the block_windows method of datasets.
+
+        Yields
+        ------
+        tuple
+            Block row and column indexes and a Window.
+
+        """
+        if self._closed:
+            raise ValueError("DatasetStack is closed")
+        yield from self._datasets[0].block_windows(bidx)
+
+    def iter_blocks(self, indexes=None, out=None, masked=False):
+        """Read the stack block by block.
+
+        Every block is read across all datasets, so that the result for
+        each block is a time series of the block.
+
+        Parameters
+        ----------
+        indexes : int or list, optional
+            Bands to read, as in :meth:`read`.
+        out : numpy ndarray, optional
+            An array as large as the largest block's result, which is
+            reused for every block. The arrays yielded are views on it
+            and are overwritten by the next block.
+        masked : bool, optional
+            If True, blocks are masked arrays. Default: False.
+
+        Yields
+        ------
+        tuple
+            A Window and an array of the data in it.
+
+        """
+        for _, window in self.block_windows():
+            block_out = None
+            if out is not None:
+                block_out = out[..., :window.height, :window.width]
+            yield window, self.read(
+                window=window, indexes=indexes, out=block_out, masked=masked)
@@ -7,6 +7,7 @@ import math
 import sys
 
 from affine import Affine
+import numpy as np
 
 import rasterio._loading
 with rasterio._loading.add_gdal_dll_directories():
@@ -137,16 +138,30 @@ class TransformMethodsMixin:
         return rowcol(transform, x, y, zs=z, op=op, **rpc_options)
 
 
-def get_transformer(transform, **rpc_options):
-    """Return the appropriate transformer class"""
+def get_transformer(transform, approx_error=None, **rpc_options):
+    """Return the appropriate transformer class
+
+    Parameters
+    ----------
+    transform : Affine or sequence of GroundControlPoint or RPC
+        Transform suitable for input to AffineTransformer, GCPTransformer, or RPCTransformer.
+    approx_error : float, optional
+        Maximum error of an approximate GCP or RPC transformer, in units
+        of the transformed coordinates. Ignored for affine transforms,
+        which are always exact. By default, transformers are exact.
+    rpc_options : dict, optional
+        Additional arguments passed to GDALCreateRPCTransformer.
+
+    """
     if transform is None:
         raise ValueError("Invalid transform")
     if isinstance(transform, Affine):
         transformer_cls = partial(AffineTransformer, transform)
     elif isinstance(transform, RPC):
-        transformer_cls = partial(RPCTransformer, transform, **rpc_options)
+        transformer_cls = partial(
+            RPCTransformer, transform, approx_error=approx_error, **rpc_options)
     else:
-        transformer_cls = partial(GCPTransformer, transform)
+        transformer_cls = partial(GCPTransformer, transform, approx_error=approx_error)
     return transformer_cls
 
 
@@ -204,7 +219,7 @@ def array_bounds(height, width, transform):
     return w, s, e, n
 
 
-def xy(transform, rows, cols, zs=None, offset='center', **rpc_options):
+def xy(transform, rows, cols, zs=None, offset='center', approx_error=None, **rpc_options):
     """Get the x and y coordinates of pixels at `rows` and `cols`.
 
     The pixel's center is returned by default, but a corner can be returned
@@ -228,6 +243,12 @@ def xy(transform, rows, cols, zs=None, offset='center', **rpc_options):
     offset : str, optional
         Determines if the returned coordinates are for the center of the
         pixel or for a corner.
+    approx_error : float, optional
+        If given, GCP and RPC based coordinates are approximated by
+        linear interpolation along rows of pixels, with an error no
+        greater than this value in units of the coordinate reference
+        system. This is much faster for dense grids of pixels. Ignored
+        for affine based transformations.
     rpc_options : dict, optional
         Additional arguments passed to GDALCreateRPCTransformer.
 
@@ -239,12 +260,12 @@ def xy(transform, rows, cols, zs=None, offset='center', **rpc_options):
         y coordinates in coordinate reference system
 
     """
-    transformer_cls = get_transformer(transform, **rpc_options)
+    transformer_cls = get_transformer(transform, approx_error=approx_error, **rpc_options)
     with transformer_cls() as transformer:
         return transformer.xy(rows, cols, zs=zs, offset=offset)
 
 
-def rowcol(transform, xs, ys, zs=None, op=math.floor, precision=None, **rpc_options):
+def rowcol(transform, xs, ys, zs=None, op=math.floor, precision=None, approx_error=None, **rpc_options):
     """Get rows and cols of the pixels containing (x, y).
 
     Parameters
@@ -265,6 +286,12 @@ def rowcol(transform, xs, ys, zs=None, op=math.floor, precision=None, **rpc_opti
     precision : int or float, optional
         This parameter is unused, deprecated in rasterio 1.3.0, and
         will be removed in version 2.0.0.
+    approx_error : float, optional
+        If given, GCP and RPC based pixel coordinates are approximated
+        by linear interpolation along rows of equal y values, with an
+        error no greater than this value in pixels. This is much faster
+        for dense grids of coordinates. Ignored for affine based
+        transformations.
     rpc_options : dict, optional
         Additional arguments passed to GDALCreateRPCTransformer.
 
@@ -282,7 +309,7 @@ def rowcol(transform, xs, ys, zs=None, op=math.floor, precision=None, **rpc_opti
             RasterioDeprecationWarning,
         )
 
-    transformer_cls = get_transformer(transform, **rpc_options)
+    transformer_cls = get_transformer(transform, approx_error=approx_error, **rpc_options)
     with transformer_cls() as transformer:
         return transformer.rowcol(xs, ys, zs=zs, op=op)
 
@@ -461,9 +488,58 @@ class TransformerBase():
         except TypeError:
             raise TransformError("Invalid inputs")
     
+    def transform_arrays(self, xs, ys, zs=None, transform_direction=TransformDirection.forward, num_threads=1):
+        """Transform arrays of coordinates.
+
+        A faster alternative to xy and rowcol for large numbers of
+        coordinates. Coordinates are copied once into float64 arrays,
+        no pixel offset or rounding is applied, and points that could
+        not be transformed are reported in a mask instead of a warning.
+
+        Parameters
+        ----------
+        xs, ys : array_like
+            Pixel columns and rows if transform_direction is forward,
+            geographic or projected x and y coordinates if reverse.
+        zs : array_like or float, optional
+            Height associated with coordinates. Primarily used for RPC based
+            coordinate transformations. Ignored for affine based
+            transformations. Default: 0.
+        transform_direction : TransformDirection, optional
+            The transform direction. Default: `TransformDirection.forward`.
+        num_threads : int, optional
+            GCP and RPC based transformations of large arrays may be
+            split between this many threads, each with its own copy of
+            the transformer. Default: 1.
+
+        Raises
+        ------
+        TransformError
+            If input coordinates are not all equal length
+
+        Returns
+        -------
+        xs, ys : ndarray
+            Transformed coordinates with the shape of the input xs.
+            Fractional pixel columns and rows if transform_direction is
+            reverse.
+        success : ndarray
+            Boolean array which is False where a point could not be
+            transformed.
+
+        """
+        try:
+            return self._transform_arrays(
+                xs, ys, zs, transform_direction, num_threads=num_threads)
+        except TypeError:
+            raise TransformError("Invalid inputs")
+
     def _transform(self, xs, ys, zs, transform_direction):
         raise NotImplementedError
 
+    def _transform_arrays(self, xs, ys, zs, transform_direction, num_threads=1):
+        raise NotImplementedError
+
 
 class AffineTransformer(TransformerBase):
     """A pure Python class related to affine based coordinate transformations."""
@@ -491,7 +567,27 @@ class AffineTransformer(TransformerBase):
             resys.append(resy)
         
         return (resxs, resys)
-    
+
+    def _transform_arrays(self, xs, ys, zs, transform_direction, num_threads=1):
+        if transform_direction is TransformDirection.forward:
+            transform = self._transformer
+        elif transform_direction is TransformDirection.reverse:
+            transform = ~self._transformer
+
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        if xs.dtype.kind not in "biuf" or ys.dtype.kind not in "biuf":
+            raise TypeError("Coordinates must be numbers")
+        if xs.shape != ys.shape:
+            raise TransformError("Input coordinates must be of equal length")
+
+        a, b, c, d, e, f = transform[:6]
+        resxs = a * xs + b * ys + c
+        resys = d * xs + e * ys + f
+        return (
+            resxs.astype(np.float64), resys.astype(np.float64),
+            np.ones(xs.shape, dtype=bool))
+
     def __repr__(self):
         return "<AffineTransformer>"
 
@@ -502,15 +598,19 @@ class RPCTransformer(RPCTransformerBase, TransformerBase):
     coordinate transformations.
 
     Uses GDALCreateRPCTransformer and GDALRPCTransform for computations. Options
-    for GDALCreateRPCTransformer may be passed using `rpc_options`.
+    for GDALCreateRPCTransformer may be passed using `rpc_options`. If
+    `approx_error` is given, the transformer is wrapped in an approximate
+    transformer with that maximum error, see GDALCreateApproxTransformer.
     Ensure that GDAL transformer objects are destroyed by calling `close()` 
     method or using context manager interface.
 
     """
-    def __init__(self, rpcs, **rpc_options):
+    def __init__(self, rpcs, approx_error=None, **rpc_options):
         if not isinstance(rpcs, (RPC, dict)):
             raise ValueError("RPCTransformer requires RPC")
-        super().__init__(rpcs, **rpc_options)
+        if approx_error is not None and approx_error < 0:
+            raise ValueError("approx_error must not be negative")
+        super().__init__(rpcs, approx_error=approx_error, **rpc_options)
 
     def __repr__(self):
         return "<{} RPCTransformer>".format(
@@ -523,14 +623,19 @@ class GCPTransformer(GCPTransformerBase, TransformerBase):
     coordinate transformations.
 
     Uses GDALCreateGCPTransformer and GDALGCPTransform for computations.
+    If `approx_error` is given, the transformer is wrapped in an
+    approximate transformer with that maximum error, see
+    GDALCreateApproxTransformer.
     Ensure that GDAL transformer objects are destroyed by calling `close()` 
     method or using context manager interface.
 
     """
-    def __init__(self, gcps):
+    def __init__(self, gcps, approx_error=None):
         if len(gcps) and not isinstance(gcps[0], GroundControlPoint):
             raise ValueError("GCPTransformer requires sequence of GroundControlPoint")
-        super().__init__(gcps)
+        if approx_error is not None and approx_error < 0:
+            raise ValueError("approx_error must not be negative")
+        super().__init__(gcps, approx_error=approx_error)
 
     def __repr__(self):
         return "<{} GCPTransformer>".format(
@@ -1,20 +1,26 @@
 """rasterio.vrt: a module concerned with GDAL VRTs"""
 
+import math
+import os
 import xml.etree.ElementTree as ET
 
 import rasterio._loading
 with rasterio._loading.add_gdal_dll_directories():
     import rasterio
     from rasterio._warp import WarpedVRTReaderBase
+    from rasterio.coords import disjoint_bounds
     from rasterio.dtypes import _gdal_typename
-    from rasterio.enums import MaskFlags
+    from rasterio.enums import MaskFlags, Resampling
+    from rasterio.env import GDALVersion
+    from rasterio.lazy import ArrayMethodsMixin
+    from rasterio.parallel import ThreadPoolExecutor
     from rasterio._path import _parse_path
-    from rasterio.transform import TransformMethodsMixin
+    from rasterio.transform import Affine, TransformMethodsMixin
     from rasterio.windows import WindowMethodsMixin
 
 
 class WarpedVRT(WarpedVRTReaderBase, WindowMethodsMixin,
-                TransformMethodsMixin):
+                TransformMethodsMixin, ArrayMethodsMixin):
     """A virtual warped dataset.
 
     Abstracts the details of raster warping and allows access to data
@@ -247,3 +253,260 @@ def _boundless_vrt_doc(
         dstrect.attrib['ySize'] = str(src_dataset.height)
 
     return ET.tostring(vrtdataset).decode('ascii')
+
+
+_MOSAIC_RESAMPLING = (
+    Resampling.nearest, Resampling.bilinear, Resampling.cubic,
+    Resampling.cubic_spline, Resampling.lanczos, Resampling.average,
+    Resampling.mode, Resampling.gauss, Resampling.rms)
+
+
+def build_mosaic(datasets, bounds=None, res=None, nodata=None, dtype=None,
+                 indexes=None, resampling=Resampling.nearest,
+                 target_aligned_pixels=False, workers=1):
+    """Open a virtual mosaic of many datasets.
+
+    The mosaic is an in-memory GDAL VRT with one source per input
+    dataset. Its pixels are not read until the mosaic is read, and a
+    windowed read only opens and reads the sources that intersect the
+    window. Where sources overlap, the first of them in the list of
+    datasets is read, as with :func:`rasterio.merge.merge`.
+
+    All datasets must have the same number of bands, data types, and
+    coordinate reference system.
+
+    Each dataset given by its filename is opened to read its header
+    metadata. Building a mosaic of many thousands of files is therefore
+    slow, particularly on network filesystems, where every open is one
+    or more requests. The headers can be read by a pool of threads.
+
+    Parameters
+    ----------
+    datasets : list of dataset objects, filenames or PathLike objects
+        Datasets to mosaic. Only their header metadata is read.
+    bounds : tuple, optional
+        Bounds of the mosaic (left, bottom, right, top). If not set,
+        the union of the bounds of the datasets.
+    res : float or tuple, optional
+        Resolution of the mosaic in units of the coordinate reference
+        system. If not set, the resolution of the first dataset.
+    nodata : float, optional
+        Nodata value of the mosaic. If not set, the nodata value of the
+        first dataset.
+    dtype : str or numpy dtype, optional
+        Data type of the mosaic. If not set, the data type of the first
+        dataset.
+    indexes : list of int, optional
+        Bands of the datasets to include. Default: all bands.
+    resampling : Resampling, optional
+        Resampling algorithm used when reading datasets of a different
+        resolution than the mosaic. Default: `Resampling.nearest`.
+    target_aligned_pixels : bool, optional
+        Whether to adjust the bounds of the mosaic so that pixel
+        coordinates are integer multiples of pixel size, matching the
+        ``-tap`` options of GDAL utilities. Default: False.
+    workers : int, optional
+        Number of threads reading the headers of datasets given by
+        filename. Default: 1.
+
+    Returns
+    -------
+    DatasetReader
+        The mosaic, opened in 'r' mode.
+
+    Raises
+    ------
+    ValueError
+        If no datasets are given, their numbers of bands, data types
+        or coordinate reference systems differ, or the resampling
+        algorithm is not supported.
+
+    Examples
+    --------
+
+    >>> with build_mosaic(paths) as mosaic:
+    ...     data = mosaic.read(1, window=Window(0, 0, 512, 512))
+
+    """
+    return rasterio.open(_mosaic_vrt_doc(
+        datasets, bounds=bounds, res=res, nodata=nodata, dtype=dtype,
+        indexes=indexes, resampling=resampling,
+        target_aligned_pixels=target_aligned_pixels, workers=workers))
+
+
+def _mosaic_source(dataset):
+    """Header metadata of a mosaic source.
+
+    Returns
+    -------
+    dict
+    """
+    if isinstance(dataset, (str, os.PathLike)):
+        with rasterio.open(dataset) as src:
+            return _mosaic_source(src)
+
+    return {
+        "path": _parse_path(dataset.name).as_vsi(),
+        "bounds": dataset.bounds,
+        "res": dataset.res,
+        "width": dataset.width,
+        "height": dataset.height,
+        "count": dataset.count,
+        "crs": dataset.crs,
+        "dtypes": dataset.dtypes,
+        "nodata": dataset.nodata,
+        "block_shapes": dataset.block_shapes,
+        "colorinterp": dataset.colorinterp,
+        "all_valid": all(
+            MaskFlags.all_valid in flags for flags in dataset.mask_flag_enums),
+        "options": dataset.options,
+    }
+
+
+def _mosaic_vrt_doc(datasets, bounds=None, res=None, nodata=None, dtype=None,
+                    indexes=None, resampling=Resampling.nearest,
+                    target_aligned_pixels=False, workers=1):
+    """Make a mosaic VRT XML document.
+
+    Parameters are the same as those of build_mosaic.
+
+    Returns
+    -------
+    str
+        An XML text string.
+    """
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sources = list(executor.map(_mosaic_source, datasets))
+    else:
+        sources = [_mosaic_source(dataset) for dataset in datasets]
+    if not sources:
+        raise ValueError("At least one dataset is required")
+    first = sources[0]
+
+    for src in sources[1:]:
+        for name in ("count", "crs", "dtypes"):
+            if src[name] != first[name]:
+                raise ValueError(
+                    "{} of {} does not match {}: {!r} != {!r}".format(
+                        name.capitalize(), src["path"], first["path"],
+                        src[name], first[name]))
+
+    if indexes is None:
+        indexes = list(range(1, first["count"] + 1))
+    elif isinstance(indexes, int):
+        indexes = [indexes]
+
+    if bounds:
+        dst_w, dst_s, dst_e, dst_n = bounds
+    else:
+        dst_w = min(src["bounds"][0] for src in sources)
+        dst_s = min(src["bounds"][1] for src in sources)
+        dst_e = max(src["bounds"][2] for src in sources)
+        dst_n = max(src["bounds"][3] for src in sources)
+
+    if not res:
+        res = first["res"]
+    elif not isinstance(res, (tuple, list)):
+        res = (res, res)
+    elif len(res) == 1:
+        res = (res[0], res[0])
+
+    if target_aligned_pixels:
+        dst_w = math.floor(dst_w / res[0]) * res[0]
+        dst_e = math.ceil(dst_e / res[0]) * res[0]
+        dst_s = math.floor(dst_s / res[1]) * res[1]
+        dst_n = math.ceil(dst_n / res[1]) * res[1]
+
+    width = int(round((dst_e - dst_w) / res[0]))
+    height = int(round((dst_n - dst_s) / res[1]))
+    transform = Affine.translation(dst_w, dst_n) * Affine.scale(res[0], -res[1])
+
+    if nodata is None:
+        nodata = first["nodata"]
+    if dtype is None:
+        dtype = first["dtypes"][indexes[0] - 1]
+
+    # Sources are read by GDALRasterIO(), which supports fewer
+    # algorithms than the warper.
+    if Resampling(resampling) not in _MOSAIC_RESAMPLING:
+        raise ValueError(
+            "resampling must be one of: {0}".format(", ".join(
+                ['Resampling.{0}'.format(r.name) for r in _MOSAIC_RESAMPLING])))
+    resampling_name = Resampling(resampling).name.replace("_", "")
+
+    use_mask_band = GDALVersion.runtime().at_least("3.3")
+
+    vrtdataset = ET.Element('VRTDataset')
+    vrtdataset.attrib['rasterYSize'] = str(height)
+    vrtdataset.attrib['rasterXSize'] = str(width)
+    srs = ET.SubElement(vrtdataset, 'SRS')
+    srs.text = first["crs"].wkt if first["crs"] else ""
+    geotransform = ET.SubElement(vrtdataset, 'GeoTransform')
+    geotransform.text = ','.join([str(v) for v in transform.to_gdal()])
+
+    # Sources that don't intersect the mosaic are left out. GDAL
+    # paints sources in order, so they are listed last to first.
+    sources = [
+        src for src in reversed(sources)
+        if not disjoint_bounds((dst_w, dst_s, dst_e, dst_n), src["bounds"])]
+
+    for band, bidx in enumerate(indexes, 1):
+        vrtrasterband = ET.SubElement(vrtdataset, 'VRTRasterBand')
+        vrtrasterband.attrib['dataType'] = _gdal_typename(dtype)
+        vrtrasterband.attrib['band'] = str(band)
+
+        if nodata is not None:
+            nodatavalue = ET.SubElement(vrtrasterband, 'NoDataValue')
+            nodatavalue.text = str(nodata)
+
+        colorinterp = ET.SubElement(vrtrasterband, 'ColorInterp')
+        colorinterp.text = first["colorinterp"][bidx - 1].name.capitalize()
+
+        for src in sources:
+            src_w, src_s, src_e, src_n = src["bounds"]
+            block_shape = src["block_shapes"][bidx - 1]
+
+            complexsource = ET.SubElement(vrtrasterband, 'ComplexSource')
+            complexsource.attrib['resampling'] = resampling_name
+            sourcefilename = ET.SubElement(complexsource, 'SourceFilename')
+            sourcefilename.attrib['relativeToVRT'] = "0"
+            sourcefilename.attrib["shared"] = "0"
+            sourcefilename.text = src["path"]
+            sourceband = ET.SubElement(complexsource, 'SourceBand')
+            sourceband.text = str(bidx)
+
+            # Source properties let GDAL defer opening the source until
+            # a read intersects it.
+            sourceproperties = ET.SubElement(complexsource, 'SourceProperties')
+            sourceproperties.attrib['RasterXSize'] = str(src["width"])
+            sourceproperties.attrib['RasterYSize'] = str(src["height"])
+            sourceproperties.attrib['dataType'] = _gdal_typename(src["dtypes"][bidx - 1])
+            sourceproperties.attrib['BlockYSize'] = str(block_shape[0])
+            sourceproperties.attrib['BlockXSize'] = str(block_shape[1])
+            srcrect = ET.SubElement(complexsource, 'SrcRect')
+            srcrect.attrib['xOff'] = '0'
+            srcrect.attrib['yOff'] = '0'
+            srcrect.attrib['xSize'] = str(src["width"])
+            srcrect.attrib['ySize'] = str(src["height"])
+            dstrect = ET.SubElement(complexsource, 'DstRect')
+            dstrect.attrib['xOff'] = str((src_w - dst_w) / res[0])
+            dstrect.attrib['yOff'] = str((dst_n - src_n) / res[1])
+            dstrect.attrib['xSize'] = str((src_e - src_w) / res[0])
+            dstrect.attrib['ySize'] = str((src_n - src_s) / res[1])
+
+            if src["nodata"] is not None:
+                nodata_elem = ET.SubElement(complexsource, 'NODATA')
+                nodata_elem.text = str(src["nodata"])
+            elif use_mask_band and not src["all_valid"]:
+                usemaskband = ET.SubElement(complexsource, 'UseMaskBand')
+                usemaskband.text = "true"
+
+            if src["options"]:
+                openoptions = ET.SubElement(complexsource, 'OpenOptions')
+                for ookey, oovalue in src["options"].items():
+                    ooi = ET.SubElement(openoptions, 'OOI')
+                    ooi.attrib['key'] = str(ookey)
+                    ooi.text = str(oovalue)
+
+    return ET.tostring(vrtdataset).decode('ascii')
@@ -1,6 +1,11 @@
 """Raster warping and reprojection."""
 
+from collections import OrderedDict
+from contextlib import ExitStack
 from math import ceil, floor
+import os
+import threading
+from uuid import uuid4
 
 from affine import Affine
 import numpy as np
@@ -9,22 +14,326 @@ import rasterio._loading
 with rasterio._loading.add_gdal_dll_directories():
     import rasterio
 
-    from rasterio._base import _transform
+    from rasterio.coords import disjoint_bounds
     from rasterio.crs import CRS
     from rasterio.enums import Resampling
-    from rasterio.env import ensure_env, require_gdal_version
+    from rasterio.env import ensure_env, get_gdal_config, require_gdal_version
     from rasterio.errors import TransformError, RPCError
+    from rasterio.parallel import (
+        ProcessPoolExecutor, ThreadPoolExecutor, _bounded_map)
+    from rasterio.profiling import profiled, _argument
     from rasterio.transform import array_bounds
+    from rasterio.windows import Window
+    from rasterio import windows
     from rasterio._warp import (
+        CRSTransformerBase,
+        WarpPlanBase,
         _calculate_default_transform,
         _reproject,
-        _transform_bounds,
-        _transform_geom,
         SUPPORTED_RESAMPLING
     )
 
+# Datasets opened by the workers of reproject_dataset, per thread
+# and per source.
+_tile_sources = threading.local()
+
+# Coordinate transformations may not be shared between threads, so
+# each thread has its own cache of transformers.
+_TRANSFORMER_CACHE_MAXSIZE = 32
+_transformer_cache = threading.local()
+
+# Config options read by GDAL and PROJ when a coordinate transformation
+# is made. Transformers are cached per set of values of these options.
+_TRANSFORMER_CONFIG_OPTIONS = (
+    "CHECK_WITH_INVERT_PROJ", "OSR_USE_NON_DEPRECATED",
+    "OSR_DEFAULT_AXIS_MAPPING_STRATEGY", "OGR_CT_FORCE_TRADITIONAL_GIS_ORDER",
+    "OGR_CT_OP_SELECTION", "OGR_ENABLE_PARTIAL_REPROJECTION",
+    "OSR_CT_USE_DEFAULT_EPOCH", "PROJ_NETWORK", "PROJ_CURL_CA_BUNDLE",
+    "PROJ_LIB", "PROJ_DATA",
+)
+
+
+class Transformer(CRSTransformerBase):
+    """Transforms coordinates, bounds, and geometries between two CRS.
+
+    A Transformer sets up the coordinate transformation once. Setting
+    up a transformation can cost more than transforming a few points,
+    so a Transformer should be reused for repeated transformations
+    between the same CRS. The transform, transform_bounds, and
+    transform_geom functions of this module use a cache of
+    transformers.
+
+    Config options such as CHECK_WITH_INVERT_PROJ are read when the
+    Transformer is made, not when it is used. A Transformer must not be
+    used by more than one thread.
+
+    Parameters
+    ----------
+    src_crs : CRS, str, or dict
+        Source coordinate reference system.
+    dst_crs : CRS, str, or dict
+        Target coordinate reference system.
+
+    Examples
+    --------
+
+    >>> with Transformer("EPSG:4326", "EPSG:32618") as transformer:
+    ...     xs, ys = transformer.transform([-78.0], [40.0])
+    ...
+
+    """
+
+    def __init__(self, src_crs, dst_crs):
+        super().__init__(src_crs, dst_crs)
+
+    def __repr__(self):
+        return "<{} Transformer src_crs={!r} dst_crs={!r}>".format(
+            self.closed and "closed" or "open", self.src_crs, self.dst_crs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def transform(self, xs, ys, zs=None, num_threads=1):
+        """Transform vectors of x, y and optionally z.
+
+        Parameters
+        ----------
+        xs, ys : array_like
+            Contain x and y values.
+        zs : array_like, optional
+            Contains z values. Assumed to be all 0 if absent.
+        num_threads : int, optional
+            Number of threads between which large inputs are split.
+
+        Returns
+        -------
+        out: tuple of array_like, (xs, ys, [zs])
+            Tuple of x, y, and optionally z vectors, transformed into
+            the target coordinate reference system. The vectors are
+            float64 ndarrays if xs is an ndarray, otherwise lists.
+
+        """
+        if len(xs) != len(ys):
+            raise TransformError("xs and ys arrays must be the same length")
+        elif zs is not None and len(xs) != len(zs):
+            raise TransformError("zs, xs, and ys arrays must be the same length")
+        if len(xs) == 0 and not isinstance(xs, np.ndarray):
+            return ([], [], []) if zs is not None else ([], [])
+        else:
+            return self._transform(xs, ys, zs, num_threads=num_threads)
+
+    def transform_bounds(self, left, bottom, right, top, densify_pts=21):
+        """Transform bounds, densifying their edges.
+
+        Parameters
+        ----------
+        left, bottom, right, top : float
+            Bounding coordinates in the source CRS.
+        densify_pts : uint, optional
+            Number of points to add to each edge to account for
+            nonlinear edges produced by the transform process.
+
+        Returns
+        -------
+        left, bottom, right, top : float
+            Outermost coordinates in the target CRS.
+
+        """
+        return self._transform_bounds(left, bottom, right, top, densify_pts)
+
+    def transform_bounds_array(self, bounds, densify_pts=21):
+        """Transform many bounds at once.
+
+        The edges of all bounds are densified and transformed in a
+        single call.
+
+        Parameters
+        ----------
+        bounds : array_like
+            An (N, 4) array of left, bottom, right, top in the source CRS.
+        densify_pts : uint, optional
+            Number of points to add to each edge.
+
+        Returns
+        -------
+        ndarray
+            An (N, 4) float64 array of left, bottom, right, top in the
+            target CRS. Rows whose coordinates could not be transformed
+            contain NaN.
+
+        """
+        bounds = np.asarray(bounds, dtype=np.float64)
+        if bounds.ndim != 2 or bounds.shape[1] != 4:
+            raise ValueError("bounds must be an (N, 4) array")
+
+        degree_input = self.src_crs.is_geographic
+        degree_output = self.dst_crs.is_geographic
+
+        if densify_pts < 0:
+            raise ValueError("densify_pts must be positive")
+        if degree_output and densify_pts < 2:
+            raise ValueError("densify_pts must be 2+ for degree output")
+        if self.src_crs == self.dst_crs or len(bounds) == 0:
+            return bounds.copy()
+
+        left, bottom, right, top = bounds.T
+        side_pts = densify_pts + 1
+        width = right - left
+        height = top - bottom
+        if degree_input:
+            # Bounds crossing the antimeridian.
+            width = np.where(right < left, width + 360.0, width)
+            height = np.where(top < bottom, height + 360.0, height)
+        steps = np.arange(side_pts)
+        delta_x = (width / side_pts)[:, np.newaxis] * steps
+        delta_y = (height / side_pts)[:, np.newaxis] * steps
+
+        def edge(values):
+            return np.repeat(values[:, np.newaxis], side_pts, axis=1)
+
+        # Densified rings, one per row: left, bottom, right, top edges.
+        xs = np.concatenate([
+            edge(left), left[:, np.newaxis] + delta_x,
+            edge(right), right[:, np.newaxis] - delta_x], axis=1)
+        ys = np.concatenate([
+            top[:, np.newaxis] - delta_y, edge(bottom),
+            bottom[:, np.newaxis] + delta_y, edge(top)], axis=1)
+
+        xs, ys = self._transform(xs, ys, None)
+
+        if degree_output:
+            out_left = _antimeridian_min(xs)
+            out_right = _antimeridian_max(xs)
+        else:
+            out_left = _finite_reduce(np.min, xs)
+            out_right = _finite_reduce(np.max, xs)
+        out_bottom = _finite_reduce(np.min, ys)
+        out_top = _finite_reduce(np.max, ys)
+
+        if degree_output:
+            # Bounds containing a pole extend to it and around the globe.
+            inverse = _get_transformer(self.dst_crs, self.src_crs)
+            pole_xs, pole_ys = inverse._transform(
+                np.array([0.0, 0.0]), np.array([90.0, -90.0]), None)
+            for pole_x, pole_y, out, lat in zip(
+                    pole_xs, pole_ys, (out_top, out_bottom), (90.0, -90.0)):
+                if not (np.isfinite(pole_x) and np.isfinite(pole_y)):
+                    continue
+                contains = (
+                    (left <= pole_x) & (pole_x <= right)
+                    & (bottom <= pole_y) & (pole_y <= top))
+                out[contains] = lat
+                out_left[contains] = -180.0
+                out_right[contains] = 180.0
+
+        return np.stack([out_left, out_bottom, out_right, out_top], axis=1)
+
+    def transform_geom(
+            self,
+            geom,
+            antimeridian_cutting=True,
+            antimeridian_offset=10.0,
+            precision=-1):
+        """Transform a geometry or geometries.
+
+        Parameters
+        ----------
+        geom : GeoJSON like dict object or iterable of GeoJSON like objects.
+        antimeridian_cutting : bool, optional
+            See rasterio.warp.transform_geom.
+        antimeridian_offset : float, optional
+            See rasterio.warp.transform_geom.
+        precision : float, optional
+            If >= 0, geometry coordinates will be rounded to this
+            number of decimal places.
+
+        Returns
+        -------
+        out : GeoJSON like dict object or list of GeoJSON like objects.
+
+        """
+        return self._transform_geom(
+            geom, antimeridian_cutting, antimeridian_offset, precision)
+
+
+def _finite_reduce(func, values):
+    """Reduce rows, ignoring non-finite values. All-invalid rows are NaN."""
+    finite = np.isfinite(values)
+    fill = np.inf if func is np.min else -np.inf
+    result = func(np.where(finite, values, fill), axis=1)
+    result[~finite.any(axis=1)] = np.nan
+    return result
+
+
+def _antimeridian_crossings(xs):
+    """Find where rings of longitudes cross the antimeridian.
+
+    Returns the number of crossings of each ring and a mask of the
+    points on the positive side of the antimeridian between a
+    -180 -> 180 crossing and the next 180 -> -180 crossing. See
+    rasterio._warp.antimeridian_min for the threshold of 200 degrees.
+    """
+    delta = np.roll(xs, 1, axis=1) - xs
+    with np.errstate(invalid="ignore"):
+        east = delta <= -200
+        west = delta >= 200
+    count = east.sum(axis=1) + west.sum(axis=1)
+    side = np.cumsum(east.astype(np.intp) - west, axis=1)
+    positive = side == side.max(axis=1)[:, np.newaxis]
+    return count, positive
+
+
+def _antimeridian_min(xs):
+    """Vectorized rasterio._warp.antimeridian_min of rows of rings."""
+    count, positive = _antimeridian_crossings(xs)
+    result = _finite_reduce(np.min, xs)
+    crossed = count == 2
+    result[crossed] = _finite_reduce(
+        np.min, np.where(positive, xs, np.inf))[crossed]
+    result[count == 4] = -180.0
+    return result
+
+
+def _antimeridian_max(xs):
+    """Vectorized rasterio._warp.antimeridian_max of rows of rings."""
+    count, positive = _antimeridian_crossings(xs)
+    result = _finite_reduce(np.max, xs)
+    crossed = count == 2
+    result[crossed] = _finite_reduce(
+        np.max, np.where(positive, -np.inf, xs))[crossed]
+    result[count == 4] = 180.0
+    return result
+
+
+def _get_transformer(src_crs, dst_crs):
+    """Get a cached Transformer for the current thread."""
+    src_crs = CRS.from_user_input(src_crs)
+    dst_crs = CRS.from_user_input(dst_crs)
+    key = (src_crs.wkt, dst_crs.wkt) + tuple(
+        get_gdal_config(name, normalize=False)
+        for name in _TRANSFORMER_CONFIG_OPTIONS)
+
+    try:
+        cache = _transformer_cache.transformers
+    except AttributeError:
+        cache = _transformer_cache.transformers = OrderedDict()
+
+    transformer = cache.get(key)
+    if transformer is None:
+        transformer = Transformer(src_crs, dst_crs)
+        cache[key] = transformer
+        while len(cache) > _TRANSFORMER_CACHE_MAXSIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return transformer
+
+
 @ensure_env
-def transform(src_crs, dst_crs, xs, ys, zs=None):
+def transform(src_crs, dst_crs, xs, ys, zs=None, num_threads=1):
 
     """Transform vectors from source to target coordinate reference system.
 
@@ -44,22 +353,24 @@ def transform(src_crs, dst_crs, xs, ys, zs=None):
         Contains y values.
     zs: array_like, optional
         Contains z values.  Assumed to be all 0 if absent.
+    num_threads: int, optional
+        Number of threads between which large inputs are split, each
+        with its own coordinate transformation. Default: 1.
 
     Returns
     ---------
     out: tuple of array_like, (xs, ys, [zs])
         Tuple of x, y, and optionally z vectors, transformed into the target
-        coordinate reference system.
+        coordinate reference system. If xs is an ndarray, the vectors are
+        float64 ndarrays of the same shape, otherwise they are lists.
+
+    Notes
+    -----
+    Coordinates are transformed without holding the GIL.
 
     """
-    if len(xs) != len(ys):
-        raise TransformError("xs and ys arrays must be the same length")
-    elif zs is not None and len(xs) != len(zs):
-        raise TransformError("zs, xs, and ys arrays must be the same length")
-    if len(xs) == 0:
-        return ([], [], []) if zs is not None else ([], [])
-    else:
-        return _transform(src_crs, dst_crs, xs, ys, zs)
+    return _get_transformer(src_crs, dst_crs).transform(
+        xs, ys, zs, num_threads=num_threads)
 
 
 @ensure_env
@@ -103,9 +414,7 @@ def transform_geom(
         Transformed geometry(s) in GeoJSON dict format
     """
 
-    return _transform_geom(
-        src_crs,
-        dst_crs,
+    return _get_transformer(src_crs, dst_crs).transform_geom(
         geom,
         antimeridian_cutting,
         antimeridian_offset,
@@ -146,11 +455,7 @@ def transform_bounds(
     left, bottom, right, top: float
         Outermost coordinates in target coordinate reference system.
     """
-    src_crs = CRS.from_user_input(src_crs)
-    dst_crs = CRS.from_user_input(dst_crs)
-    return _transform_bounds(
-        src_crs,
-        dst_crs,
+    return _get_transformer(src_crs, dst_crs).transform_bounds(
         left,
         bottom,
         right,
@@ -159,12 +464,65 @@ def transform_bounds(
     )
 
 
+def transform_bounds_array(src_crs, dst_crs, bounds, densify_pts=21):
+    """Transform many bounds from src_crs to dst_crs.
+
+    A vectorized variant of transform_bounds. The edges of all bounds
+    are densified and transformed in a single call and the outermost
+    coordinates, with antimeridian handling for geographic output, are
+    found with array operations.
+
+    Parameters
+    ----------
+    src_crs: CRS or dict
+        Source coordinate reference system.
+    dst_crs: CRS or dict
+        Target coordinate reference system.
+    bounds: array_like
+        An (N, 4) array of left, bottom, right, top in src_crs.
+    densify_pts: uint, optional
+        Number of points to add to each edge to account for nonlinear
+        edges produced by the transform process. Default: 21.
+
+    Returns
+    -------
+    ndarray
+        An (N, 4) float64 array of left, bottom, right, top in dst_crs.
+
+    Notes
+    -----
+    Results may differ from those of transform_bounds in the last
+    digits.
+
+    """
+    return _get_transformer(src_crs, dst_crs).transform_bounds_array(
+        bounds, densify_pts=densify_pts)
+
+
+def _reproject_span_attributes(args, kwds, result):
+    """Profiling span attributes of a reproject call."""
+    source = _argument(args, kwds, 0, "source")
+    destination = _argument(args, kwds, 1, "destination")
+    if isinstance(source, rasterio.Band):
+        source = source.ds
+    if isinstance(destination, rasterio.Band):
+        destination = destination.ds
+    return {
+        "path": getattr(source, "name", None),
+        "dst_path": getattr(destination, "name", None),
+        "resampling": kwds.get("resampling", Resampling.nearest),
+        "bytes": getattr(result[0] if result else None, "nbytes", None),
+    }
+
+
+@profiled("reproject", _reproject_span_attributes)
 @ensure_env
 def reproject(source, destination=None, src_transform=None, gcps=None, rpcs=None,
               src_crs=None, src_nodata=None, dst_transform=None, dst_crs=None,
               dst_nodata=None, dst_resolution=None, src_alpha=0, dst_alpha=0,
               resampling=Resampling.nearest, num_threads=1,
-              init_dest_nodata=True, warp_mem_limit=0, **kwargs):
+              init_dest_nodata=True, warp_mem_limit=0, progress=None,
+              cancel=None, **kwargs):
     """Reproject a source raster to a destination raster.
 
     If the source and destination are ndarrays, coordinate reference
@@ -247,6 +605,13 @@ def reproject(source, destination=None, src_transform=None, gcps=None, rpcs=None
         memory required to warp a 3-band uint8 2000 row x 2000 col
         raster to a destination of the same size is approximately
         56 MB. The default (0) means 64 MB with GDAL 2.2.
+    progress : callable, optional
+        A function called as the warp progresses with two arguments:
+        the completed fraction, from 0.0 to 1.0, and the throughput in
+        pixels per second. See :mod:`rasterio.progress`.
+    cancel : CancellationToken, optional
+        A token that stops the warp when cancelled, from any thread.
+        See :mod:`rasterio.progress`.
     kwargs:  dict, optional
         Additional arguments passed to both the image to image
         transformer :cpp:func:`GDALCreateGenImgProjTransformer2` (for example,
@@ -266,18 +631,7 @@ def reproject(source, destination=None, src_transform=None, gcps=None, rpcs=None
         raise ValueError("src_transform, gcps, and rpcs are mutually "
                          "exclusive parameters and may not be used together.")
 
-    # Guard against invalid or unsupported resampling algorithms.
-    try:
-        if resampling == 7:
-            raise ValueError("Gauss resampling is not supported")
-
-        Resampling(resampling)
-
-    except ValueError:
-        raise ValueError(
-            "resampling must be one of: {0}".format(", ".join(
-                ['Resampling.{0}'.format(r.name) for r in
-                 SUPPORTED_RESAMPLING])))
+    _check_resampling(resampling)
 
     if destination is None and dst_transform is not None:
         raise ValueError("Must provide destination if dst_transform is provided.")
@@ -349,11 +703,171 @@ def reproject(source, destination=None, src_transform=None, gcps=None, rpcs=None
         dst_crs=dst_crs, dst_nodata=dst_nodata, dst_alpha=dst_alpha,
         src_alpha=src_alpha, resampling=resampling,
         init_dest_nodata=init_dest_nodata, num_threads=num_threads,
-        warp_mem_limit=warp_mem_limit, **kwargs)
+        warp_mem_limit=warp_mem_limit, progress=progress, cancel=cancel,
+        **kwargs)
 
     return destination, dst_transform
 
 
+def _check_resampling(resampling):
+    """Guard against invalid or unsupported resampling algorithms."""
+    try:
+        if resampling == 7:
+            raise ValueError("Gauss resampling is not supported")
+
+        Resampling(resampling)
+
+    except ValueError:
+        raise ValueError(
+            "resampling must be one of: {0}".format(", ".join(
+                ['Resampling.{0}'.format(r.name) for r in
+                 SUPPORTED_RESAMPLING])))
+
+
+class WarpPlan(WarpPlanBase):
+    """A reusable plan for reprojections between two fixed grids.
+
+    A WarpPlan creates the image to image transformer of a reprojection
+    once. The chunks of the warp and the source window of each chunk
+    are computed on the first reprojection and reused by later ones
+    with the same number of bands and data type. Reprojecting many
+    bands or time steps which share a source and destination grid
+    with a plan leaves only the pixel work to each call.
+
+    A WarpPlan must not be used by more than one thread at a time.
+
+    Parameters
+    ----------
+    src_shape : tuple
+        Height and width of the source grid.
+    src_transform : Affine
+        Source affine transformation. Must be None if gcps or rpcs are
+        given.
+    src_crs : CRS, str, or dict
+        Source coordinate reference system.
+    dst_shape : tuple
+        Height and width of the destination grid.
+    dst_transform : Affine
+        Target affine transformation.
+    dst_crs : CRS, str, or dict
+        Target coordinate reference system.
+    resampling : int, rasterio.enums.Resampling, optional
+        Resampling method to use. Default is
+        :attr:`rasterio.enums.Resampling.nearest`.
+    num_threads : int, optional
+        The number of warp worker threads. Default: 1.
+    warp_mem_limit : int, optional
+        The warp operation memory limit in MB. The default (0) means
+        64 MB.
+    gcps : sequence of GroundControlPoint, optional
+        Ground control points for the source.
+    rpcs : RPC or dict, optional
+        Rational polynomial coefficients for the source.
+    kwargs : dict, optional
+        Additional arguments passed to both the image to image
+        transformer and the warp options, as in :func:`reproject`.
+
+    Examples
+    --------
+
+    >>> with WarpPlan(
+    ...         src.shape, src.transform, src.crs,
+    ...         (height, width), dst_transform, "EPSG:4326",
+    ...         resampling=Resampling.bilinear) as plan:
+    ...     for bidx in src.indexes:
+    ...         plan.reproject(src.read(bidx), destination[bidx - 1])
+    ...
+
+    """
+
+    def __init__(self, src_shape, src_transform, src_crs, dst_shape,
+                 dst_transform, dst_crs, resampling=Resampling.nearest,
+                 num_threads=1, warp_mem_limit=0, gcps=None, rpcs=None,
+                 **kwargs):
+        if (src_transform and gcps) or (src_transform and rpcs) or (gcps and rpcs):
+            raise ValueError("src_transform, gcps, and rpcs are mutually "
+                             "exclusive parameters and may not be used together.")
+        _check_resampling(resampling)
+        super().__init__(
+            src_shape, src_transform, src_crs, dst_shape, dst_transform,
+            dst_crs, gcps=gcps, rpcs=rpcs, **kwargs)
+        self.resampling = resampling
+        self.num_threads = num_threads
+        self.warp_mem_limit = warp_mem_limit
+        self.options = kwargs
+
+    def __repr__(self):
+        return "<{} WarpPlan src_shape={!r} dst_shape={!r}>".format(
+            self.closed and "closed" or "open", self.src_shape, self.dst_shape)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @ensure_env
+    def reproject(self, source, destination, src_nodata=None, dst_nodata=None,
+                  src_alpha=0, dst_alpha=0, init_dest_nodata=True,
+                  progress=None, cancel=None):
+        """Reproject a source raster to a destination raster.
+
+        Parameters
+        ----------
+        source : ndarray or Band
+            A 2 or 3-D ndarray, or a rasterio Band, with the shape of
+            the plan's source grid.
+        destination : ndarray or Band
+            A 2 or 3-D ndarray, or a rasterio Band, with the shape of
+            the plan's destination grid.
+        src_nodata : int or float, optional
+            The source nodata value, as in :func:`reproject`.
+        dst_nodata : int or float, optional
+            The destination nodata value, as in :func:`reproject`.
+        src_alpha : int, optional
+            Index of a band to use as the alpha band when warping.
+        dst_alpha : int, optional
+            Index of a band to use as the alpha band when warping.
+        init_dest_nodata : bool, optional
+            Flag to specify initialization of nodata in destination;
+            prevents overwrite of previous warps. Defaults to True.
+        progress : callable, optional
+            A progress callback, as in :func:`reproject`.
+        cancel : CancellationToken, optional
+            A cancellation token, as in :func:`reproject`.
+
+        Returns
+        -------
+        destination : ndarray or Band
+
+        Raises
+        ------
+        ValueError
+            If the plan is closed or the shape of the source or
+            destination doesn't match the plan.
+
+        """
+        for name, raster, shape in (
+                ("source", source, self.src_shape),
+                ("destination", destination, self.dst_shape)):
+            raster_shape = raster.shape if isinstance(raster, rasterio.Band) else np.shape(raster)
+            if tuple(raster_shape[-2:]) != shape:
+                raise ValueError(
+                    "Shape of {} {!r} does not match the plan's {!r}".format(
+                        name, tuple(raster_shape[-2:]), shape))
+
+        _reproject(
+            source, destination, src_transform=self.src_transform,
+            gcps=self.gcps, rpcs=self.rpcs, src_crs=self.src_crs,
+            src_nodata=src_nodata, dst_transform=self.dst_transform,
+            dst_crs=self.dst_crs, dst_nodata=dst_nodata, dst_alpha=dst_alpha,
+            src_alpha=src_alpha, resampling=self.resampling,
+            init_dest_nodata=init_dest_nodata, num_threads=self.num_threads,
+            warp_mem_limit=self.warp_mem_limit, plan=self, progress=progress,
+            cancel=cancel, **self.options)
+        return destination
+
+
 def aligned_target(transform, width, height, resolution):
     """Aligns target to specified resolution
 
@@ -525,3 +1039,252 @@ def calculate_default_transform(
                             dst_affine.d, dst_affine.e * yratio, dst_affine.f)
 
     return dst_affine, dst_width, dst_height
+
+
+class _TileSource:
+    """A source of reproject_dataset, opened once per worker.
+
+    Workers open the dataset by its name, with its driver and open
+    options. The datasets opened by worker threads are closed by
+    close(). Those opened by worker processes are released when the
+    processes exit.
+
+    """
+
+    def __init__(self, dataset):
+        self.name = dataset.name
+        self.driver = dataset.driver
+        self.options = dict(dataset.options or {})
+        self._token = uuid4().hex
+        self._opened = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {
+            "name": self.name, "driver": self.driver,
+            "options": self.options, "_token": self._token}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._opened = []
+        self._lock = threading.Lock()
+
+    def open(self):
+        """The dataset of the current thread, opened on first use."""
+        sources = getattr(_tile_sources, "datasets", None)
+        if sources is None:
+            sources = _tile_sources.datasets = {}
+        dataset = sources.get(self._token)
+        if dataset is None or dataset.closed:
+            dataset = sources[self._token] = rasterio.open(
+                self.name, driver=self.driver, **self.options)
+            with self._lock:
+                self._opened.append(dataset)
+        return dataset
+
+    def close(self):
+        """Close the datasets opened in this process."""
+        with self._lock:
+            opened, self._opened = self._opened, []
+        for dataset in opened:
+            dataset.close()
+
+
+def _reproject_tile(src, indexes, window, dst_transform, dst_crs, dtype,
+                    src_nodata, dst_nodata, resampling, num_threads,
+                    warp_mem_limit, kwargs):
+    """Reproject one tile of reproject_dataset's destination.
+
+    src is a dataset or, in workers, a _TileSource.
+
+    """
+    if isinstance(src, _TileSource):
+        src = src.open()
+
+    destination = np.full(
+        (len(indexes), window.height, window.width),
+        0 if dst_nodata is None else dst_nodata, dtype=dtype)
+    reproject(
+        rasterio.band(src, indexes), destination, src_nodata=src_nodata,
+        dst_transform=windows.transform(window, dst_transform),
+        dst_crs=dst_crs, dst_nodata=dst_nodata, resampling=resampling,
+        num_threads=num_threads, warp_mem_limit=warp_mem_limit, **kwargs)
+    return window, destination
+
+
+@ensure_env
+def reproject_dataset(src, dst_path, dst_crs=None, dst_transform=None,
+                      dst_width=None, dst_height=None, dst_resolution=None,
+                      indexes=None, src_nodata=None, dst_nodata=None,
+                      resampling=Resampling.nearest, tile_size=512,
+                      workers=1, mode="thread", num_threads=1,
+                      warp_mem_limit=0, driver="GTiff",
+                      creation_options=None, **kwargs):
+    """Reproject a dataset to a new dataset, tile by tile.
+
+    The destination is split into tiles aligned with its blocks. Each
+    tile is warped independently, reading only the source window that
+    it needs, and written to the destination as soon as it is done.
+    Memory use is bounded by the size and number of tiles in flight,
+    not by the size of the destination. Tiles which don't overlap the
+    source are skipped.
+
+    Tiles may be warped in a pool of threads or processes. Each worker
+    opens the source dataset by its name, with its driver and open
+    options, and keeps it open until the pool is done. The source must
+    be readable by name from the workers: datasets in a MemoryFile
+    can't be used with the process mode. Workers run in the Env of the
+    calling thread, which they enter once. Tiles are written by the
+    calling thread.
+
+    Parameters
+    ----------
+    src : dataset object or str
+        The source dataset or its path.
+    dst_path : str or os.PathLike
+        Path of the destination dataset.
+    dst_crs : CRS, str, or dict, optional
+        Target coordinate reference system. Default: the source's.
+    dst_transform : Affine, optional
+        Target affine transformation. Requires dst_width and
+        dst_height. By default, it is calculated with
+        :func:`calculate_default_transform`.
+    dst_width, dst_height : int, optional
+        Target dimensions.
+    dst_resolution : tuple (x resolution, y resolution) or float, optional
+        Target resolution, in units of the target coordinate reference
+        system. Used only if dst_transform is not given.
+    indexes : list of int, optional
+        Source bands to reproject. Default: all bands.
+    src_nodata : int or float, optional
+        The source nodata value. Default: the source's nodata value.
+    dst_nodata : int or float, optional
+        The destination nodata value. Default: src_nodata or the
+        source's nodata value.
+    resampling : int, rasterio.enums.Resampling, optional
+        Resampling method to use. Default is
+        :attr:`rasterio.enums.Resampling.nearest`.
+    tile_size : int, optional
+        Approximate height and width of tiles in pixels. Tiles are
+        whole multiples of the destination's block size. For the GTiff
+        driver, the destination's blocks are tile_size pixels square if
+        tile_size is a multiple of 16. Default: 512.
+    workers : int, optional
+        The number of threads or processes between which tiles are
+        shared. Default: 1, warp tiles in the calling thread.
+    mode : str, optional
+        "thread" or "process". Default: "thread".
+    num_threads : int, optional
+        The number of warp worker threads of each tile's warp.
+        Default: 1.
+    warp_mem_limit : int, optional
+        The memory limit in MB of each tile's warp operation. The
+        default (0) means 64 MB.
+    driver : str, optional
+        Format driver of the destination. Default: "GTiff".
+    creation_options : dict, optional
+        Additional creation options for the destination dataset.
+    kwargs : dict, optional
+        Additional arguments passed to :func:`reproject`.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If mode, tile_size, or the destination grid is invalid.
+
+    """
+    if mode not in ("thread", "process"):
+        raise ValueError("mode must be 'thread' or 'process'")
+    if tile_size < 1:
+        raise ValueError("tile_size must be a positive integer")
+    if dst_transform is not None and (dst_width is None or dst_height is None):
+        raise ValueError("dst_width and dst_height are required with dst_transform")
+    _check_resampling(resampling)
+
+    with ExitStack() as stack:
+        if isinstance(src, (str, os.PathLike)):
+            src = stack.enter_context(rasterio.open(src))
+
+        gcps, gcps_crs = src.gcps
+        src_crs = src.crs or gcps_crs
+        dst_crs = dst_crs or src_crs
+        indexes = list(indexes or src.indexes)
+        if src_nodata is None:
+            src_nodata = src.nodata
+        if dst_nodata is None:
+            dst_nodata = src_nodata
+
+        if dst_transform is None:
+            if gcps and src.transform.is_identity:
+                left = bottom = right = top = None
+            else:
+                gcps = None
+                left, bottom, right, top = src.bounds
+            dst_transform, dst_width, dst_height = calculate_default_transform(
+                src_crs, dst_crs, src.width, src.height, left=left,
+                bottom=bottom, right=right, top=top, gcps=gcps,
+                dst_width=dst_width, dst_height=dst_height,
+                resolution=dst_resolution)
+
+        profile = src.profile
+        profile.update(
+            driver=driver, crs=dst_crs, transform=dst_transform,
+            width=dst_width, height=dst_height, count=len(indexes),
+            dtype=src.dtypes[indexes[0] - 1], nodata=dst_nodata)
+        for key in ("tiled", "blockxsize", "blockysize"):
+            profile.pop(key, None)
+        if driver == "GTiff" and tile_size % 16 == 0:
+            profile.update(tiled=True, blockxsize=tile_size, blockysize=tile_size)
+        profile.update(creation_options or {})
+
+        # Tiles which don't overlap the source can be skipped when its
+        # bounds are known.
+        src_bounds = None if src.transform.is_identity else src.bounds
+
+        def tiles(dst):
+            block_height, block_width = dst.block_shapes[0]
+            tile_height = max(tile_size // block_height, 1) * block_height
+            tile_width = max(tile_size // block_width, 1) * block_width
+            for row_off in range(0, dst.height, tile_height):
+                for col_off in range(0, dst.width, tile_width):
+                    window = Window(
+                        col_off, row_off, min(tile_width, dst.width - col_off),
+                        min(tile_height, dst.height - row_off))
+                    if src_bounds is not None:
+                        try:
+                            tile_bounds = transform_bounds(
+                                dst_crs, src_crs,
+                                *windows.bounds(window, dst_transform))
+                        except Exception:
+                            pass
+                        else:
+                            if disjoint_bounds(tile_bounds, src_bounds):
+                                continue
+                    yield window
+
+        args = (
+            dst_transform, dst_crs, profile["dtype"], src_nodata, dst_nodata,
+            resampling, num_threads, warp_mem_limit, kwargs)
+
+        with rasterio.open(dst_path, "w", **profile) as dst:
+            if workers <= 1:
+                for window in tiles(dst):
+                    window, data = _reproject_tile(src, indexes, window, *args)
+                    dst.write(data, window=window)
+                return
+
+            tile_source = _TileSource(src)
+            stack.callback(tile_source.close)
+            executor_cls = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+            with executor_cls(max_workers=workers) as executor:
+                # Bound the number of tiles in memory.
+                results = _bounded_map(
+                    executor, _reproject_tile,
+                    ((tile_source, indexes, window) + args for window in tiles(dst)),
+                    2 * workers)
+                for window, data in results:
+                    dst.write(data, window=window)
@@ -482,6 +482,19 @@ def gdalenv(request):
     request.addfinalizer(fin)
 
 
+@pytest.fixture(scope='function')
+def session_cache(request):
+    """Start and end a test with no sessions cached in this thread."""
+    import rasterio.session
+
+    rasterio.session._session_cache.sessions.clear()
+
+    def fin():
+        rasterio.session._session_cache.sessions.clear()
+
+    request.addfinalizer(fin)
+
+
 @pytest.fixture(scope='session')
 def data_dir():
     """Absolute file path to the directory containing test datasets."""
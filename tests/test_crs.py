@@ -655,3 +655,60 @@ def test_crs_proj_json__from_string():
 
 def test_crs_compound_epsg():
     assert CRS.from_string("EPSG:4326+3855").to_wkt().startswith("COMPD")
+
+
+@pytest.mark.parametrize(
+    "factory, arg",
+    [
+        (CRS.from_epsg, 4326),
+        (CRS.from_string, "EPSG:4326"),
+        (CRS.from_user_input, "+proj=longlat +datum=WGS84 +no_defs"),
+        (CRS.from_proj4, "+proj=longlat +datum=WGS84 +no_defs"),
+        (CRS.from_wkt, CRS.from_epsg(4326).to_wkt()),
+    ],
+)
+def test_interned(factory, arg):
+    """Equal inputs return the same CRS object"""
+    assert factory(arg) is factory(arg)
+
+
+def test_interned_eq_identity():
+    """Interned objects compare equal without OSRIsSame"""
+    crs = CRS.from_string("+proj=aeqd +lon_0=-80 +lat_0=40.5")
+    assert crs == "+proj=aeqd +lon_0=-80 +lat_0=40.5"
+
+
+def test_interned_config():
+    """CRS parsed with different config options are not shared"""
+    crs = CRS.from_epsg(2163)
+    with rasterio.Env(OSR_USE_NON_DEPRECATED="NO"):
+        other = CRS.from_epsg(2163)
+        assert other is not crs
+        assert CRS.from_epsg(2163) is other
+    assert CRS.from_epsg(2163) is crs
+
+
+def test_data_is_a_copy():
+    """Changing the data of an interned CRS doesn't change the CRS"""
+    crs = CRS.from_string("+proj=aeqd +lon_0=-80 +lat_0=40.5")
+    crs.data["lon_0"] = 0
+    assert CRS.from_string("+proj=aeqd +lon_0=-80 +lat_0=40.5").data["lon_0"] == -80
+
+
+def test_pickle_from_wkt():
+    """A CRS fresh from WKT, with no data yet, can be pickled and copied"""
+    crs = CRS.from_wkt(CRS.from_epsg(3035).to_wkt())
+    crs2 = pickle.loads(pickle.dumps(crs))
+    assert crs2 == crs
+    assert crs2.data == crs.data
+    assert copy.copy(crs) == crs
+
+
+def test_pickle_reuses_parsed_crs():
+    """Unpickled CRS are equal and share their cached attributes"""
+    crs = CRS.from_epsg(32618)
+    crs2 = pickle.loads(pickle.dumps(crs))
+    crs3 = pickle.loads(pickle.dumps(crs))
+    assert crs2 == crs3 == crs
+    assert crs2.to_epsg() == 32618
+    assert hash(crs2) == hash(crs3)
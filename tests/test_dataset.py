@@ -58,6 +58,27 @@ def test_untiled_dataset_blocksize(tmpdir):
         assert dataset.block_shapes == [(13, 23)]
 
 
+def test_lazy_attributes(path_rgb_byte_tif):
+    """The CRS, data types, and nodata values are read on first access"""
+    with rasterio.open(path_rgb_byte_tif) as dataset:
+        assert dataset._crs is None
+        assert dataset._dtypes == []
+        assert dataset._nodatavals == []
+        crs = dataset.crs
+        assert crs == "EPSG:32618"
+        assert dataset.crs is crs
+        assert dataset.dtypes == ("uint8",) * 3
+
+
+def test_lazy_attributes_after_close(path_rgb_byte_tif):
+    """Attributes that were not accessed remain available after closing"""
+    with rasterio.open(path_rgb_byte_tif) as dataset:
+        pass
+    assert dataset.crs == "EPSG:32618"
+    assert dataset.meta["dtype"] == "uint8"
+    assert dataset.nodata == 0
+
+
 def test_dataset_readonly_attributes(path_rgb_byte_tif):
     """Attempts to set read-only attributes fail with DatasetAttributeError"""
     with pytest.raises(DatasetAttributeError):
@@ -1,7 +1,9 @@
 # Tests requiring S3 credentials.
 # Collected here to make them easier to skip/xfail.
 
+from concurrent.futures import ThreadPoolExecutor
 import os
+import pickle
 import sys
 from unittest import mock
 
@@ -12,6 +14,7 @@ import rasterio
 from rasterio import _env
 from rasterio._env import del_gdal_config, get_gdal_config, set_gdal_config
 from rasterio.env import Env, defenv, delenv, getenv, setenv, ensure_env, ensure_env_credentialled
+from rasterio.env import snapshot
 from rasterio.env import GDALVersion, require_gdal_version
 from rasterio.errors import EnvError, RasterioIOError, GDALVersionError
 from rasterio.rio.main import main_group
@@ -488,6 +491,46 @@ def test_have_registered_drivers():
         assert rasterio.env.local._env._have_registered_drivers
 
 
+def test_drivers_registered_once():
+    """Drivers are registered by the first environment of a process."""
+    with rasterio.Env():
+        assert _env._drivers_registered
+    with rasterio.Env():
+        assert rasterio.env.local._env._have_registered_drivers
+
+
+def test_nested_env_restores_changed_options(gdalenv):
+    """A nested env restores only the options it changed."""
+    with rasterio.Env(CPL_DEBUG=True, GDAL_HTTP_MAX_RETRY=2):
+        outer = rasterio.env.local._env
+        with rasterio.Env(GDAL_HTTP_MAX_RETRY=3, CHECK_WITH_INVERT_PROJ=True):
+            assert get_gdal_config('GDAL_HTTP_MAX_RETRY') == 3
+            assert get_gdal_config('CHECK_WITH_INVERT_PROJ') is True
+            assert get_gdal_config('CPL_DEBUG') is True
+        assert rasterio.env.local._env is outer
+        assert get_gdal_config('GDAL_HTTP_MAX_RETRY') == 2
+        assert get_gdal_config('CHECK_WITH_INVERT_PROJ') is None
+        assert 'CHECK_WITH_INVERT_PROJ' not in getenv()
+        assert getenv()['CPL_DEBUG'] is True
+
+
+def test_ensure_env_credentials_session_cached(monkeypatch, gdalenv, session_cache):
+    """Credentials are resolved once for repeated calls"""
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'id')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'key')
+
+    @rasterio.env.ensure_env_with_credentials
+    def f(path):
+        return rasterio.env.local._env
+
+    with mock.patch("rasterio.session.AWSSession.__init__", return_value=None) as init:
+        with mock.patch("rasterio.session.AWSSession.get_credential_options", return_value={}):
+            monkeypatch.setenv('AWS_REGION', 'null-island-1')
+            f('s3://bucket/a.tif')
+            f('s3://bucket/b.tif')
+    assert init.call_count == 1
+
+
 def test_gdal_cachemax():
     """``GDAL_CACHEMAX`` is a special case."""
     original_cachemax = get_gdal_config('GDAL_CACHEMAX')
@@ -823,6 +866,45 @@ def test_nested_credentials(monkeypatch):
         assert gdalenv['AWS_SECRET_ACCESS_KEY'] == 'bar'
 
 
+def test_snapshot_credentials():
+    """Snapshots carry credentials, which Env's constructor refuses."""
+    session = AWSSession(aws_access_key_id='foo', aws_secret_access_key='bar')
+    with rasterio.Env(session=session, CPL_DEBUG=True):
+        snap = snapshot()
+        assert snap.is_active()
+    assert snap.options['AWS_ACCESS_KEY_ID'] == 'foo'
+    assert not snap.is_active()
+    with snap.env():
+        assert snap.is_active()
+        assert getenv()['AWS_SECRET_ACCESS_KEY'] == 'bar'
+        assert getenv()['CPL_DEBUG'] is True
+
+
+def test_snapshot_without_env():
+    assert snapshot().options == {}
+
+
+def test_snapshot_pickle():
+    with rasterio.Env(CPL_DEBUG=True):
+        snap = snapshot()
+    assert pickle.loads(pickle.dumps(snap)) == snap
+
+
+def test_snapshot_activate_thread():
+    """A snapshot activated in a thread stays active in it."""
+    with rasterio.Env(CPL_DEBUG=True):
+        snap = snapshot()
+
+    def task():
+        snap.activate()
+        snap.activate()
+        return getenv()['CPL_DEBUG']
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(task).result() is True
+        assert executor.submit(getenv).result()['CPL_DEBUG'] is True
+
+
 def test_oss_session_credentials(gdalenv):
     """Create an Env with a oss session."""
     oss_session = OSSSession(
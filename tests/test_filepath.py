@@ -1,6 +1,7 @@
 """FilePath tests.  MemoryFile requires GDAL 2.0+.
 Tests in this file will ONLY run for GDAL >= 3.x"""
 
+import gc
 from io import BytesIO
 import os.path
 
@@ -11,6 +12,7 @@ from rasterio.enums import MaskFlags
 from rasterio.shutil import copyfiles
 
 try:
+    from rasterio._filepath import _io_counters
     from rasterio.io import FilePath
 except ImportError:
     pytest.skip("FilePath is not available for GDAL <3.0", allow_module_level=True)
@@ -159,3 +161,180 @@ def test_concurrent(path_rgb_byte_tif, path_rgb_lzw_byte_tif, path_cogeo_tif, pa
     tifs = [path_rgb_byte_tif, path_rgb_lzw_byte_tif, path_cogeo_tif, path_alpha_tif] * 4
     with ThreadPoolExecutor(max_workers=8) as exe:
         list(exe.map(_open_geotiff, tifs, timeout=5))
+
+
+class ReadOnlyFile:
+    """A minimal file-like object without a readinto method."""
+
+    def __init__(self, data):
+        self._bytesio = BytesIO(data)
+
+    def read(self, size=-1):
+        return self._bytesio.read(size)
+
+    def seek(self, offset, whence=0):
+        return self._bytesio.seek(offset, whence)
+
+    def tell(self):
+        return self._bytesio.tell()
+
+
+class ReadIntoFile(ReadOnlyFile):
+    """A file-like object which counts calls of read and readinto."""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.read_calls = 0
+        self.readinto_calls = 0
+
+    def read(self, size=-1):
+        self.read_calls += 1
+        return super().read(size)
+
+    def readinto(self, buffer):
+        self.readinto_calls += 1
+        return self._bytesio.readinto(buffer)
+
+
+def test_file_object_read_fallback(rgb_file_object):
+    """A file-like object without readinto can be read."""
+    with rasterio.open(ReadOnlyFile(rgb_file_object.read())) as src:
+        assert src.read().shape == (3, 718, 791)
+
+
+def test_file_object_readinto(rgb_file_object):
+    """A file-like object's readinto method is preferred over read."""
+    file_obj = ReadIntoFile(rgb_file_object.read())
+    with rasterio.open(file_obj) as src:
+        assert src.read().shape == (3, 718, 791)
+    assert file_obj.readinto_calls > 0
+    assert file_obj.read_calls == 0
+
+
+def test_file_object_position_not_shared(rgb_file_object):
+    """Reads do not depend on the file object's position."""
+    with rasterio.open(rgb_file_object) as src:
+        rgb_file_object.seek(1000)
+        assert src.read().shape == (3, 718, 791)
+
+
+def test_read_ahead_cache(rgb_file_object):
+    """Reads through the read-ahead cache make fewer requests."""
+    data = rgb_file_object.read()
+
+    file_obj = ReadIntoFile(data)
+    with FilePath(file_obj) as vsifile:
+        with vsifile.open() as src:
+            expected = src.read()
+    uncached_calls = file_obj.readinto_calls
+
+    file_obj = ReadIntoFile(data)
+    with FilePath(file_obj, block_size=65536) as vsifile:
+        with vsifile.open() as src:
+            assert (src.read() == expected).all()
+    assert file_obj.readinto_calls < uncached_calls
+
+
+def test_read_ahead_cache_invalid(rgb_file_object):
+    """Negative cache sizes are rejected."""
+    with pytest.raises(ValueError):
+        FilePath(rgb_file_object, block_size=-1)
+
+
+def test_file_object_write(path_rgb_byte_tif):
+    """A dataset can be written directly to a file-like object."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        data = src.read()
+
+    file_obj = BytesIO()
+    with rasterio.open(file_obj, "w", **profile) as dst:
+        dst.write(data)
+
+    assert len(file_obj.getvalue()) > 0
+    file_obj.seek(0)
+    with rasterio.open(file_obj) as src:
+        assert src.profile["crs"] == profile["crs"]
+        assert (src.read() == data).all()
+
+
+def test_filepath_write(path_rgb_byte_tif):
+    """A FilePath without content opens in write mode."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        data = src.read()
+
+    file_obj = BytesIO()
+    with FilePath(file_obj) as vsifile:
+        with vsifile.open(**profile) as dst:
+            dst.write(data)
+
+    with FilePath(file_obj) as vsifile:
+        with vsifile.open() as src:
+            assert (src.read() == data).all()
+
+
+class StreamFile:
+    """A writable file-like object which can not seek."""
+
+    def __init__(self):
+        self._bytesio = BytesIO()
+
+    def write(self, data):
+        return self._bytesio.write(data)
+
+    def seekable(self):
+        return False
+
+    def getvalue(self):
+        return self._bytesio.getvalue()
+
+
+def test_filepath_stream_write():
+    """Objects which can not seek accept sequential writes only."""
+    file_obj = StreamFile()
+    with FilePath(file_obj) as vsifile:
+        assert vsifile._pwrite(memoryview(b"abc"), 0) == 3
+        assert vsifile._pwrite(memoryview(b"def"), 3) == 3
+        assert len(vsifile) == 6
+        with pytest.raises(OSError):
+            vsifile._pwrite(memoryview(b"x"), 0)
+    assert file_obj.getvalue() == b"abcdef"
+
+
+def test_filepath_released(rgb_file_object):
+    """A FilePath which is never closed leaves the filesystem."""
+    vsifile = FilePath(rgb_file_object)
+    name = vsifile.name
+    with vsifile.open() as src:
+        src.read(1)
+    assert _io_counters(name) is not None
+    del vsifile
+    gc.collect()
+    assert _io_counters(name) is None
+
+
+def test_filepath_open_dataset_keeps_file(rgb_file_object):
+    """Datasets stay readable after their FilePath is dropped."""
+    vsifile = FilePath(rgb_file_object)
+    with vsifile.open() as src:
+        del vsifile
+        gc.collect()
+        assert src.read().shape == (3, 718, 791)
+
+
+def test_multi_range_coalesced(rgb_file_object):
+    """Nearby ranges of a multi-range read are read at once."""
+    data = rgb_file_object.read()
+    offsets = [0, 100, 300000, 300100]
+    sizes = [10, 20, 30, 40]
+    buffers = [bytearray(size) for size in sizes]
+
+    with FilePath(ReadIntoFile(data)) as vsifile:
+        assert vsifile._read_multi_range(
+            [memoryview(buf) for buf in buffers], offsets
+        )
+        assert vsifile._read_requests == 2
+
+    for buf, offset, size in zip(buffers, offsets, sizes):
+        assert bytes(buf) == data[offset:offset + size]
@@ -0,0 +1,89 @@
+"""Tests of dataset I/O statistics."""
+
+import numpy as np
+
+import rasterio
+from rasterio._base import IOStats
+from rasterio.windows import Window
+
+
+def test_io_stats_disabled(path_rgb_byte_tif):
+    """Nothing is counted outside of a collection context."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        src.read(1)
+        assert src.io_stats() == IOStats()
+
+
+def test_collect_io_stats(path_rgb_byte_tif):
+    """Reads are counted within a collection context."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        with src.collect_io_stats() as stats:
+            src.read(1, window=Window(0, 0, 10, 20))
+            src.read_masks(1)
+
+        src.read(1)
+
+    assert stats.multi_band_calls == 1
+    assert stats.mask_calls == 1
+    assert stats.pixels == 10 * 20 + 718 * 791
+    assert stats.bytes == 10 * 20 + 718 * 791
+    assert stats.gdal_time > 0.0
+    assert src.io_stats() == stats
+
+
+def test_collect_io_stats_nested(path_rgb_byte_tif):
+    """Nested contexts count their own reads and totals accumulate."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        with src.collect_io_stats() as outer:
+            src.read(1)
+            with src.collect_io_stats() as inner:
+                src.read()
+
+        assert outer.multi_band_calls == 2
+        assert inner.multi_band_calls == 1
+        assert inner.pixels == 3 * 718 * 791
+
+        with src.collect_io_stats(reset=True):
+            src.read(1)
+        assert src.io_stats().multi_band_calls == 1
+
+
+def test_collect_io_stats_write(tmp_path):
+    """Writes are counted."""
+    with rasterio.open(
+        tmp_path / "test.tif", "w", driver="GTiff", width=10, height=10,
+        count=2, dtype="uint16"
+    ) as dst:
+        with dst.collect_io_stats() as stats:
+            dst.write(np.ones((2, 10, 10), dtype="uint16"))
+            dst.write_mask(np.ones((10, 10), dtype=bool))
+
+    assert stats.multi_band_calls == 1
+    assert stats.band_calls == 0
+    assert stats.mask_calls == 1
+    assert stats.bytes == 2 * 10 * 10 * 2 + 10 * 10
+
+
+def test_collect_io_stats_filepath(path_rgb_byte_tif):
+    """Bytes read through a FilePath are counted."""
+    with open(path_rgb_byte_tif, "rb") as f, rasterio.open(f) as src:
+        with src.collect_io_stats() as stats:
+            src.read()
+
+    assert stats.vsi_requests > 0
+    assert stats.vsi_bytes_read > 0
+
+
+def test_collect_io_stats_update_overviews(tmp_path):
+    """Writes of overviews are single band calls."""
+    with rasterio.open(
+        tmp_path / "test.tif", "w", driver="GTiff", width=16, height=16,
+        count=1, dtype="uint8"
+    ) as dst:
+        dst.write(np.ones((1, 16, 16), dtype="uint8"))
+        dst.build_overviews([2, 4])
+        with dst.collect_io_stats() as stats:
+            dst.update_overviews(Window(0, 0, 8, 8))
+
+    assert stats.band_calls == 2
+    assert stats.multi_band_calls == 1
@@ -0,0 +1,112 @@
+"""Tests of lazy arrays"""
+
+import numpy as np
+import pytest
+
+import rasterio
+from rasterio.enums import Resampling
+from rasterio.windows import Window
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        0,
+        -1,
+        (slice(None), 100, 200),
+        (Ellipsis, 300),
+        (1, slice(100, 200), slice(-50, None)),
+        ([0, 2], slice(10, 20), slice(30, 5, -1)),
+        (slice(1, 3), slice(700, 800), slice(0, 10)),
+        (slice(1, 1),),
+    ],
+)
+def test_lazy_array_getitem(path_rgb_byte_tif, key):
+    """Indexing matches indexing of the full array"""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        arr = src.as_array()
+        expected = src.read()[key]
+        data = arr[key]
+    assert data.shape == expected.shape
+    assert (data == expected).all()
+
+
+def test_lazy_array_attributes(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        arr = src.as_array(indexes=[3, 1])
+        assert isinstance(arr, rasterio.LazyArray)
+        assert arr.shape == (2, 718, 791)
+        assert arr.dtype == np.dtype("uint8")
+        assert arr.ndim == 3
+        assert arr.size == 2 * 718 * 791
+        assert len(arr) == 2
+        assert (arr[0] == src.read(3)).all()
+
+
+def test_lazy_array_chunks(tmp_path, path_rgb_byte_tif):
+    path = str(tmp_path.joinpath("tiled.tif"))
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        profile.update(tiled=True, blockxsize=256, blockysize=256)
+        with rasterio.open(path, "w", **profile) as dst:
+            dst.write(src.read())
+    with rasterio.open(path) as src:
+        assert src.as_array().chunks == (
+            (1, 1, 1), (256, 256, 206), (256, 256, 256, 23))
+
+
+def test_lazy_array_single_read(path_rgb_byte_tif, monkeypatch):
+    """Indexing makes one windowed read"""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        calls = []
+        read = src.read
+
+        def spy(*args, **kwargs):
+            calls.append(kwargs["window"])
+            return read(*args, **kwargs)
+
+        monkeypatch.setattr(src, "read", spy)
+        src.as_array()[:, 10:20, 30:50]
+    assert calls == [Window(30, 10, 20, 10)]
+
+
+def test_lazy_array_decimated(path_rgb_byte_tif):
+    """Strided slices are decimated reads"""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        data = src.as_array(resampling=Resampling.average)[:, ::4, ::4]
+        expected = src.read(out_shape=(3, 180, 198), resampling=Resampling.average)
+    assert data.shape == src.read()[:, ::4, ::4].shape
+    assert (data == expected).all()
+
+
+def test_lazy_array_masked(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        data = src.as_array(masked=True)[0, :10, :10]
+    assert isinstance(data, np.ma.MaskedArray)
+    assert data.mask.all()
+
+
+def test_lazy_array_asarray(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        data = np.asarray(src.as_array(indexes=[1]), dtype="float32")
+        assert data.dtype == np.dtype("float32")
+        assert (data == src.read([1])).all()
+
+
+def test_lazy_array_invalid_index(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        arr = src.as_array()
+        with pytest.raises(IndexError):
+            arr[3]
+        with pytest.raises(IndexError):
+            arr[0, 0, 0, 0]
+        with pytest.raises(IndexError):
+            arr[None]
+
+
+def test_lazy_array_dask(path_rgb_byte_tif):
+    da = pytest.importorskip("dask.array")
+    with rasterio.open(path_rgb_byte_tif) as src:
+        arr = src.as_array()
+        data = da.from_array(arr, chunks=arr.chunks)
+        assert (data[:, 100:200, 100:200].compute() == src.read()[:, 100:200, 100:200]).all()
@@ -8,7 +8,10 @@ import pytest
 
 import affine
 import rasterio
+from rasterio.crs import CRS
+from rasterio.enums import Resampling
 from rasterio.merge import merge
+from rasterio.vrt import WarpedVRT
 
 # Non-coincident datasets test fixture.
 # Three overlapping GeoTIFFs, two to the NW and one to the SE.
@@ -57,6 +60,136 @@ def test_merge_method(test_data_dir_overlapping, method, value):
     numpy.testing.assert_array_equal(arr[:, 5:10, 5:10], value)
 
 
+@pytest.mark.parametrize(
+    "method,value",
+    [("first", 1), ("last", 2), ("min", 1), ("max", 3), ("sum", 6), ("count", 3)],
+)
+def test_merge_workers(test_data_dir_overlapping, method, value):
+    """Inputs read in threads are merged in order"""
+    inputs = sorted(list(test_data_dir_overlapping.iterdir()))
+    arr, _ = merge(inputs, method=method, dtype=numpy.uint64, workers=2)
+    expected, _ = merge(inputs, method=method, dtype=numpy.uint64)
+    numpy.testing.assert_array_equal(arr, expected)
+    numpy.testing.assert_array_equal(arr[:, 5:10, 5:10], value)
+
+
+@pytest.fixture
+def mixed_crs_inputs(test_data_dir_overlapping):
+    """nw1.tif in EPSG:4326 and se.tif reprojected to EPSG:3857"""
+    se_path = test_data_dir_overlapping.joinpath("se.tif")
+    se_3857_path = test_data_dir_overlapping.joinpath("se_3857.tif")
+    with rasterio.open(se_path) as src:
+        with WarpedVRT(src, crs="EPSG:3857") as vrt:
+            profile = vrt.profile
+            profile["driver"] = "GTiff"
+            with rasterio.open(se_3857_path, "w", **profile) as dst:
+                dst.write(vrt.read())
+    return [test_data_dir_overlapping.joinpath("nw1.tif"), se_3857_path]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_merge_dst_crs(mixed_crs_inputs, workers):
+    """Inputs in other CRS are reprojected"""
+    arr, transform = merge(
+        mixed_crs_inputs, dst_crs="EPSG:4326", res=0.2, workers=workers)
+    assert transform.a == 0.2
+    assert transform.c == pytest.approx(-114.0)
+    assert transform.f == pytest.approx(46.0)
+    assert arr.shape == (1, 15, 15)
+    numpy.testing.assert_array_equal(arr[0, 0:10, 0:10], 1)
+    numpy.testing.assert_array_equal(arr[0, 11:14, 11:14], 2)
+    assert arr[0, 0, 14] == 0
+
+
+def test_merge_dst_crs_output(mixed_crs_inputs, tmp_path):
+    """The output has the destination CRS"""
+    dst_path = tmp_path.joinpath("merged.tif")
+    merge(mixed_crs_inputs, dst_crs="EPSG:3857", dst_path=dst_path)
+    with rasterio.open(dst_path) as dst:
+        assert dst.crs == CRS.from_epsg(3857)
+        assert dst.read(1).max() == 2
+
+
+def test_merge_update(test_data_dir_overlapping, tmp_path):
+    """Inputs are merged into an existing output"""
+    dst_path = tmp_path.joinpath("merged.tif")
+    merge([test_data_dir_overlapping.joinpath("nw1.tif")], dst_path=dst_path)
+    merge(
+        [test_data_dir_overlapping.joinpath("se.tif")], dst_path=dst_path,
+        method="last", update=True)
+    with rasterio.open(dst_path) as dst:
+        assert dst.shape == (10, 10)
+        data = dst.read(1)
+    numpy.testing.assert_array_equal(data[:5], 1)
+    numpy.testing.assert_array_equal(data[5:, :5], 1)
+    numpy.testing.assert_array_equal(data[5:, 5:], 2)
+
+
+def test_merge_update_first(test_data_dir_overlapping, tmp_path):
+    """Existing valid pixels are kept by the first method"""
+    dst_path = tmp_path.joinpath("merged.tif")
+    merge([test_data_dir_overlapping.joinpath("nw1.tif")], dst_path=dst_path)
+    merge(
+        [test_data_dir_overlapping.joinpath("nw3.tif")], dst_path=dst_path,
+        update=True)
+    with rasterio.open(dst_path) as dst:
+        numpy.testing.assert_array_equal(dst.read(1), 1)
+
+
+def test_merge_update_new_output(test_data_dir_overlapping, tmp_path):
+    """A missing output is created"""
+    dst_path = tmp_path.joinpath("merged.tif")
+    merge(
+        [test_data_dir_overlapping.joinpath("se.tif")], dst_path=dst_path,
+        update=True)
+    with rasterio.open(dst_path) as dst:
+        numpy.testing.assert_array_equal(dst.read(1), 2)
+
+
+def test_merge_update_overviews(test_data_dir_overlapping, tmp_path):
+    """Overviews of the updated windows are regenerated"""
+    dst_path = tmp_path.joinpath("merged.tif")
+    merge([test_data_dir_overlapping.joinpath("nw1.tif")], dst_path=dst_path)
+    with rasterio.open(dst_path, "r+") as dst:
+        dst.build_overviews([2])
+    merge(
+        [test_data_dir_overlapping.joinpath("se.tif")], dst_path=dst_path,
+        method="last", update=True, overview_resampling=Resampling.nearest)
+    with rasterio.open(dst_path, overview_level=0) as ovr:
+        data = ovr.read(1)
+    assert data.shape == (5, 5)
+    numpy.testing.assert_array_equal(data[:2], 1)
+    numpy.testing.assert_array_equal(data[3:, 3:], 2)
+
+
+def test_merge_update_fewer_bands(test_data_dir_overlapping, tmp_path):
+    """Only the bands read from the inputs are updated"""
+    dst_path = tmp_path.joinpath("merged.tif")
+    with rasterio.open(test_data_dir_overlapping.joinpath("nw1.tif")) as src:
+        profile = src.profile
+    profile.update(count=2)
+    with rasterio.open(dst_path, "w", **profile) as dst:
+        dst.write(numpy.full((2, 10, 10), 5, dtype=rasterio.uint8))
+    merge(
+        [test_data_dir_overlapping.joinpath("se.tif")], dst_path=dst_path,
+        indexes=[1], method="last", update=True)
+    with rasterio.open(dst_path) as dst:
+        data = dst.read()
+    numpy.testing.assert_array_equal(data[0, 5:, 5:], 2)
+    numpy.testing.assert_array_equal(data[0, :5], 5)
+    numpy.testing.assert_array_equal(data[1], 5)
+
+
+def test_merge_update_too_many_bands(test_data_dir_overlapping, tmp_path):
+    """Inputs can't have more bands than the output"""
+    dst_path = tmp_path.joinpath("merged.tif")
+    merge([test_data_dir_overlapping.joinpath("nw1.tif")], dst_path=dst_path)
+    with pytest.raises(ValueError):
+        merge(
+            [test_data_dir_overlapping.joinpath("se.tif")], dst_path=dst_path,
+            indexes=[1, 1], update=True)
+
+
 def test_issue2163():
     """Demonstrate fix for issue 2163"""
     with rasterio.open("tests/data/float_raster_with_nodata.tif") as src:
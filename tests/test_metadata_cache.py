@@ -0,0 +1,102 @@
+"""Tests of the process-wide metadata cache."""
+
+import shutil
+
+import pytest
+
+import rasterio
+import rasterio.cache
+from rasterio.cache import metadata_cache_info
+
+
+@pytest.fixture
+def metadata_cache():
+    rasterio.cache.enable_metadata_cache(maxsize=2)
+    try:
+        yield
+    finally:
+        rasterio.cache.disable_metadata_cache()
+
+
+def test_metadata_cache_disabled(path_rgb_byte_tif):
+    """The cache is not used by default."""
+    with rasterio.open(path_rgb_byte_tif):
+        pass
+    assert metadata_cache_info() is None
+
+
+def test_metadata_cache_hit(metadata_cache, path_rgb_byte_tif):
+    """A second open takes its metadata from the cache."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        tags = src.tags()
+        overviews = src.overviews(1)
+        block_shapes = src.block_shapes
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        assert src.profile == profile
+        assert src.tags() == tags
+        assert src.overviews(1) == overviews
+        assert src.block_shapes == block_shapes
+        assert src.read(1).shape == (718, 791)
+
+    assert metadata_cache_info() == (1, 1, 2, 1)
+
+
+def test_metadata_cache_copies(metadata_cache, path_rgb_byte_tif):
+    """Modifying returned values doesn't modify the cache."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        src.tags()["foo"] = "bar"
+        src.block_shapes.append((1, 1))
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        assert "foo" not in src.tags()
+        assert len(src.block_shapes) == 3
+
+
+def test_metadata_cache_open_options(metadata_cache, path_rgb_byte_tif):
+    """Open options are part of the key."""
+    with rasterio.open(path_rgb_byte_tif):
+        pass
+    with rasterio.open(path_rgb_byte_tif, OVERVIEW_LEVEL=-1):
+        pass
+    assert metadata_cache_info().misses == 2
+
+
+def test_metadata_cache_modified_file(metadata_cache, tmp_path, path_rgb_byte_tif):
+    """A modified file gets a new entry."""
+    filename = str(tmp_path.joinpath("test.tif"))
+    shutil.copy(path_rgb_byte_tif, filename)
+    with rasterio.open(filename) as src:
+        assert src.tags(1) == {}
+
+    with rasterio.open(filename, "r+") as dst:
+        dst.update_tags(1, foo="bar")
+        dst.nodata = 1
+
+    with rasterio.open(filename) as src:
+        assert src.tags(1) == {"foo": "bar"}
+        assert src.nodata == 1
+    assert metadata_cache_info().hits == 0
+
+
+def test_metadata_cache_memoryfile(metadata_cache, path_rgb_byte_tif):
+    """Datasets in memory are not cached."""
+    with open(path_rgb_byte_tif, "rb") as f:
+        with rasterio.MemoryFile(f.read()) as memfile:
+            with memfile.open() as src:
+                assert src.count == 3
+    assert metadata_cache_info().currsize == 0
+
+
+def test_metadata_cache_maxsize(metadata_cache, path_rgb_byte_tif, path_rgb_lzw_byte_tif, path_rgba_byte_tif):
+    """Least recently used entries are evicted."""
+    for path in (path_rgb_byte_tif, path_rgb_lzw_byte_tif, path_rgba_byte_tif):
+        with rasterio.open(path):
+            pass
+    assert metadata_cache_info().currsize == 2
+
+
+def test_metadata_cache_invalid_maxsize():
+    with pytest.raises(ValueError):
+        rasterio.cache.enable_metadata_cache(maxsize=0)
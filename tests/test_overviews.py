@@ -10,6 +10,7 @@ from rasterio.enums import _OverviewResampling as OverviewResampling
 from rasterio.enums import Resampling
 from rasterio.env import GDALVersion
 from rasterio.errors import OverviewCreationError
+from rasterio.windows import Window
 
 
 def test_count_overviews_zero(data):
@@ -156,3 +157,24 @@ def test_build_overviews_rms(data):
         assert src.overviews(1) == [2, 4]
         assert src.overviews(2) == [2, 4]
         assert src.overviews(3) == [2, 4]
+
+
+def test_update_overviews(data):
+    """Overviews are regenerated over a window only"""
+    inputfile = str(data.join('RGB.byte.tif'))
+    with rasterio.open(inputfile, 'r+') as src:
+        src.build_overviews([2, 4], resampling=Resampling.nearest)
+    with rasterio.open(inputfile, overview_level=0) as ovr:
+        before = ovr.read()
+
+    with rasterio.open(inputfile, 'r+') as src:
+        src.write(np.full((3, 100, 100), 255, dtype='uint8'), window=Window(0, 0, 100, 100))
+        src.update_overviews(Window(0, 0, 100, 100), resampling=Resampling.average)
+
+    with rasterio.open(inputfile, overview_level=0) as ovr:
+        after = ovr.read()
+    assert (after[:, :50, :50] == 255).all()
+    assert (after[:, 50:] == before[:, 50:]).all()
+    assert (after[:, :, 50:] == before[:, :, 50:]).all()
+    with rasterio.open(inputfile, overview_level=1) as ovr:
+        assert (ovr.read(window=Window(0, 0, 25, 25)) == 255).all()
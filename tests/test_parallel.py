@@ -0,0 +1,161 @@
+"""Tests of rasterio.parallel"""
+
+import numpy as np
+import pytest
+
+import rasterio
+from rasterio.env import getenv, hasenv
+from rasterio.parallel import (
+    ProcessPoolExecutor, ThreadPoolExecutor, _bounded_map, map_windows)
+from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
+
+
+def invert(data):
+    return 255 - data
+
+
+def box_sum(data):
+    """Sum of each pixel's 3x3 neighborhood."""
+    padded = np.pad(data.astype("int32"), ((0, 0), (1, 1), (1, 1)))
+    return sum(
+        padded[:, 1 + dy:padded.shape[1] - 1 + dy, 1 + dx:padded.shape[2] - 1 + dx]
+        for dy in (-1, 0, 1) for dx in (-1, 0, 1))
+
+
+@pytest.fixture
+def tiled_profile(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+    profile.update(tiled=True, blockxsize=128, blockysize=128)
+    return profile
+
+
+@pytest.mark.parametrize("workers,mode", [(1, "thread"), (4, "thread"), (2, "process")])
+def test_map_windows(tmp_path, path_rgb_byte_tif, tiled_profile, workers, mode):
+    path = tmp_path.joinpath("inverted.tif")
+    with rasterio.open(path, "w", **tiled_profile) as dst:
+        map_windows(invert, path_rgb_byte_tif, dst, workers=workers, mode=mode)
+    with rasterio.open(path_rgb_byte_tif) as src, rasterio.open(path) as dst:
+        assert (dst.read() == 255 - src.read()).all()
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_map_windows_halo(tmp_path, path_rgb_byte_tif, tiled_profile, workers):
+    """Results with a halo match the result for the whole dataset"""
+    tiled_profile.update(dtype="int32", nodata=None)
+    path = tmp_path.joinpath("sum.tif")
+    with rasterio.open(path_rgb_byte_tif) as src:
+        data = src.read()
+        # The halo beyond the edges is filled with 0, the nodata value.
+        expected = box_sum(data)
+        with rasterio.open(path, "w", **tiled_profile) as dst:
+            map_windows(box_sum, src, dst, halo=1, workers=workers)
+    with rasterio.open(path) as dst:
+        assert (dst.read() == expected).all()
+
+
+def test_map_windows_sources(tmp_path, path_rgb_byte_tif, tiled_profile):
+    """Functions get one array per source"""
+    path = tmp_path.joinpath("diff.tif")
+    with rasterio.open(path, "w", **tiled_profile) as dst:
+        map_windows(
+            lambda a, b: a - b, [path_rgb_byte_tif, path_rgb_byte_tif], dst,
+            workers=2)
+    with rasterio.open(path) as dst:
+        assert not dst.read().any()
+
+
+def test_map_windows_windows(tmp_path, path_rgb_byte_tif, tiled_profile):
+    """Only the given windows are written"""
+    tiled_profile.update(count=1)
+    path = tmp_path.joinpath("band.tif")
+    with rasterio.open(path, "w", **tiled_profile) as dst:
+        map_windows(
+            lambda data: np.full(data.shape, 7, dtype="uint8"),
+            path_rgb_byte_tif, dst, windows=[Window(0, 0, 10, 10)], indexes=1)
+    with rasterio.open(path) as dst:
+        data = dst.read(1)
+    assert (data[:10, :10] == 7).all()
+    assert (data[10:] == 0).all()
+
+
+def test_map_windows_memory_source(tmp_path, path_rgb_byte_tif, tiled_profile):
+    """Datasets in memory are shared between threads"""
+    path = tmp_path.joinpath("inverted.tif")
+    with open(path_rgb_byte_tif, "rb") as f, rasterio.MemoryFile(f.read()) as memfile:
+        with memfile.open() as src, rasterio.open(path, "w", **tiled_profile) as dst:
+            map_windows(invert, src, dst, workers=2)
+            with pytest.raises(ValueError):
+                map_windows(invert, src, dst, workers=2, mode="process")
+    with rasterio.open(path) as dst:
+        assert dst.read().any()
+
+
+def test_map_windows_warped_vrt(tmp_path, path_rgb_byte_tif):
+    """WarpedVRTs are shared between threads"""
+    path = tmp_path.joinpath("inverted.tif")
+    with rasterio.open(path_rgb_byte_tif) as src, WarpedVRT(src, crs="EPSG:3857") as vrt:
+        profile = vrt.profile
+        profile.update(driver="GTiff", tiled=True, blockxsize=128, blockysize=128)
+        expected = 255 - vrt.read()
+        with rasterio.open(path, "w", **profile) as dst:
+            map_windows(invert, vrt, dst, workers=2)
+            with pytest.raises(ValueError):
+                map_windows(invert, vrt, dst, workers=2, mode="process")
+    with rasterio.open(path) as dst:
+        assert (dst.read() == expected).all()
+
+
+def test_map_windows_in_place(tmp_path, path_rgb_byte_tif, tiled_profile):
+    """A dataset opened in "r+" mode can be its own source"""
+    path = tmp_path.joinpath("inverted.tif")
+    with rasterio.open(path_rgb_byte_tif) as src:
+        data = src.read()
+    with rasterio.open(path, "w", **tiled_profile) as dst:
+        dst.write(data)
+    with rasterio.open(path, "r+") as dst:
+        map_windows(invert, dst, dst, workers=4)
+    with rasterio.open(path) as dst:
+        assert (dst.read() == 255 - data).all()
+
+
+def test_map_windows_invalid(tmp_path, path_rgb_byte_tif, tiled_profile):
+    with rasterio.open(tmp_path.joinpath("test.tif"), "w", **tiled_profile) as dst:
+        with pytest.raises(ValueError):
+            map_windows(invert, path_rgb_byte_tif, dst, mode="fiber")
+        with pytest.raises(ValueError):
+            map_windows(invert, path_rgb_byte_tif, dst, halo=-1)
+
+
+def debug_option(_):
+    return getenv()["CPL_DEBUG"]
+
+
+def test_thread_pool_env():
+    """Workers run in the Env of the pool's maker, entered once."""
+    starts = []
+    with rasterio.Env(CPL_DEBUG=True):
+        with ThreadPoolExecutor(
+                max_workers=2, initializer=starts.append, initargs=(1,)) as executor:
+            options = list(executor.map(debug_option, range(8)))
+    assert options == [True] * 8
+    assert 1 <= len(starts) <= 2
+    assert not hasenv()
+
+
+def test_process_pool_env():
+    with rasterio.Env(CPL_DEBUG=True):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            options = list(executor.map(debug_option, range(4)))
+    assert options == [True] * 4
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_bounded_map(ordered):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(_bounded_map(
+            executor, pow, ((i, 2) for i in range(10)), 4, ordered=ordered))
+    if not ordered:
+        results.sort()
+    assert results == [i ** 2 for i in range(10)]
@@ -0,0 +1,117 @@
+"""Tests of the rasterio.profiling module."""
+
+import functools
+import json
+
+import numpy as np
+
+import rasterio
+from rasterio.features import rasterize, shapes
+from rasterio.profiling import Profiler, profiled, span
+from rasterio.windows import Window
+
+
+def test_profiler_spans(path_rgb_byte_tif):
+    """Opens and reads are recorded with attributes."""
+    with Profiler() as profiler:
+        with rasterio.open(path_rgb_byte_tif) as src:
+            src.read(1, window=Window(0, 0, 10, 10))
+
+    assert [span.name for span in profiler.spans] == ["open", "read"]
+    read_span = [span for span in profiler.spans if span.name == "read"][0]
+    assert read_span.attributes["path"] == path_rgb_byte_tif
+    assert read_span.attributes["bytes"] == 100
+    assert read_span.attributes["window"] == Window(0, 0, 10, 10)
+    assert read_span.duration > 0.0
+
+
+def test_profiler_inactive(path_rgb_byte_tif):
+    """Nothing is recorded after a profiler stops."""
+    with Profiler() as profiler:
+        pass
+    with rasterio.open(path_rgb_byte_tif) as src:
+        src.read(1)
+    assert profiler.spans == []
+
+
+def test_env_profiling(path_rgb_byte_tif):
+    """An environment can profile calls."""
+    with rasterio.Env(profiling=True) as env:
+        with rasterio.open(path_rgb_byte_tif) as src:
+            src.read(1)
+    assert {span.name for span in env.profiler.spans} == {"open", "read"}
+
+
+def test_env_no_profiling():
+    """Profiling is off by default."""
+    with rasterio.Env() as env:
+        assert env.profiler is None
+
+
+def test_features_spans():
+    """Calls of rasterize and shapes are recorded."""
+    geom = {"type": "Polygon", "coordinates": [[(1, 1), (4, 1), (4, 4), (1, 4), (1, 1)]]}
+    with Profiler() as profiler:
+        image = rasterize([geom], out_shape=(6, 6))
+        results = list(shapes(image.astype("uint8")))
+
+    names = [span.name for span in profiler.spans]
+    assert "rasterize" in names
+    shapes_span = [span for span in profiler.spans if span.name == "shapes"][0]
+    assert shapes_span.attributes["count"] == len(results)
+
+
+def test_wrapped_generator_span():
+    """Generators wrapped by other decorators are recorded as generators."""
+
+    def passthrough(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwds):
+            return f(*args, **kwds)
+        return wrapper
+
+    @profiled("gen", lambda args, kwds, result: {"count": result})
+    @passthrough
+    def gen(n):
+        yield from range(n)
+
+    with Profiler() as profiler:
+        assert list(gen(3)) == [0, 1, 2]
+
+    assert profiler.spans[0].attributes["count"] == 3
+
+
+def test_chrome_trace(tmp_path):
+    """Traces are exported in Chrome's format."""
+
+    @profiled("test", lambda args, kwds, result: {"value": args[0]})
+    def func(value):
+        return value
+
+    with Profiler() as profiler:
+        func(1)
+        with span("block", key="val"):
+            pass
+
+    path = tmp_path / "trace.json"
+    trace = profiler.to_chrome_trace(path)
+    assert json.loads(path.read_text()) == trace
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in events] == ["test", "block"]
+    assert events[0]["args"] == {"value": 1}
+
+
+def test_records():
+    """Records are flat dicts."""
+
+    @profiled("test", lambda args, kwds, result: {"value": result})
+    def func(value):
+        return np.array([value])
+
+    with Profiler() as profiler:
+        func(1)
+
+    records = profiler.to_records()
+    assert records[0]["name"] == "test"
+    assert records[0]["start"] >= 0.0
+    assert set(records[0]) >= {"duration", "thread_id", "thread_name", "value"}
@@ -0,0 +1,169 @@
+"""Tests of progress callbacks and cancellation tokens"""
+
+import numpy as np
+import pytest
+
+import rasterio
+import rasterio.shutil
+from rasterio.enums import Resampling
+from rasterio.errors import OperationCancelledError
+from rasterio.fill import fillnodata
+from rasterio.progress import CancellationToken
+from rasterio.warp import reproject, WarpPlan
+
+
+class Recorder:
+    """A progress callback that records its calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, fraction, rate):
+        self.calls.append((fraction, rate))
+
+    @property
+    def fractions(self):
+        return [fraction for fraction, _ in self.calls]
+
+
+def check_progress(recorder):
+    fractions = recorder.fractions
+    assert fractions
+    assert fractions == sorted(fractions)
+    assert fractions[-1] == pytest.approx(1.0)
+    assert all(rate >= 0 for _, rate in recorder.calls)
+
+
+def test_token():
+    token = CancellationToken()
+    assert not token.cancelled
+    token.cancel()
+    assert token.cancelled
+    assert "cancelled=True" in repr(token)
+
+
+def test_reproject_progress(path_rgb_byte_tif):
+    recorder = Recorder()
+    with rasterio.open(path_rgb_byte_tif) as src:
+        reproject(
+            rasterio.band(src, 1), np.empty((500, 500), dtype="uint8"),
+            dst_crs="EPSG:4326", resampling=Resampling.bilinear,
+            progress=recorder)
+    check_progress(recorder)
+
+
+def test_reproject_progress_step(path_rgb_byte_tif):
+    """Reports are at least 1% apart."""
+    recorder = Recorder()
+    with rasterio.open(path_rgb_byte_tif) as src:
+        reproject(
+            rasterio.band(src, 1), np.empty((500, 500), dtype="uint8"),
+            dst_crs="EPSG:4326", warp_mem_limit=1, progress=recorder)
+    fractions = recorder.fractions[:-1]
+    assert all(b - a >= 0.01 for a, b in zip(fractions, fractions[1:]))
+
+
+def test_reproject_cancelled(path_rgb_byte_tif):
+    token = CancellationToken()
+    token.cancel()
+    with rasterio.open(path_rgb_byte_tif) as src:
+        with pytest.raises(OperationCancelledError):
+            reproject(
+                rasterio.band(src, 1), np.empty((500, 500), dtype="uint8"),
+                dst_crs="EPSG:4326", cancel=token)
+
+
+def test_reproject_cancelled_by_callback(path_rgb_byte_tif):
+    """A token cancelled during the warp stops it."""
+    token = CancellationToken()
+
+    def progress(fraction, rate):
+        if fraction > 0.0:
+            token.cancel()
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        with pytest.raises(OperationCancelledError):
+            reproject(
+                rasterio.band(src, 1), np.empty((500, 500), dtype="uint8"),
+                dst_crs="EPSG:4326", warp_mem_limit=1, progress=progress,
+                cancel=token)
+
+
+def test_reproject_callback_error(path_rgb_byte_tif):
+    def progress(fraction, rate):
+        raise ZeroDivisionError("oops")
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        with pytest.raises(ZeroDivisionError):
+            reproject(
+                rasterio.band(src, 1), np.empty((500, 500), dtype="uint8"),
+                dst_crs="EPSG:4326", progress=progress)
+
+
+def test_reproject_bad_token(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        with pytest.raises(TypeError):
+            reproject(
+                rasterio.band(src, 1), np.empty((500, 500), dtype="uint8"),
+                dst_crs="EPSG:4326", cancel=True)
+
+
+def test_warp_plan_progress(path_rgb_byte_tif):
+    recorder = Recorder()
+    with rasterio.open(path_rgb_byte_tif) as src:
+        source = src.read(1)
+        with WarpPlan(
+                source.shape, src.transform, src.crs, source.shape,
+                src.transform, src.crs, warp_mem_limit=1) as plan:
+            plan.reproject(
+                source, np.empty_like(source), progress=recorder)
+    check_progress(recorder)
+
+
+def test_copy_progress(tmpdir, path_rgb_byte_tif):
+    recorder = Recorder()
+    rasterio.shutil.copy(
+        path_rgb_byte_tif, str(tmpdir.join("copy.tif")), progress=recorder)
+    check_progress(recorder)
+
+
+def test_copy_cancelled(tmpdir, path_rgb_byte_tif):
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(OperationCancelledError):
+        rasterio.shutil.copy(
+            path_rgb_byte_tif, str(tmpdir.join("copy.tif")), cancel=token)
+
+
+def test_build_overviews_progress(data):
+    recorder = Recorder()
+    with rasterio.open(str(data.join("RGB.byte.tif")), "r+") as src:
+        src.build_overviews([2, 4], progress=recorder)
+        assert src.overviews(1) == [2, 4]
+    check_progress(recorder)
+
+
+def test_build_overviews_cancelled(data):
+    token = CancellationToken()
+    token.cancel()
+    with rasterio.open(str(data.join("RGB.byte.tif")), "r+") as src:
+        with pytest.raises(OperationCancelledError):
+            src.build_overviews([2, 4], cancel=token)
+
+
+def test_fillnodata_progress():
+    image = np.ones((100, 100), dtype="uint8")
+    image[40:60, 40:60] = 0
+    recorder = Recorder()
+    result = fillnodata(image, image != 0, progress=recorder)
+    assert (result == 1).all()
+    check_progress(recorder)
+
+
+def test_fillnodata_cancelled():
+    image = np.ones((100, 100), dtype="uint8")
+    image[40:60, 40:60] = 0
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(OperationCancelledError):
+        fillnodata(image, image != 0, cancel=token)
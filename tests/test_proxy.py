@@ -0,0 +1,102 @@
+"""Tests of dataset proxies"""
+
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+
+import pytest
+
+import rasterio
+from rasterio.proxy import DatasetProxy, clear_cache
+from rasterio.session import AWSSession
+from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
+
+
+def block_sum(proxy, window):
+    return int(proxy.read(1, window=window).sum())
+
+
+def test_proxy_pickle(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        proxy = DatasetProxy.from_dataset(src)
+        profile = src.profile
+        data = src.read(1, window=Window(0, 0, 10, 10))
+    clone = pickle.loads(pickle.dumps(proxy))
+    assert clone.path == proxy.path
+    assert clone.profile == profile
+    assert clone.crs == profile["crs"]
+    assert (clone.read(1, window=Window(0, 0, 10, 10)) == data).all()
+
+
+def test_proxy_metadata_without_open(path_rgb_byte_tif):
+    """Header metadata doesn't open the dataset"""
+    clear_cache()
+    with rasterio.open(path_rgb_byte_tif) as src:
+        proxy = pickle.loads(pickle.dumps(DatasetProxy.from_dataset(src)))
+    assert proxy.shape == (718, 791)
+    assert proxy.count == 3
+    assert rasterio.proxy._cached_datasets() == {}
+
+
+def test_proxy_reuses_dataset(path_rgb_byte_tif):
+    clear_cache()
+    proxy = DatasetProxy(path_rgb_byte_tif)
+    other = pickle.loads(pickle.dumps(proxy))
+    assert proxy._dataset() is other._dataset()
+    assert len(rasterio.proxy._cached_datasets()) == 1
+    clear_cache()
+    assert proxy._dataset() is not None
+
+
+def test_proxy_env_options(path_rgb_byte_tif):
+    with rasterio.Env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+        proxy = DatasetProxy(path_rgb_byte_tif)
+    assert proxy.env_options["GDAL_DISABLE_READDIR_ON_OPEN"] == "EMPTY_DIR"
+    assert pickle.loads(pickle.dumps(proxy)).env_options == proxy.env_options
+
+
+def test_proxy_credentials(path_rgb_byte_tif):
+    """Credentials of the Env are set when the proxy is used."""
+    session = AWSSession(aws_access_key_id="foo", aws_secret_access_key="bar")
+    with rasterio.Env(session=session):
+        proxy = DatasetProxy(path_rgb_byte_tif)
+    assert proxy.env_options["AWS_ACCESS_KEY_ID"] == "foo"
+    clear_cache()
+    assert proxy.read(1).shape == (718, 791)
+
+
+def test_proxy_process_pool(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        proxy = DatasetProxy.from_dataset(src)
+        windows = [window for _, window in src.block_windows(1)][:20]
+        expected = [int(src.read(1, window=window).sum()) for window in windows]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(block_sum, [proxy] * len(windows), windows)) == expected
+
+
+def test_proxy_memory_dataset(path_rgb_byte_tif):
+    with open(path_rgb_byte_tif, "rb") as f, rasterio.MemoryFile(f.read()) as memfile:
+        with memfile.open() as src:
+            with pytest.raises(ValueError):
+                DatasetProxy.from_dataset(src)
+
+
+def test_proxy_warped_vrt(path_rgb_byte_tif):
+    """A WarpedVRT can't be reopened by name"""
+    with rasterio.open(path_rgb_byte_tif) as src, WarpedVRT(src, crs="EPSG:3857") as vrt:
+        with pytest.raises(ValueError):
+            DatasetProxy.from_dataset(vrt)
+
+
+def test_proxy_file_object(path_rgb_byte_tif):
+    with open(path_rgb_byte_tif, "rb") as f, rasterio.open(f) as src:
+        with pytest.raises(ValueError):
+            DatasetProxy.from_dataset(src)
+
+
+def test_proxy_write_mode(tmp_path, path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+    with rasterio.open(tmp_path.joinpath("test.tif"), "w", **profile) as dst:
+        with pytest.raises(ValueError):
+            DatasetProxy.from_dataset(dst)
@@ -292,4 +292,21 @@ def test_azure_session_class_unsigned():
     """AzureSession works"""
     sesh = AzureSession(azure_unsigned=True, azure_storage_account='naipblobs')
     assert sesh.get_credential_options()['AZURE_NO_SIGN_REQUEST'] == 'YES'
-    assert sesh.get_credential_options()['AZURE_STORAGE_ACCOUNT'] == 'naipblobs'
\ No newline at end of file
+    assert sesh.get_credential_options()['AZURE_STORAGE_ACCOUNT'] == 'naipblobs'
+
+
+def test_cached_session(monkeypatch, session_cache):
+    """Default sessions are reused until the environment changes"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "id")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "key")
+    session = AWSSession.cached()
+    assert AWSSession.cached() is session
+    assert session.credentials["aws_access_key_id"] == "id"
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "other")
+    other = AWSSession.cached()
+    assert other is not session
+    assert other.credentials["aws_access_key_id"] == "other"
+
+
+def test_cached_dummy_session(session_cache):
+    assert isinstance(DummySession.cached(), DummySession)
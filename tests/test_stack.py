@@ -0,0 +1,92 @@
+"""Tests of rasterio.stack"""
+
+from affine import Affine
+import numpy as np
+import pytest
+
+import rasterio
+from rasterio.stack import open_stack
+from rasterio.windows import Window
+
+
+@pytest.fixture
+def stack_paths(tmp_path, path_rgb_byte_tif):
+    """Five copies of RGB.byte.tif, each offset by its index"""
+    paths = []
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        profile.update(tiled=True, blockxsize=256, blockysize=256)
+        data = src.read()
+    for i in range(5):
+        path = str(tmp_path.joinpath("day{}.tif".format(i)))
+        with rasterio.open(path, "w", **profile) as dst:
+            dst.write(data // 2 + i)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_stack_read(stack_paths, workers):
+    window = Window(100, 200, 64, 32)
+    with open_stack(stack_paths, workers=workers) as stack:
+        assert len(stack) == 5
+        assert stack.shape == (5, 3, 718, 791)
+        data = stack.read(window=window)
+    assert data.shape == (5, 3, 32, 64)
+    for i, path in enumerate(stack_paths):
+        with rasterio.open(path) as src:
+            assert (data[i] == src.read(window=window)).all()
+
+
+def test_stack_read_band(stack_paths):
+    with open_stack(stack_paths) as stack:
+        data = stack.read(window=Window(0, 0, 10, 10), indexes=2)
+    assert data.shape == (5, 10, 10)
+
+
+def test_stack_read_out(stack_paths):
+    out = np.zeros((5, 1, 10, 10), dtype="float32")
+    with open_stack(stack_paths) as stack:
+        data = stack.read(window=Window(300, 300, 10, 10), indexes=[1], out=out)
+        assert data is out
+        with pytest.raises(ValueError):
+            stack.read(window=Window(300, 300, 10, 11), indexes=[1], out=out)
+    assert out.any()
+
+
+def test_stack_read_masked(stack_paths):
+    with open_stack(stack_paths) as stack:
+        data = stack.read(window=Window(0, 0, 10, 10), masked=True)
+    assert isinstance(data, np.ma.MaskedArray)
+    # Corner pixels of the first dataset are nodata.
+    assert data.mask[0].all()
+    assert not data.mask[1:].any()
+
+
+def test_stack_iter_blocks(stack_paths):
+    with open_stack(stack_paths, workers=2) as stack:
+        blocks = list(stack.iter_blocks(indexes=1))
+        expected = stack.read(indexes=1)
+    assert len(blocks) == 12
+    for window, data in blocks:
+        assert data.shape == (5, window.height, window.width)
+        assert (data == expected[:, window.toslices()[0], window.toslices()[1]]).all()
+
+
+def test_stack_misaligned(stack_paths, path_rgb_byte_tif, tmp_path):
+    path = str(tmp_path.joinpath("shifted.tif"))
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        profile["transform"] = src.transform * Affine.translation(1, 0)
+        with rasterio.open(path, "w", **profile) as dst:
+            dst.write(src.read())
+    with pytest.raises(ValueError, match="Transform"):
+        open_stack(stack_paths + [path])
+
+
+def test_stack_closed(stack_paths):
+    stack = open_stack(stack_paths)
+    stack.close()
+    assert stack.closed
+    with pytest.raises(ValueError):
+        stack.read()
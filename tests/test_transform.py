@@ -18,6 +18,7 @@ from rasterio.transform import (
     GCPTransformer,
     RPCTransformer
 )
+from rasterio.enums import TransformDirection
 from rasterio.errors import TransformError
 from rasterio.windows import Window
 from rasterio.control import GroundControlPoint
@@ -377,4 +378,77 @@ def test_2421_rpc_height_ignored():
         x1, y1 = src.xy(0, 0, z=0, transform_method=transform_method)
         x2, y2 = src.xy(0, 0, z=2000, transform_method=transform_method)
         assert abs(x2 - x1) > 0
-        assert abs(y2 - y1) > 0
\ No newline at end of file
+        assert abs(y2 - y1) > 0
+
+@pytest.mark.parametrize('transform', [gcps(), rpcs()])
+def test_xy_approx_error(transform):
+    """Approximate coordinates are within the error of exact ones"""
+    rows, cols = numpy.mgrid[0:100:10, 0:7000:100]
+    rows = rows.ravel().tolist()
+    cols = cols.ravel().tolist()
+    xs, ys = xy(transform, rows, cols)
+    approx_xs, approx_ys = xy(transform, rows, cols, approx_error=1e-6)
+    assert numpy.allclose(approx_xs, xs, rtol=0, atol=1e-6)
+    assert numpy.allclose(approx_ys, ys, rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize('transform', [gcps(), rpcs()])
+def test_rowcol_approx_error(transform):
+    xs = numpy.linspace(-123.4, -122.9, 50).tolist()
+    ys = [49.2] * 50
+    rows, cols = rowcol(transform, xs, ys, op=float)
+    approx_rows, approx_cols = rowcol(transform, xs, ys, op=float, approx_error=0.125)
+    assert numpy.allclose(approx_rows, rows, rtol=0, atol=0.125)
+    assert numpy.allclose(approx_cols, cols, rtol=0, atol=0.125)
+
+
+@pytest.mark.parametrize('transformer_cls,transform', [(GCPTransformer, gcps()), (RPCTransformer, rpcs())])
+def test_transformer_approx_error_invalid(transformer_cls, transform):
+    with pytest.raises(ValueError):
+        transformer_cls(transform, approx_error=-1)
+
+
+def test_get_transformer_approx_error_affine():
+    """Affine transformers ignore approx_error"""
+    with get_transformer(Affine.identity(), approx_error=0.125)() as transformer:
+        assert transformer.xy(0, 0, offset='ul') == (0, 0)
+
+
+@pytest.mark.parametrize('transform', [Affine.identity(), gcps(), rpcs()])
+def test_transform_arrays(transform):
+    """Arrays of coordinates match the results of xy and rowcol"""
+    rows, cols = numpy.mgrid[0:20:5, 0:40:10]
+    with get_transformer(transform)() as transformer:
+        xs, ys, success = transformer.transform_arrays(cols + 0.5, rows + 0.5)
+        assert xs.shape == ys.shape == success.shape == (4, 4)
+        assert xs.dtype == ys.dtype == numpy.float64
+        assert success.all()
+        exp_xs, exp_ys = transformer.xy(rows.ravel().tolist(), cols.ravel().tolist())
+        assert numpy.allclose(xs.ravel(), exp_xs)
+        assert numpy.allclose(ys.ravel(), exp_ys)
+
+        new_cols, new_rows, success = transformer.transform_arrays(
+            xs, ys, transform_direction=TransformDirection.reverse)
+        assert success.all()
+        assert numpy.allclose(new_cols, cols + 0.5, atol=0.1)
+        assert numpy.allclose(new_rows, rows + 0.5, atol=0.1)
+
+
+@pytest.mark.parametrize('transformer_cls,transform', [(GCPTransformer, gcps()), (RPCTransformer, rpcs())])
+def test_transform_arrays_threads(transformer_cls, transform):
+    """Threads give the same results as a single thread"""
+    rows, cols = numpy.mgrid[0:11522:50, 0:7449:50]
+    with transformer_cls(transform) as transformer:
+        expected = transformer.transform_arrays(cols, rows)
+        result = transformer.transform_arrays(cols, rows, num_threads=4)
+    for arr, exp in zip(result, expected):
+        assert (arr == exp).all()
+
+
+@pytest.mark.parametrize('transformer_cls,transform', [(GCPTransformer, gcps()), (RPCTransformer, rpcs())])
+def test_transform_arrays_invalid(transformer_cls, transform):
+    with transformer_cls(transform) as transformer:
+        with pytest.raises(TransformError):
+            transformer.transform_arrays(numpy.zeros(2), numpy.zeros(3))
+        with pytest.raises(TransformError):
+            transformer.transform_arrays(["a"], ["b"])
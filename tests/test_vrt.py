@@ -1,7 +1,13 @@
 """Tests of the rasterio.vrt module"""
 
+import numpy as np
+import pytest
+
 import rasterio
 import rasterio.vrt
+from rasterio.enums import Resampling
+from rasterio.merge import merge
+from rasterio.windows import Window
 
 
 def test_boundless_vrt(path_rgb_byte_tif):
@@ -22,3 +28,89 @@ def test_boundless_msk_vrt(path_rgb_msk_byte_tif):
             assert msk.count == vrt.count
             assert msk.dtypes == vrt.dtypes
             assert msk.mask_flag_enums == vrt.mask_flag_enums
+
+
+@pytest.fixture
+def rgb_tiles(tmp_path, path_rgb_byte_tif):
+    """RGB.byte.tif split into left and right halves."""
+    paths = []
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        for i, window in enumerate([Window(0, 0, 400, 718), Window(400, 0, 391, 718)]):
+            profile.update(
+                width=window.width, height=window.height,
+                transform=src.window_transform(window))
+            path = str(tmp_path.joinpath("tile{}.tif".format(i)))
+            with rasterio.open(path, "w", **profile) as dst:
+                dst.write(src.read(window=window))
+            paths.append(path)
+    return paths
+
+
+def test_build_mosaic(rgb_tiles, path_rgb_byte_tif):
+    """A mosaic of tiles matches the whole."""
+    with rasterio.vrt.build_mosaic(rgb_tiles) as mosaic, rasterio.open(path_rgb_byte_tif) as src:
+        assert mosaic.driver == "VRT"
+        assert mosaic.count == src.count
+        assert mosaic.shape == src.shape
+        assert mosaic.transform.almost_equals(src.transform)
+        assert mosaic.crs == src.crs
+        assert mosaic.nodata == src.nodata
+        assert (mosaic.read() == src.read()).all()
+        window = Window(350, 300, 100, 100)
+        assert (mosaic.read(1, window=window) == src.read(1, window=window)).all()
+
+
+def test_build_mosaic_workers(rgb_tiles, path_rgb_byte_tif):
+    """Headers can be read by a pool of threads."""
+    with rasterio.vrt.build_mosaic(rgb_tiles, workers=2) as mosaic, rasterio.open(path_rgb_byte_tif) as src:
+        assert mosaic.shape == src.shape
+        assert (mosaic.read() == src.read()).all()
+
+
+def test_build_mosaic_datasets(rgb_tiles):
+    """Open datasets can be mosaicked."""
+    with rasterio.open(rgb_tiles[0]) as a, rasterio.open(rgb_tiles[1]) as b:
+        with rasterio.vrt.build_mosaic([a, b], indexes=[3]) as mosaic:
+            assert mosaic.count == 1
+            assert mosaic.shape == (718, 791)
+
+
+def test_build_mosaic_matches_merge(rgb_tiles):
+    data, transform = merge(rgb_tiles, indexes=[1])
+    with rasterio.vrt.build_mosaic(rgb_tiles, indexes=[1]) as mosaic:
+        assert mosaic.transform.almost_equals(transform)
+        assert (mosaic.read() == data).all()
+
+
+def test_build_mosaic_first(rgb_tiles, path_rgb_byte_tif):
+    """The first of overlapping datasets is read."""
+    with rasterio.open(rgb_tiles[0], "r+") as dst:
+        dst.write(np.full((3, 718, 400), 7, dtype="uint8"))
+    with rasterio.vrt.build_mosaic([rgb_tiles[0], path_rgb_byte_tif]) as mosaic:
+        assert mosaic.shape == (718, 791)
+        assert (mosaic.read(window=Window(0, 0, 400, 718)) == 7).all()
+        assert (mosaic.read(window=Window(400, 0, 391, 718)) != 7).any()
+
+
+def test_build_mosaic_empty():
+    with pytest.raises(ValueError):
+        rasterio.vrt.build_mosaic([])
+
+
+def test_build_mosaic_bad_resampling(rgb_tiles):
+    with pytest.raises(ValueError):
+        rasterio.vrt.build_mosaic(rgb_tiles, resampling=Resampling.max)
+
+
+def test_build_mosaic_mismatch(rgb_tiles, tmp_path):
+    """Datasets with different numbers of bands can't be mosaicked."""
+    with rasterio.open(rgb_tiles[1]) as src:
+        profile = src.profile
+        data = src.read(1)
+    profile.update(count=1)
+    path = str(tmp_path.joinpath("single.tif"))
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(data, 1)
+    with pytest.raises(ValueError, match="Count"):
+        rasterio.vrt.build_mosaic([rgb_tiles[0], path])
@@ -24,7 +24,9 @@ from rasterio.errors import (
     WarpOperationError,
 )
 from rasterio.warp import (
+    WarpPlan,
     reproject,
+    reproject_dataset,
     transform_geom,
     transform,
     transform_bounds,
@@ -231,6 +233,27 @@ def test_transform():
     assert np.allclose(np.array(UTM33_result), np.array(UTM33_points))
 
 
+def test_transform_ndarray():
+    """ndarrays in, float64 ndarrays of the same shape out."""
+    xs = np.array([[12.492269, 12.5], [12.6, 12.7]])
+    ys = np.full((2, 2), 41.890169)
+    res_xs, res_ys = transform("EPSG:4326", "EPSG:32633", xs, ys)
+    assert res_xs.dtype == np.float64
+    assert res_xs.shape == (2, 2)
+    assert np.allclose(res_xs[0, 0], 291952, atol=1)
+    assert xs[0, 0] == 12.492269
+
+
+def test_transform_threads():
+    """Inputs split between threads give the same result."""
+    xs = np.linspace(10.0, 14.0, 300000)
+    ys = np.full_like(xs, 41.890169)
+    expected = transform("EPSG:4326", "EPSG:32633", xs, ys)
+    result = transform("EPSG:4326", "EPSG:32633", xs, ys, num_threads=4)
+    assert np.array_equal(result[0], expected[0])
+    assert np.array_equal(result[1], expected[1])
+
+
 def test_transform_bounds():
     with rasterio.open("tests/data/RGB.byte.tif") as src:
         l, b, r, t = src.bounds
@@ -1735,6 +1758,16 @@ def test_empty_transform_inputs_length_z():
         rasterio.warp.transform("EPSG:3857", "EPSG:4326", [1, 2], [1, 2], zs=[0])
 
 
+def test_transform_inputs_shape():
+    """Inputs of the same length but different shapes are rejected."""
+    with pytest.raises(TransformError):
+        transform("EPSG:3857", "EPSG:4326", np.zeros((2, 3)), np.zeros((2, 2)))
+    with pytest.raises(TransformError):
+        transform(
+            "EPSG:3857", "EPSG:4326", np.zeros((2, 3)), np.zeros((2, 3)),
+            zs=np.zeros((2, 1)))
+
+
 def test_reproject_rpcs(caplog):
     """Reproject using rational polynomial coefficients for the source"""
     with rasterio.open('tests/data/RGB.byte.rpc.vrt') as src:
@@ -2071,3 +2104,128 @@ def test_issue2353bis(caplog):
     with rasterio.Env():
         transform_bounds("EPSG:6931", "EPSG:4326", *bounds)
         assert "Point outside of" in caplog.text
+
+
+def test_warp_plan():
+    """A plan's reprojections match reproject()"""
+    with rasterio.open("tests/data/RGB.byte.tif") as src:
+        source = src.read()
+
+    expected = np.zeros(source.shape, dtype=np.uint8)
+    reproject(
+        source, expected, src_transform=src.transform, src_crs=src.crs,
+        dst_transform=DST_TRANSFORM, dst_crs="EPSG:3857",
+        resampling=Resampling.nearest)
+
+    with WarpPlan(
+            src.shape, src.transform, src.crs, src.shape, DST_TRANSFORM,
+            "EPSG:3857") as plan:
+        for bidx in range(3):
+            out = np.zeros(src.shape, dtype=np.uint8)
+            assert plan.reproject(source[bidx], out) is out
+            assert (out == expected[bidx]).all()
+        out = np.zeros(source.shape, dtype=np.uint8)
+        plan.reproject(source, out)
+        assert (out == expected).all()
+    assert plan.closed
+
+
+def test_warp_plan_chunks():
+    """Results are about the same when the warp is split in chunks"""
+    with rasterio.open("tests/data/RGB.byte.tif") as src:
+        source = src.read()
+
+    with WarpPlan(
+            src.shape, src.transform, src.crs, src.shape, DST_TRANSFORM,
+            "EPSG:3857") as plan:
+        expected = np.zeros(source.shape, dtype=np.uint8)
+        plan.reproject(source, expected)
+
+    with WarpPlan(
+            src.shape, src.transform, src.crs, src.shape, DST_TRANSFORM,
+            "EPSG:3857", warp_mem_limit=1) as plan:
+        out = np.zeros(source.shape, dtype=np.uint8)
+        plan.reproject(source, out)
+
+    assert (out != expected).mean() < 0.001
+
+
+def test_warp_plan_shape_mismatch():
+    with WarpPlan(
+            (10, 10), Affine.identity(), "EPSG:4326", (10, 10),
+            Affine.identity(), "EPSG:4326") as plan:
+        with pytest.raises(ValueError):
+            plan.reproject(np.zeros((10, 11)), np.zeros((10, 10)))
+        with pytest.raises(ValueError):
+            plan.reproject(np.zeros((10, 10)), np.zeros((11, 10)))
+
+
+def test_warp_plan_closed():
+    plan = WarpPlan(
+        (10, 10), Affine.identity(), "EPSG:4326", (10, 10),
+        Affine.identity(), "EPSG:4326")
+    plan.close()
+    with pytest.raises(ValueError):
+        plan.reproject(np.zeros((10, 10)), np.zeros((10, 10)))
+
+
+def test_warp_plan_invalid_resampling():
+    with pytest.raises(ValueError):
+        WarpPlan(
+            (10, 10), Affine.identity(), "EPSG:4326", (10, 10),
+            Affine.identity(), "EPSG:4326", resampling=7)
+
+
+@pytest.mark.parametrize("workers,mode", [(1, "thread"), (2, "thread"), (2, "process")])
+def test_reproject_dataset(tmp_path, path_rgb_byte_tif, workers, mode):
+    """Tiled reprojection matches a reprojection of whole arrays"""
+    dst_path = str(tmp_path.joinpath("test.tif"))
+    reproject_dataset(
+        path_rgb_byte_tif, dst_path, dst_crs="EPSG:3857", tile_size=128,
+        workers=workers, mode=mode)
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        dst_transform, width, height = calculate_default_transform(
+            src.crs, "EPSG:3857", src.width, src.height, *src.bounds)
+        expected = np.zeros((src.count, height, width), dtype=np.uint8)
+        reproject(
+            rasterio.band(src, src.indexes), expected, dst_transform=dst_transform,
+            dst_crs="EPSG:3857")
+
+    with rasterio.open(dst_path) as dst:
+        assert dst.crs == CRS.from_epsg(3857)
+        assert dst.transform == dst_transform
+        assert dst.block_shapes[0] == (128, 128)
+        assert dst.nodata == 0
+        assert (dst.read() != expected).mean() < 0.001
+
+
+def test_reproject_dataset_indexes(tmp_path, path_rgb_byte_tif):
+    dst_path = str(tmp_path.joinpath("test.tif"))
+    with rasterio.open(path_rgb_byte_tif) as src:
+        reproject_dataset(src, dst_path, dst_crs="EPSG:4326", indexes=[2])
+    with rasterio.open(dst_path) as dst:
+        assert dst.count == 1
+
+
+def test_reproject_dataset_tile_source(path_cogeo_tif):
+    """Workers open sources with their driver and open options"""
+    from rasterio.warp import _TileSource
+
+    with rasterio.open(path_cogeo_tif, driver="GTiff", overview_level=1) as src:
+        tile_source = _TileSource(src)
+    assert tile_source.driver == "GTiff"
+    assert tile_source.options == {"overview_level": 1}
+
+    dataset = tile_source.open()
+    assert tile_source.open() is dataset
+    assert dataset.shape == (256, 256)
+    tile_source.close()
+    assert dataset.closed
+
+
+def test_reproject_dataset_invalid_mode(tmp_path, path_rgb_byte_tif):
+    with pytest.raises(ValueError):
+        reproject_dataset(
+            path_rgb_byte_tif, str(tmp_path.joinpath("test.tif")),
+            dst_crs="EPSG:3857", mode="fiber")
@@ -14,7 +14,9 @@ from rasterio.control import GroundControlPoint
 from rasterio.crs import CRS
 from rasterio.errors import CRSError
 from rasterio.transform import from_bounds
-from rasterio.warp import calculate_default_transform, transform_bounds
+from rasterio.warp import (
+    Transformer, calculate_default_transform, transform, transform_bounds,
+    transform_bounds_array, transform_geom)
 from tests.conftest import gdal_version
 
 log = logging.getLogger(__name__)
@@ -301,3 +303,75 @@ def test_gcps_rpcs_exclusivity():
 def test_rpcs_bounds_exclusivity():
     with pytest.raises(ValueError):
         calculate_default_transform('EPSG:4326', 'EPSG:32610', width=7449, height=11522, left=1, rpcs={'a':'123'})
+
+
+def test_transformer():
+    """A Transformer gives the same results as the module functions"""
+    with Transformer("EPSG:4326", "EPSG:32618") as transformer:
+        assert transformer.transform([-78.0], [40.0]) == transform(
+            "EPSG:4326", "EPSG:32618", [-78.0], [40.0])
+        assert transformer.transform_bounds(-78.0, 40.0, -77.0, 41.0) == transform_bounds(
+            "EPSG:4326", "EPSG:32618", -78.0, 40.0, -77.0, 41.0)
+        geom = {"type": "Point", "coordinates": (-78.0, 40.0)}
+        assert transformer.transform_geom(geom) == transform_geom(
+            "EPSG:4326", "EPSG:32618", geom)
+    assert transformer.closed
+
+
+def test_transformer_closed():
+    """A closed Transformer raises ValueError"""
+    transformer = Transformer("EPSG:4326", "EPSG:32618")
+    transformer.close()
+    with pytest.raises(ValueError):
+        transformer.transform([-78.0], [40.0])
+
+
+def test_transformer_invalid_crs():
+    with pytest.raises(CRSError):
+        Transformer("EPSG:4326", {"proj": "foobar"})
+
+
+def test_transformer_cache():
+    """Module functions reuse cached transformers"""
+    from rasterio.warp import _get_transformer
+    assert _get_transformer("EPSG:4326", "EPSG:3857") is _get_transformer(
+        CRS.from_epsg(4326), "EPSG:3857")
+
+
+def test_transformer_cache_config():
+    """Transformers made with other config options are not reused"""
+    from rasterio.warp import _get_transformer
+    with rasterio.Env():
+        transformer = _get_transformer("EPSG:4326", "EPSG:3857")
+        with rasterio.Env(CHECK_WITH_INVERT_PROJ=True):
+            other = _get_transformer("EPSG:4326", "EPSG:3857")
+            assert other is not transformer
+            assert _get_transformer("EPSG:4326", "EPSG:3857") is other
+        assert _get_transformer("EPSG:4326", "EPSG:3857") is transformer
+
+
+@pytest.mark.parametrize("src_crs,dst_crs,bounds", [
+    ("EPSG:4326", "EPSG:32618", [(-78.0, 40.0, -77.0, 41.0), (-76.0, 38.0, -75.5, 39.0)]),
+    ("EPSG:32618", "EPSG:4326", [(300000.0, 4400000.0, 400000.0, 4500000.0)]),
+    ("EPSG:4326", "EPSG:3031", [(-180.0, -90.0, 180.0, -60.0)]),
+    ("EPSG:32660", "EPSG:4326", [(500000.0, 4000000.0, 900000.0, 4500000.0)]),
+])
+def test_transform_bounds_array(src_crs, dst_crs, bounds):
+    """Batches of bounds match transform_bounds row by row"""
+    result = transform_bounds_array(src_crs, dst_crs, numpy.array(bounds))
+    assert result.shape == (len(bounds), 4)
+    for row, expected in zip(result, bounds):
+        assert numpy.allclose(row, transform_bounds(src_crs, dst_crs, *expected))
+
+
+def test_transform_bounds_array_same_crs():
+    bounds = numpy.array([[0.0, 0.0, 1.0, 1.0]])
+    result = transform_bounds_array("EPSG:4326", "EPSG:4326", bounds)
+    assert (result == bounds).all()
+    assert result is not bounds
+
+
+@pytest.mark.parametrize("bounds", [numpy.zeros((2, 3)), numpy.zeros(4)])
+def test_transform_bounds_array_shape(bounds):
+    with pytest.raises(ValueError):
+        transform_bounds_array("EPSG:4326", "EPSG:32618", bounds)